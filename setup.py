@@ -45,6 +45,15 @@ setup(
             "isort>=5.12.0",
             "pre-commit>=3.0.0",
         ],
+        "speedups": [
+            "orjson>=3.8.0",
+            "msgpack>=1.0.0",
+            "ijson>=3.1",
+            "blake3>=0.3",
+            "numpy>=1.21",
+            "numba>=0.57",
+            "uvloop>=0.19; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -438,9 +438,46 @@ class ContextPersistenceManager:
         Returns:
             HistoryEntry: History entry
         """
-        entry_id = str(uuid.uuid4())
-        entry = HistoryEntry(
-            entry_id=entry_id,
+        entry = self._new_history_entry(
+            action_type, action_description, parameters, result, user_context, rollback_data
+        )
+        
+        self.data["history"].append(asdict(entry))
+        self._save_data()
+        
+        logger.debug(f"History entry added: {action_type} - {action_description}")
+        return entry
+    
+    def add_history_entries(self, entries: List[Dict[str, Any]]) -> List[HistoryEntry]:
+        """
+        Add several history entries with a single save
+        
+        Args:
+            entries: Keyword arguments of add_history_entry, one dict per entry
+            
+        Returns:
+            List: History entries, in the given order
+        """
+        added = [self._new_history_entry(**fields) for fields in entries]
+        
+        self.data["history"].extend(asdict(entry) for entry in added)
+        self._save_data()
+        
+        logger.debug(f"{len(added)} history entries added")
+        return added
+    
+    def _new_history_entry(
+        self,
+        action_type: str,
+        action_description: str,
+        parameters: Dict[str, Any],
+        result: Dict[str, Any],
+        user_context: str = "",
+        rollback_data: Dict[str, Any] = None
+    ) -> HistoryEntry:
+        """Create a history entry without storing it"""
+        return HistoryEntry(
+            entry_id=str(uuid.uuid4()),
             timestamp=datetime.now(),
             action_type=action_type,
             action_description=action_description,
@@ -449,12 +486,6 @@ class ContextPersistenceManager:
             user_context=user_context,
             rollback_data=rollback_data or {}
         )
-        
-        self.data["history"].append(asdict(entry))
-        self._save_data()
-        
-        logger.debug(f"History entry added: {action_type} - {action_description}")
-        return entry
     
     def get_design_history(
         self,
@@ -5,6 +5,18 @@ Fusion360 Plugin Module
 Contains Fusion360 plugin and communication client
 """
 
-from .client import Fusion360PluginClient
+# Plugin commands that leave the design unchanged. Defined before the client
+# import, which reads it. addin.py (installed into Fusion on its own) and
+# mcp_server.py (which cannot import this package) keep copies;
+# tests/unit/test_fusion360_addin.py checks that they match this one.
+READ_ONLY_COMMANDS = frozenset({
+    'ping', 'get_design_info', 'get_component_hierarchy', 'get_sketches', 'get_features',
+    'get_assembly_info', 'check_interference', 'measure_distance', 'measure_area',
+    'measure_angle', 'measure_volume', 'calculate_mass_properties',
+    'perform_stress_analysis', 'perform_modal_analysis', 'perform_thermal_analysis',
+    'generate_analysis_report'
+})
 
-__all__ = ['Fusion360PluginClient']
+from .client import Fusion360PluginClient, CommandBatch
+
+__all__ = ['READ_ONLY_COMMANDS', 'Fusion360PluginClient', 'CommandBatch']
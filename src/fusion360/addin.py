@@ -12,10 +12,39 @@ import adsk.fusion
 import adsk.cam
 import traceback
 import json
+import math
 import threading
 import socket
+import struct
 import time
-from typing import Dict, Any, Optional
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+# Fusion's bundled Python does not ship NumPy; use it when the user has
+# installed it alongside the add-in, otherwise fall back to plain loops
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
 
 # Global variables - Fixed version
@@ -24,6 +53,413 @@ ui = None
 handlers = []
 mcp_server = None
 
+# Joint motion constructors, resolved once at import
+_JOINT_MOTION_FACTORY = {
+    'rigid': adsk.fusion.RigidJointMotion.create,
+    'revolute': adsk.fusion.RevoluteJointMotion.create,
+    'slider': adsk.fusion.SliderJointMotion.create,
+    'cylindrical': adsk.fusion.CylindricalJointMotion.create,
+    'ball': adsk.fusion.BallJointMotion.create
+}
+_JOINT_DEFAULT = _JOINT_MOTION_FACTORY['rigid']
+
+
+class _FusionConstants:
+    """Fusion API enums and constructors the handlers use, resolved once
+
+    Every adsk.* chain is several module/class attribute lookups across the
+    Python/C++ boundary; binding them here turns each use into a single
+    slot read on _K.
+    """
+    __slots__ = (
+        'DESIGN', 'PARAMETRIC',
+        'NEW', 'JOIN', 'CUT', 'INTERSECT',
+        'VALUE', 'POINT', 'VECTOR', 'PLANE', 'COLLECTION', 'MATRIX',
+        'SPACING', 'JOINT_POINT'
+    )
+
+    def __init__(self):
+        self.DESIGN = adsk.fusion.Design
+        self.PARAMETRIC = adsk.fusion.DesignTypes.ParametricDesignType
+        operations = adsk.fusion.FeatureOperations
+        self.NEW = operations.NewBodyFeatureOperation
+        self.JOIN = operations.JoinFeatureOperation
+        self.CUT = operations.CutFeatureOperation
+        self.INTERSECT = operations.IntersectFeatureOperation
+        self.VALUE = adsk.core.ValueInput.createByReal
+        self.POINT = adsk.core.Point3D.create
+        self.VECTOR = adsk.core.Vector3D.create
+        self.PLANE = adsk.core.Plane.create
+        self.COLLECTION = adsk.core.ObjectCollection.create
+        # Fusion may keep a reference to the transform it is given, so a
+        # fresh identity matrix is built per call; only the constructor is cached
+        self.MATRIX = adsk.core.Matrix3D.create
+        self.SPACING = adsk.fusion.PatternDistanceType.SpacingPatternDistanceType
+        self.JOINT_POINT = adsk.fusion.JointGeometry.createByPoint
+
+
+_K = _FusionConstants()
+
+# Handler results are plain dicts that are only serialized here, at the
+# socket edge; json.dumps with keyword options would build a new encoder
+# for every response, so one shared encoder is reused instead
+_encode_response = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _aabb_pairs_broadcast(mins, maxs, tolerance: float):
+    """Return (i, j) index pairs, i < j, whose (N, 3) boxes overlap within tolerance"""
+    overlap = (((maxs[:, None, :] + tolerance) >= mins[None, :, :]) &
+               ((mins[:, None, :] - tolerance) <= maxs[None, :, :])).all(axis=2)
+    count = len(mins)
+    overlap &= np.triu(np.ones((count, count), dtype=bool), k=1)
+    return np.argwhere(overlap)
+
+
+def _is_point_batch(value) -> bool:
+    """True when a point parameter is a list of [x, y, z] rows rather than one point"""
+    return isinstance(value, (list, tuple)) and bool(value) and isinstance(value[0], (list, tuple))
+
+
+def _distances_batch(points1, points2):
+    """Distances between paired rows of two (N, 3) point lists"""
+    if NUMPY_AVAILABLE:
+        delta = np.asarray(points2, dtype=np.float64) - np.asarray(points1, dtype=np.float64)
+        return np.sqrt(np.einsum('ij,ij->i', delta, delta)).tolist()
+    
+    return [math.sqrt((b[0] - a[0])**2 + (b[1] - a[1])**2 + (b[2] - a[2])**2)
+            for a, b in zip(points1, points2)]
+
+
+def _angles_batch(points1, vertices, points2):
+    """Angles in radians at each vertex; vertices is one point or one per row
+
+    Returns None when any arm has zero length.
+    """
+    if NUMPY_AVAILABLE:
+        vertex = np.asarray(vertices, dtype=np.float64)
+        vec1 = np.asarray(points1, dtype=np.float64) - vertex
+        vec2 = np.asarray(points2, dtype=np.float64) - vertex
+        lengths = np.linalg.norm(vec1, axis=1) * np.linalg.norm(vec2, axis=1)
+        if not lengths.all():
+            return None
+        cos_angle = np.einsum('ij,ij->i', vec1, vec2) / lengths
+        return np.arccos(np.clip(cos_angle, -1.0, 1.0)).tolist()
+    
+    if not _is_point_batch(vertices):
+        vertices = [vertices] * len(points1)
+    angles = []
+    for p1, v, p2 in zip(points1, vertices, points2):
+        ax, ay, az = p1[0] - v[0], p1[1] - v[1], p1[2] - v[2]
+        bx, by, bz = p2[0] - v[0], p2[1] - v[1], p2[2] - v[2]
+        lengths = math.sqrt(ax*ax + ay*ay + az*az) * math.sqrt(bx*bx + by*by + bz*bz)
+        if lengths == 0:
+            return None
+        angles.append(math.acos(max(-1.0, min(1.0, (ax*bx + ay*by + az*bz) / lengths))))
+    return angles
+
+
+def _valid_point_rows(*batches) -> bool:
+    """Check that every batch is a list of 3-value rows and all have the same length"""
+    count = len(batches[0])
+    return all(
+        isinstance(rows, (list, tuple)) and len(rows) == count and
+        all(isinstance(row, (list, tuple)) and len(row) == 3 for row in rows)
+        for rows in batches
+    )
+
+
+# Typical assemblies have a handful of bodies; below this count a plain
+# pair loop beats both NumPy setup and sorting
+_SMALL_MIN_BODIES = 16
+
+
+def _aabb_pairs_small(mins, maxs, tolerance: float):
+    """Brute-force pair test for a few bodies, rejecting one axis at a time"""
+    count = len(mins)
+    pairs = []
+    for i in range(count):
+        lx, ly, lz = mins[i]
+        hx, hy, hz = maxs[i]
+        lx -= tolerance
+        ly -= tolerance
+        lz -= tolerance
+        hx += tolerance
+        hy += tolerance
+        hz += tolerance
+        for j in range(i + 1, count):
+            min_j = mins[j]
+            max_j = maxs[j]
+            if min_j[0] > hx or max_j[0] < lx:
+                continue
+            if min_j[1] > hy or max_j[1] < ly:
+                continue
+            if min_j[2] > hz or max_j[2] < lz:
+                continue
+            pairs.append((i, j))
+    return pairs
+
+
+# Below this body count the O(N^2) broadcast is cheaper than sorting
+_SWEEP_MIN_BODIES = 32
+
+
+def _aabb_pairs_sweep(mins, maxs, tolerance: float):
+    """Sort-and-sweep broad phase over per-body (x, y, z) min/max rows
+
+    Bodies are visited in order of min x; each one is only compared with
+    the bodies that start before it ends on x, so disjoint pairs are never
+    tested. Returns sorted (i, j) pairs with i < j.
+    """
+    order = sorted(range(len(mins)), key=lambda k: mins[k][0])
+    count = len(order)
+    pairs = []
+    for pos in range(count):
+        i = order[pos]
+        min_i = mins[i]
+        max_i = maxs[i]
+        x_limit = max_i[0] + tolerance
+        for nxt in range(pos + 1, count):
+            j = order[nxt]
+            min_j = mins[j]
+            if min_j[0] > x_limit:
+                break
+            max_j = maxs[j]
+            if (max_i[1] + tolerance >= min_j[1] and min_i[1] - tolerance <= max_j[1] and
+                    max_i[2] + tolerance >= min_j[2] and min_i[2] - tolerance <= max_j[2]):
+                pairs.append((i, j) if i < j else (j, i))
+    pairs.sort()
+    return pairs
+
+
+# Above this body count the sweep is handed to the compiled kernel. It is
+# compiled for the argument types of the first such check (or loaded from
+# numba's on-disk cache), so loading the add-in never waits on the JIT.
+_NUMBA_MIN_BODIES = 256
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _aabb_sweep_kernel(mins, maxs, order, tolerance):
+        """Parallel sort-and-sweep over x-sorted body indices, returns (K, 2) pairs
+
+        Runs the sweep twice, first counting each body's pairs and then
+        writing them at prefix-summed offsets, so no (N, N) temporary or
+        shared append is needed. Boxes are gathered into x-sorted order
+        first so the inner loop reads memory sequentially, and each axis
+        test rejects early, which LLVM lowers to packed compares.
+        """
+        count = order.shape[0]
+        lo = mins[order]
+        hi = maxs[order]
+        counts = np.zeros(count, dtype=np.int64)
+        for pos in prange(count):
+            hx = hi[pos, 0] + tolerance
+            ly = lo[pos, 1] - tolerance
+            hy = hi[pos, 1] + tolerance
+            lz = lo[pos, 2] - tolerance
+            hz = hi[pos, 2] + tolerance
+            found = 0
+            for nxt in range(pos + 1, count):
+                if lo[nxt, 0] > hx:
+                    break
+                if lo[nxt, 1] > hy or hi[nxt, 1] < ly:
+                    continue
+                if lo[nxt, 2] > hz or hi[nxt, 2] < lz:
+                    continue
+                found += 1
+            counts[pos] = found
+        
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        pairs = np.empty((offsets[count], 2), dtype=np.int64)
+        for pos in prange(count):
+            hx = hi[pos, 0] + tolerance
+            ly = lo[pos, 1] - tolerance
+            hy = hi[pos, 1] + tolerance
+            lz = lo[pos, 2] - tolerance
+            hz = hi[pos, 2] + tolerance
+            i = order[pos]
+            slot = offsets[pos]
+            for nxt in range(pos + 1, count):
+                if lo[nxt, 0] > hx:
+                    break
+                if lo[nxt, 1] > hy or hi[nxt, 1] < ly:
+                    continue
+                if lo[nxt, 2] > hz or hi[nxt, 2] < lz:
+                    continue
+                j = order[nxt]
+                pairs[slot, 0] = min(i, j)
+                pairs[slot, 1] = max(i, j)
+                slot += 1
+        return pairs
+
+
+def _aabb_pairs_numba(mins, maxs, tolerance: float):
+    """Numba sort-and-sweep over (N, 3) arrays; same output as _aabb_pairs_sweep"""
+    order = np.argsort(mins[:, 0], kind='stable')
+    pairs = _aabb_sweep_kernel(mins, maxs, order, tolerance)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))].tolist()
+
+
+# Every message on the socket, in both directions, is a 4-byte big-endian
+# payload length and a 1-byte content type, followed by the payload.
+# Responses use the content type of the request they answer.
+_FRAME_HEADER = struct.Struct('!IB')
+CONTENT_JSON = 0x01
+CONTENT_MSGPACK = 0x02
+
+# Largest request payload accepted; a bigger length prefix means the stream
+# is out of sync or the peer is not a plugin client, so the frame is not
+# buffered (the header allows up to 4 GiB)
+_MAX_REQUEST_SIZE = 64 * 1024 * 1024
+
+
+def _recv_exact(sock, size: int) -> Optional[bytearray]:
+    """Read exactly size bytes, or return None if the peer closes first"""
+    # The frame size is known up front, so receive straight into one
+    # preallocated buffer instead of concatenating chunks
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], min(65536, size - received))
+        if not count:
+            return None
+        received += count
+    return buffer
+
+
+def _send_frame(sock, message: Any, content_type: int = CONTENT_JSON):
+    """Encode message in the given content type and send it as one frame"""
+    if content_type == CONTENT_MSGPACK:
+        payload = msgpack.packb(message, use_bin_type=True)
+    else:
+        payload = _encode_response(message).encode('utf-8')
+    header = _FRAME_HEADER.pack(len(payload), content_type)
+    if hasattr(sock, 'sendmsg'):
+        # Gather-write header and payload instead of copying a possibly
+        # large payload just to prepend five bytes
+        _sendmsg_all(sock, [memoryview(header), memoryview(payload)])
+    else:
+        # Windows sockets have no sendmsg
+        sock.sendall(header + payload)
+
+
+def _sendmsg_all(sock, views: List[memoryview]):
+    """sendall() for several buffers: retry partial gather writes until all is sent"""
+    while views:
+        sent = sock.sendmsg(views)
+        while sent:
+            if sent >= views[0].nbytes:
+                sent -= views.pop(0).nbytes
+            else:
+                views[0] = views[0][sent:]
+                sent = 0
+
+
+if MSGSPEC_AVAILABLE:
+    class _CommandParams(msgspec.Struct):
+        """Typed command parameters; get() lets handlers treat it like the params dict"""
+        
+        def get(self, key, default=None):
+            return getattr(self, key, default)
+    
+    # Points are a single [x, y, z] or a list of them (batch), so only the
+    # outer list type is checked here; the handlers validate the shape
+    class _MeasureDistanceParams(_CommandParams):
+        point1: list = msgspec.field(default_factory=lambda: [0, 0, 0])
+        point2: list = msgspec.field(default_factory=lambda: [0, 0, 0])
+    
+    class _MeasureAngleParams(_CommandParams):
+        point1: list = msgspec.field(default_factory=lambda: [1, 0, 0])
+        vertex: list = msgspec.field(default_factory=lambda: [0, 0, 0])
+        point2: list = msgspec.field(default_factory=lambda: [0, 1, 0])
+    
+    # params and batch stay undecoded until the command is known; an empty
+    # Raw means the key was absent
+    class _RequestEnvelope(msgspec.Struct):
+        id: Optional[int] = None
+        command: Optional[str] = None
+        cmd: Optional[str] = None
+        params: msgspec.Raw = msgspec.Raw()
+        batch: msgspec.Raw = msgspec.Raw()
+    
+    # High-rate commands whose params are decoded straight from the wire
+    # into a typed struct, skipping the intermediate dict
+    _PARAM_STRUCTS = {
+        'measure_distance': msgspec.json.Decoder(_MeasureDistanceParams).decode,
+        'measure_angle': msgspec.json.Decoder(_MeasureAngleParams).decode,
+    }
+    _decode_envelope = msgspec.json.Decoder(_RequestEnvelope).decode
+
+# Errors raised for a malformed request frame
+# Frames that cannot be decoded at all end the connection; a well-formed
+# frame whose fields fail typed validation gets an ordinary error response
+_REQUEST_DECODE_ERRORS = (json.JSONDecodeError,)
+_REQUEST_VALIDATION_ERRORS = ()
+if MSGSPEC_AVAILABLE:
+    # ValidationError subclasses DecodeError, so it is caught first
+    _REQUEST_DECODE_ERRORS += (msgspec.DecodeError,)
+    _REQUEST_VALIDATION_ERRORS += (msgspec.ValidationError,)
+
+
+def _frame_request_id(data: bytes) -> Any:
+    """The id of a well-formed request frame that failed validation, if any"""
+    try:
+        request = json.loads(data)
+    except ValueError:
+        return None
+    return request.get('id') if isinstance(request, dict) else None
+
+
+def _decode_request(data: bytes) -> Dict[str, Any]:
+    """Parse one request frame into {"command": ..., "params": ...}
+    
+    With msgspec, the params of commands in _PARAM_STRUCTS are decoded and
+    type-checked in one step; everything else becomes a plain dict.
+    """
+    if not MSGSPEC_AVAILABLE:
+        return json.loads(data)
+    
+    envelope = _decode_envelope(data)
+    if len(envelope.batch):
+        return {"id": envelope.id, "batch": json.loads(bytes(envelope.batch))}
+    # "cmd" is the alias _process_request also accepts
+    command = envelope.command or envelope.cmd
+    raw = bytes(envelope.params)
+    if not raw or raw == b'null':
+        raw = b'{}'
+    decode_typed = _PARAM_STRUCTS.get(command)
+    if decode_typed is not None:
+        params = decode_typed(raw)
+    else:
+        params = json.loads(raw)
+    return {"id": envelope.id, "command": command, "params": params}
+
+
+# Commands that never modify the design; any other command invalidates
+# the cached body volumes and face areas. The add-in is installed as this
+# one file, so it keeps a copy of fusion360.READ_ONLY_COMMANDS (checked
+# equal by the unit tests)
+_READ_ONLY_COMMANDS = frozenset({
+    'ping', 'get_design_info', 'get_component_hierarchy', 'get_sketches', 'get_features',
+    'get_assembly_info', 'check_interference', 'measure_distance', 'measure_area',
+    'measure_angle', 'measure_volume', 'calculate_mass_properties',
+    'perform_stress_analysis', 'perform_modal_analysis', 'perform_thermal_analysis',
+    'generate_analysis_report'
+})
+
+# Command name -> MCPCommunicationServer method, filled in by @_register
+# while the class body executes
+_COMMAND_HANDLERS: Dict[str, Any] = {}
+
+
+def _register(command: str):
+    """Register a server method as the handler for a plugin command"""
+    def decorator(func):
+        _COMMAND_HANDLERS[command] = func
+        return func
+    return decorator
+
 
 class MCPCommunicationServer:
     """MCP Communication Server
@@ -37,6 +473,31 @@ class MCPCommunicationServer:
         self.server_socket = None
         self.running = False
         self.client_connections = []
+        # Bind every registered handler to this instance once, so dispatch
+        # is a single dict lookup plus call
+        self._handlers = {
+            command: func.__get__(self, type(self))
+            for command, func in _COMMAND_HANDLERS.items()
+        }
+        # Root component of the active design; cleared by the document
+        # event handler registered in run()
+        self._root_comp = None
+        # entityToken -> body volume / face area, valid until the design changes
+        self._volume_cache: Dict[str, float] = {}
+        self._area_cache: Dict[str, float] = {}
+        # Each client connection has its own thread; requests run one at a
+        # time so handlers never reach the Fusion API (or the caches above)
+        # from two threads at once
+        self._request_lock = threading.Lock()
+        # Fusion's event handlers invalidate the caches from the UI thread,
+        # possibly while a request is computing a value to cache. Each
+        # invalidation bumps a generation under _cache_lock, and a value is
+        # only stored if its generation has not moved since it was read.
+        # The lock is held for dict updates only, never across a Fusion
+        # API call, so an event handler never waits on a request.
+        self._cache_lock = threading.Lock()
+        self._design_generation = 0
+        self._geometry_generation = 0
         
     def start(self):
         """Start communication server"""
@@ -105,28 +566,64 @@ class MCPCommunicationServer:
             while True:
                 # Receive data with timeout and error handling
                 client_socket.settimeout(30.0)  # 30 second timeout
-                data = client_socket.recv(4096)
+                header = _recv_exact(client_socket, _FRAME_HEADER.size)
+                if header is None:
+                    break
                 
-                if not data:
+                length, content_type = _FRAME_HEADER.unpack(header)
+                if length > _MAX_REQUEST_SIZE:
+                    _send_frame(client_socket, {
+                        "error": f"Request of {length} bytes exceeds the {_MAX_REQUEST_SIZE} byte limit"
+                    })
                     break
+                data = _recv_exact(client_socket, length)
+                if data is None:
+                    break
+                
+                if content_type == CONTENT_MSGPACK and not MSGPACK_AVAILABLE:
+                    # Tell the client to fall back to JSON for this connection
+                    _send_frame(client_socket, {
+                        "error": "MessagePack is not available in the Fusion 360 add-in",
+                        "unsupported_content_type": CONTENT_MSGPACK
+                    })
+                    continue
                 
                 try:
-                    # Parse JSON request
-                    request = json.loads(data.decode('utf-8'))
+                    # Parse request
+                    if content_type == CONTENT_MSGPACK:
+                        request = msgpack.unpackb(data, raw=False)
+                    else:
+                        request = _decode_request(data)
                     
                     # Process request
-                    response = self._process_request(request)
+                    with self._request_lock:
+                        response = self._process_request(request)
+                    
+                    # Echo the request id so clients can match responses
+                    request_id = request.get('id') if isinstance(request, dict) else None
+                    if request_id is not None:
+                        response["id"] = request_id
                     
                     # Send response
-                    response_data = json.dumps(response, ensure_ascii=False).encode('utf-8')
-                    client_socket.send(response_data)
+                    _send_frame(client_socket, response, content_type)
+                    
+                except _REQUEST_VALIDATION_ERRORS as e:
+                    # Well-formed frame with a mistyped field; the framing is
+                    # intact, so answer it and keep the connection
+                    error_response = {"error": f"Invalid request: {str(e)}"}
+                    request_id = _frame_request_id(data)
+                    if request_id is not None:
+                        error_response["id"] = request_id
+                    try:
+                        _send_frame(client_socket, error_response, content_type)
+                    except:
+                        pass
                     
-                except json.JSONDecodeError as e:
+                except _REQUEST_DECODE_ERRORS as e:
                     # JSON parse error
                     error_response = {"error": f"JSON parse error: {str(e)}"}
-                    response_data = json.dumps(error_response).encode('utf-8')
                     try:
-                        client_socket.send(response_data)
+                        _send_frame(client_socket, error_response)
                     except:
                         pass  # Ignore if send fails
                     break
@@ -134,9 +631,8 @@ class MCPCommunicationServer:
                 except Exception as e:
                     # Other processing errors
                     error_response = {"error": f"Request processing error: {str(e)}"}
-                    response_data = json.dumps(error_response).encode('utf-8')
                     try:
-                        client_socket.send(response_data)
+                        _send_frame(client_socket, error_response, content_type)
                     except:
                         pass
                     # Don't break, continue processing next request
@@ -157,60 +653,118 @@ class MCPCommunicationServer:
     def _process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process MCP request - Enhanced error handling"""
         try:
-            command = request.get('command')
+            # A batch is a list of ordinary requests answered in one response;
+            # every entry runs even if an earlier one fails. An entry's
+            # cmd_id is copied onto its result so callers can match them up.
+            batch = request.get('batch')
+            if batch is not None:
+                if not isinstance(batch, list):
+                    return {"error": "batch must be a list of requests"}
+                results = []
+                for item in batch:
+                    result = self._process_request(item)
+                    if isinstance(item, dict) and 'cmd_id' in item:
+                        result = {**result, "cmd_id": item['cmd_id']}
+                    results.append(result)
+                return {"results": results}
+            
+            # "cmd" is accepted as an alias, for batch entries shaped
+            # {"cmd_id", "cmd", "params"}
+            command = request.get('command') or request.get('cmd')
             params = request.get('params', {})
             
             if not command:
                 return {"error": "Missing command parameter"}
             
+            handler = self._handlers.get(command)
+            if handler is None:
+                return {"error": f"Unknown command: {command}"}
+            
+            if command not in _READ_ONLY_COMMANDS:
+                self.invalidate_geometry_cache()
+            
             # Wrap each command with try-catch to prevent single command crash from affecting entire plugin
             try:
-                if command == 'get_design_info':
-                    return self._get_design_info()
-                elif command == 'get_component_hierarchy':
-                    return self._get_component_hierarchy()
-                elif command == 'create_sketch':
-                    return self._create_sketch(params)
-                elif command == 'create_rectangle':
-                    return self._create_rectangle(params)
-                elif command == 'create_circle':
-                    return self._create_circle(params)
-                elif command == 'create_extrude':
-                    return self._create_extrude(params)
-                elif command == 'get_sketches':
-                    return self._get_sketches()
-                elif command == 'get_features':
-                    return self._get_features()
-                elif command == 'draw_line':
-                    return self._draw_line(params)
-                elif command == 'draw_arc':
-                    return self._draw_arc(params)
-                elif command == 'draw_polygon':
-                    return self._draw_polygon(params)
-                else:
-                    return {"error": f"Unknown command: {command}"}
-                    
+                return handler(params)
+
             except Exception as cmd_error:
-                # Command execution error, return error info but don't crash
+                # Handlers only catch Fusion API RuntimeErrors; anything else
+                # (a bug or bad parameter type) lands here instead of crashing
                 return {"error": f"Command '{command}' execution failed: {str(cmd_error)}"}
                 
         except Exception as e:
             # Fundamental request processing error
             return {"error": f"Request processing failed: {str(e)}"}
     
-    def _get_design_info(self) -> Dict[str, Any]:
+    def _get_root_comp(self):
+        """Return the active design's root component, or None if the product is not a design
+        
+        The lookup crosses the Fusion API three times, so the result is kept
+        until the active document changes.
+        """
+        root_comp = self._root_comp
+        if root_comp is None:
+            generation = self._design_generation
+            design = app.activeProduct
+            if not isinstance(design, _K.DESIGN):
+                return None
+            root_comp = design.rootComponent
+            with self._cache_lock:
+                if generation == self._design_generation:
+                    self._root_comp = root_comp
+        return root_comp
+    
+    def invalidate_design_cache(self):
+        """Forget the cached root component (active document changed or closed)"""
+        with self._cache_lock:
+            self._design_generation += 1
+            self._root_comp = None
+        self.invalidate_geometry_cache()
+    
+    def invalidate_geometry_cache(self):
+        """Forget cached volumes and areas (the design may have been edited)"""
+        with self._cache_lock:
+            self._geometry_generation += 1
+            self._volume_cache.clear()
+            self._area_cache.clear()
+    
+    def _cached_property(self, cache: Dict[str, float], entity, name: str) -> float:
+        """entity.<name>, cached per entityToken unless invalidated meanwhile"""
+        token = entity.entityToken
+        value = cache.get(token)
+        if value is None:
+            generation = self._geometry_generation
+            value = getattr(entity, name)
+            with self._cache_lock:
+                if generation == self._geometry_generation:
+                    cache[token] = value
+        return value
+    
+    def _body_volume(self, body) -> float:
+        """body.volume, computed by Fusion once per body until the design changes"""
+        return self._cached_property(self._volume_cache, body, 'volume')
+    
+    def _face_area(self, face) -> float:
+        """face.area, computed by Fusion once per face until the design changes"""
+        return self._cached_property(self._area_cache, face, 'area')
+    
+    @_register('ping')
+    def _ping(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Answer without touching the Fusion API; lets clients check a connection"""
+        return {"success": True}
+    
+    @_register('get_design_info')
+    def _get_design_info(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get current design information"""
         global app
         try:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            if not product:
-                return {"error": "No active product"}
-            
-            design = adsk.fusion.Design.cast(product)
+            design = app.activeProduct
             if not design:
+                return {"error": "No active product"}
+            if not isinstance(design, _K.DESIGN):
                 return {"error": "Current product is not a design"}
             
             root_comp = design.rootComponent
@@ -236,27 +790,25 @@ class MCPCommunicationServer:
                     "materials": design.materials.count,
                     "parameters": design.userParameters.count,
                     "units": design.fusionUnitsManager.defaultLengthUnits,
-                    "isParametric": design.designType == adsk.fusion.DesignTypes.ParametricDesignType
+                    "isParametric": design.designType == _K.PARAMETRIC
                 }
             }
             
-        except Exception as e:
-            return {"error": f"Failed to get design info: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to get design info", "detail": e.args[0] if e.args else None}
     
-    def _get_component_hierarchy(self) -> Dict[str, Any]:
+    @_register('get_component_hierarchy')
+    def _get_component_hierarchy(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get component hierarchy"""
         global app
         try:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            if not design:
+            root_comp = self._get_root_comp()
+            if root_comp is None:
                 return {"error": "Current product is not a design"}
             
-            root_comp = design.rootComponent
-            
             def build_component_tree(component, level=0):
                 comp_info = {
                     "name": component.name,
@@ -268,8 +820,7 @@ class MCPCommunicationServer:
                     "children": []
                 }
                 
-                for i in range(component.occurrences.count):
-                    occurrence = component.occurrences.item(i)
+                for occurrence in component.occurrences:
                     child_info = build_component_tree(occurrence.component, level + 1)
                     comp_info["children"].append(child_info)
                 
@@ -281,9 +832,10 @@ class MCPCommunicationServer:
                 "root_component": hierarchy
             }
             
-        except Exception as e:
-            return {"error": f"Failed to get component hierarchy: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to get component hierarchy", "detail": e.args[0] if e.args else None}
     
+    @_register('create_sketch')
     def _create_sketch(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create sketch"""
         global app
@@ -291,13 +843,10 @@ class MCPCommunicationServer:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            if not design:
+            root_comp = self._get_root_comp()
+            if root_comp is None:
                 return {"error": "Current product is not a design"}
             
-            root_comp = design.rootComponent
-            
             # Get sketch plane
             plane_name = params.get('plane', 'XY')
             if plane_name == 'XY':
@@ -325,9 +874,10 @@ class MCPCommunicationServer:
                 "plane": plane_name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create sketch: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create sketch", "detail": e.args[0] if e.args else None}
     
+    @_register('create_rectangle')
     def _create_rectangle(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create rectangle in sketch"""
         global app
@@ -340,16 +890,11 @@ class MCPCommunicationServer:
                 return {"error": "Sketch name not specified"}
             
             # Get sketch
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            sketch = None
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
-                if s.name == sketch_name:
-                    sketch = s
-                    break
+            sketch = root_comp.sketches.itemByName(sketch_name)
             
             if not sketch:
                 return {"error": f"Sketch not found: {sketch_name}"}
@@ -361,8 +906,8 @@ class MCPCommunicationServer:
             center_y = params.get('center_y', 0.0)
             
             # Create rectangle corner points
-            point1 = adsk.core.Point3D.create(center_x - width/2, center_y - height/2, 0)
-            point2 = adsk.core.Point3D.create(center_x + width/2, center_y + height/2, 0)
+            point1 = _K.POINT(center_x - width/2, center_y - height/2, 0)
+            point2 = _K.POINT(center_x + width/2, center_y + height/2, 0)
             
             # Create rectangle
             rect = sketch.sketchCurves.sketchLines.addTwoPointRectangle(point1, point2)
@@ -376,9 +921,10 @@ class MCPCommunicationServer:
                 "center": [center_x, center_y]
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create rectangle: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create rectangle", "detail": e.args[0] if e.args else None}
     
+    @_register('create_circle')
     def _create_circle(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create circle in sketch"""
         global app
@@ -391,16 +937,11 @@ class MCPCommunicationServer:
                 return {"error": "Sketch name not specified"}
             
             # Get sketch
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            sketch = None
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
-                if s.name == sketch_name:
-                    sketch = s
-                    break
+            sketch = root_comp.sketches.itemByName(sketch_name)
             
             if not sketch:
                 return {"error": f"Sketch not found: {sketch_name}"}
@@ -411,7 +952,7 @@ class MCPCommunicationServer:
             center_y = params.get('center_y', 0.0)
             
             # Create center point
-            center_point = adsk.core.Point3D.create(center_x, center_y, 0)
+            center_point = _K.POINT(center_x, center_y, 0)
             
             # Create circle
             circle = sketch.sketchCurves.sketchCircles.addByCenterRadius(center_point, radius)
@@ -424,9 +965,10 @@ class MCPCommunicationServer:
                 "center": [center_x, center_y]
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create circle: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create circle", "detail": e.args[0] if e.args else None}
     
+    @_register('create_extrude')
     def _create_extrude(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create extrude feature"""
         global app
@@ -439,21 +981,17 @@ class MCPCommunicationServer:
                 return {"error": "Sketch name not specified"}
             
             # Get sketch
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            sketch = None
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
-                if s.name == sketch_name:
-                    sketch = s
-                    break
+            sketch = root_comp.sketches.itemByName(sketch_name)
             
             if not sketch:
                 return {"error": f"Sketch not found: {sketch_name}"}
             
-            if sketch.profiles.count == 0:
+            sketch_profiles = sketch.profiles
+            if sketch_profiles.count == 0:
                 return {"error": "No extrudable profiles in sketch"}
             
             # Get extrude parameters
@@ -462,23 +1000,23 @@ class MCPCommunicationServer:
             
             # Set extrude operation type
             if operation == 'new':
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             elif operation == 'join':
-                operation_type = adsk.fusion.FeatureOperations.JoinFeatureOperation
+                operation_type = _K.JOIN
             elif operation == 'cut':
-                operation_type = adsk.fusion.FeatureOperations.CutFeatureOperation
+                operation_type = _K.CUT
             elif operation == 'intersect':
-                operation_type = adsk.fusion.FeatureOperations.IntersectFeatureOperation
+                operation_type = _K.INTERSECT
             else:
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             
             # Create extrude input
-            profile = sketch.profiles.item(0)  # Use first profile
+            profile = sketch_profiles.item(0)  # Use first profile
             extrudes = root_comp.features.extrudeFeatures
             extrude_input = extrudes.createInput(profile, operation_type)
             
             # Set extrude distance
-            distance_input = adsk.core.ValueInput.createByReal(distance)
+            distance_input = _K.VALUE(distance)
             extrude_input.setDistanceExtent(False, distance_input)
             
             # Execute extrude
@@ -493,26 +1031,23 @@ class MCPCommunicationServer:
                 "feature_name": extrude_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create extrude: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create extrude", "detail": e.args[0] if e.args else None}
     
-    def _get_sketches(self) -> Dict[str, Any]:
+    @_register('get_sketches')
+    def _get_sketches(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get all sketches information"""
         global app
         try:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            if not design:
+            root_comp = self._get_root_comp()
+            if root_comp is None:
                 return {"error": "Current product is not a design"}
-            
-            root_comp = design.rootComponent
             sketches = []
             
-            for i in range(root_comp.sketches.count):
-                sketch = root_comp.sketches.item(i)
+            for sketch in root_comp.sketches:
                 sketch_info = {
                     "name": sketch.name,
                     "isVisible": sketch.isVisible,
@@ -527,27 +1062,26 @@ class MCPCommunicationServer:
                 "total_count": len(sketches)
             }
             
-        except Exception as e:
-            return {"error": f"Failed to get sketch info: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to get sketch info", "detail": e.args[0] if e.args else None}
     
-    def _get_features(self) -> Dict[str, Any]:
+    @_register('get_features')
+    def _get_features(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get all features information"""
         global app
         try:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            if not design:
+            root_comp = self._get_root_comp()
+            if root_comp is None:
                 return {"error": "Current product is not a design"}
-            
-            root_comp = design.rootComponent
+            root_features = root_comp.features
             features = []
             
             # Extrude features - Fix isVisible property access
-            for i in range(root_comp.features.extrudeFeatures.count):
-                feature = root_comp.features.extrudeFeatures.item(i)
+            extrude_features = root_features.extrudeFeatures
+            for i, feature in enumerate(extrude_features):
                 feature_info = {
                     "name": feature.name if feature.name else f"Extrude{i+1}",
                     "type": "extrude",
@@ -561,8 +1095,8 @@ class MCPCommunicationServer:
                 features.append(feature_info)
             
             # Revolve features
-            for i in range(root_comp.features.revolveFeatures.count):
-                feature = root_comp.features.revolveFeatures.item(i)
+            revolve_features = root_features.revolveFeatures
+            for i, feature in enumerate(revolve_features):
                 feature_info = {
                     "name": feature.name if feature.name else f"Revolve{i+1}",
                     "type": "revolve",
@@ -580,13 +1114,14 @@ class MCPCommunicationServer:
                 "total_count": len(features)
             }
             
-        except Exception as e:
-            return {"error": f"Failed to get features info: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to get features info", "detail": e.args[0] if e.args else None}
 
     # =====================================================
     # Sketch Drawing Methods
     # =====================================================
     
+    @_register('draw_line')
     def _draw_line(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Draw line in sketch"""
         global app
@@ -599,16 +1134,11 @@ class MCPCommunicationServer:
                 return {"error": "Sketch name not specified"}
             
             # Get sketch
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            sketch = None
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
-                if s.name == sketch_name:
-                    sketch = s
-                    break
+            sketch = root_comp.sketches.itemByName(sketch_name)
             
             if not sketch:
                 return {"error": f"Sketch not found: {sketch_name}"}
@@ -620,8 +1150,8 @@ class MCPCommunicationServer:
             end_y = params.get('end_y', 10.0)
             
             # Create start and end points
-            start_point = adsk.core.Point3D.create(start_x, start_y, 0)
-            end_point = adsk.core.Point3D.create(end_x, end_y, 0)
+            start_point = _K.POINT(start_x, start_y, 0)
+            end_point = _K.POINT(end_x, end_y, 0)
             
             # Draw line
             line = sketch.sketchCurves.sketchLines.addByTwoPoints(start_point, end_point)
@@ -635,9 +1165,10 @@ class MCPCommunicationServer:
                 "length": line.length
             }
             
-        except Exception as e:
-            return {"error": f"Failed to draw line: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to draw line", "detail": e.args[0] if e.args else None}
     
+    @_register('draw_arc')
     def _draw_arc(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Draw arc in sketch"""
         global app
@@ -650,16 +1181,11 @@ class MCPCommunicationServer:
                 return {"error": "Sketch name not specified"}
             
             # Get sketch
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            sketch = None
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
-                if s.name == sketch_name:
-                    sketch = s
-                    break
+            sketch = root_comp.sketches.itemByName(sketch_name)
             
             if not sketch:
                 return {"error": f"Sketch not found: {sketch_name}"}
@@ -671,10 +1197,8 @@ class MCPCommunicationServer:
             start_angle = params.get('start_angle', 0.0)
             end_angle = params.get('end_angle', 1.57)  # 90 degrees
             
-            import math
-            
             # Create center point
-            center_point = adsk.core.Point3D.create(center_x, center_y, 0)
+            center_point = _K.POINT(center_x, center_y, 0)
             
             # Calculate start and end points
             start_x = center_x + radius * math.cos(start_angle)
@@ -682,8 +1206,8 @@ class MCPCommunicationServer:
             end_x = center_x + radius * math.cos(end_angle)
             end_y = center_y + radius * math.sin(end_angle)
             
-            start_point = adsk.core.Point3D.create(start_x, start_y, 0)
-            end_point = adsk.core.Point3D.create(end_x, end_y, 0)
+            start_point = _K.POINT(start_x, start_y, 0)
+            end_point = _K.POINT(end_x, end_y, 0)
             
             # Draw arc
             arc = sketch.sketchCurves.sketchArcs.addByCenterStartEnd(center_point, start_point, end_point)
@@ -698,9 +1222,10 @@ class MCPCommunicationServer:
                 "end_angle": end_angle
             }
             
-        except Exception as e:
-            return {"error": f"Failed to draw arc: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to draw arc", "detail": e.args[0] if e.args else None}
     
+    @_register('draw_polygon')
     def _draw_polygon(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Draw regular polygon in sketch"""
         global app
@@ -713,16 +1238,11 @@ class MCPCommunicationServer:
                 return {"error": "Sketch name not specified"}
             
             # Get sketch
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            sketch = None
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
-                if s.name == sketch_name:
-                    sketch = s
-                    break
+            sketch = root_comp.sketches.itemByName(sketch_name)
             
             if not sketch:
                 return {"error": f"Sketch not found: {sketch_name}"}
@@ -736,8 +1256,6 @@ class MCPCommunicationServer:
             if sides < 3:
                 return {"error": "Polygon must have at least 3 sides"}
             
-            import math
-            
             # Calculate polygon vertices
             points = []
             lines = []
@@ -746,7 +1264,7 @@ class MCPCommunicationServer:
                 angle = 2 * math.pi * i / sides
                 x = center_x + radius * math.cos(angle)
                 y = center_y + radius * math.sin(angle)
-                points.append(adsk.core.Point3D.create(x, y, 0))
+                points.append(_K.POINT(x, y, 0))
             
             # Draw polygon edges
             lines_collection = sketch.sketchCurves.sketchLines
@@ -766,13 +1284,15 @@ class MCPCommunicationServer:
                 "lines_count": len(lines)
             }
             
-        except Exception as e:
-            return {"error": f"Failed to draw polygon: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to draw polygon", "detail": e.args[0] if e.args else None}
     
+    @_register('add_geometric_constraint')
     def _add_geometric_constraint(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add geometric constraint"""
         return {"error": "Geometric constraint feature not fully implemented, requires specific geometric entity references"}
     
+    @_register('add_dimensional_constraint')
     def _add_dimensional_constraint(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add dimensional constraint"""
         return {"error": "Dimensional constraint feature not fully implemented, requires specific geometric entity references"}
@@ -781,6 +1301,14 @@ class MCPCommunicationServer:
     # 3D Modeling Methods
     # =====================================================
     
+    def _sketches_by_name(self, root_comp) -> Dict[str, Any]:
+        """Index root component sketches by name (first match wins)"""
+        index = {}
+        for sketch in root_comp.sketches:
+            index.setdefault(sketch.name, sketch)
+        return index
+    
+    @_register('create_revolve')
     def _create_revolve(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create revolve feature"""
         global app
@@ -793,21 +1321,17 @@ class MCPCommunicationServer:
                 return {"error": "Sketch name not specified"}
             
             # Get sketch
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            sketch = None
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
-                if s.name == sketch_name:
-                    sketch = s
-                    break
+            sketch = root_comp.sketches.itemByName(sketch_name)
             
             if not sketch:
                 return {"error": f"Sketch not found: {sketch_name}"}
             
-            if sketch.profiles.count == 0:
+            sketch_profiles = sketch.profiles
+            if sketch_profiles.count == 0:
                 return {"error": "No revolvable profiles in sketch"}
             
             # Get revolve parameters
@@ -816,21 +1340,21 @@ class MCPCommunicationServer:
             
             # Set revolve operation type
             if operation == 'new':
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             elif operation == 'join':
-                operation_type = adsk.fusion.FeatureOperations.JoinFeatureOperation
+                operation_type = _K.JOIN
             elif operation == 'cut':
-                operation_type = adsk.fusion.FeatureOperations.CutFeatureOperation
+                operation_type = _K.CUT
             else:
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             
             # Create revolve input
-            profile = sketch.profiles.item(0)
+            profile = sketch_profiles.item(0)
             revolves = root_comp.features.revolveFeatures
             revolve_input = revolves.createInput(profile, sketch.referencePlane.geometry, operation_type)
             
             # Set revolve angle
-            angle_input = adsk.core.ValueInput.createByReal(angle)
+            angle_input = _K.VALUE(angle)
             revolve_input.setAngleExtent(False, angle_input)
             
             # Execute revolve
@@ -845,9 +1369,10 @@ class MCPCommunicationServer:
                 "feature_name": revolve_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create revolve: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create revolve", "detail": e.args[0] if e.args else None}
     
+    @_register('create_sweep')
     def _create_sweep(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create sweep feature"""
         global app
@@ -861,16 +1386,15 @@ class MCPCommunicationServer:
             if not profile_sketch_name or not path_sketch_name:
                 return {"error": "Must specify both profile sketch and path sketch"}
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
             # Get profile and path sketches
             profile_sketch = None
             path_sketch = None
             
-            for i in range(root_comp.sketches.count):
-                s = root_comp.sketches.item(i)
+            for s in root_comp.sketches:
                 if s.name == profile_sketch_name:
                     profile_sketch = s
                 elif s.name == path_sketch_name:
@@ -881,25 +1405,27 @@ class MCPCommunicationServer:
             if not path_sketch:
                 return {"error": f"Path sketch not found: {path_sketch_name}"}
             
-            if profile_sketch.profiles.count == 0:
+            sketch_profiles = profile_sketch.profiles
+            if sketch_profiles.count == 0:
                 return {"error": "No profiles in profile sketch"}
-            if path_sketch.sketchCurves.count == 0:
+            path_curves = path_sketch.sketchCurves
+            if path_curves.count == 0:
                 return {"error": "No curves in path sketch"}
             
             # Set operation type
             operation = params.get('operation', 'new')
             if operation == 'new':
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             elif operation == 'join':
-                operation_type = adsk.fusion.FeatureOperations.JoinFeatureOperation
+                operation_type = _K.JOIN
             elif operation == 'cut':
-                operation_type = adsk.fusion.FeatureOperations.CutFeatureOperation
+                operation_type = _K.CUT
             else:
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             
             # Create sweep feature
             sweeps = root_comp.features.sweepFeatures
-            sweep_input = sweeps.createInput(profile_sketch.profiles.item(0), path_sketch.sketchCurves.item(0), operation_type)
+            sweep_input = sweeps.createInput(sketch_profiles.item(0), path_curves.item(0), operation_type)
             
             # Execute sweep
             sweep_feature = sweeps.add(sweep_input)
@@ -913,9 +1439,10 @@ class MCPCommunicationServer:
                 "feature_name": sweep_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create sweep: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create sweep", "detail": e.args[0] if e.args else None}
     
+    @_register('create_loft')
     def _create_loft(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create loft feature"""
         global app
@@ -927,45 +1454,43 @@ class MCPCommunicationServer:
             if len(profile_sketch_names) < 2:
                 return {"error": "Loft requires at least 2 profile sketches"}
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
             # Get all profile sketches
+            sketches_by_name = self._sketches_by_name(root_comp)
             profiles = []
             for sketch_name in profile_sketch_names:
-                sketch = None
-                for i in range(root_comp.sketches.count):
-                    s = root_comp.sketches.item(i)
-                    if s.name == sketch_name:
-                        sketch = s
-                        break
+                sketch = sketches_by_name.get(sketch_name)
                 
                 if not sketch:
                     return {"error": f"Sketch not found: {sketch_name}"}
-                if sketch.profiles.count == 0:
+                sketch_profiles = sketch.profiles
+                if sketch_profiles.count == 0:
                     return {"error": f"No profiles in sketch {sketch_name}"}
                 
-                profiles.append(sketch.profiles.item(0))
+                profiles.append(sketch_profiles.item(0))
             
             # Set operation type
             operation = params.get('operation', 'new')
             if operation == 'new':
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             elif operation == 'join':
-                operation_type = adsk.fusion.FeatureOperations.JoinFeatureOperation
+                operation_type = _K.JOIN
             elif operation == 'cut':
-                operation_type = adsk.fusion.FeatureOperations.CutFeatureOperation
+                operation_type = _K.CUT
             else:
-                operation_type = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+                operation_type = _K.NEW
             
             # Create loft feature
             lofts = root_comp.features.loftFeatures
             loft_input = lofts.createInput(operation_type)
             
             # Add profiles
+            add_section = loft_input.loftSections.add
             for profile in profiles:
-                loft_input.loftSections.add(profile)
+                add_section(profile)
             
             # Execute loft
             loft_feature = lofts.add(loft_input)
@@ -978,9 +1503,10 @@ class MCPCommunicationServer:
                 "feature_name": loft_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create loft: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create loft", "detail": e.args[0] if e.args else None}
     
+    @_register('create_fillet')
     def _create_fillet(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create fillet feature"""
         global app
@@ -990,29 +1516,32 @@ class MCPCommunicationServer:
                 
             radius = params.get('radius', 1.0)
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            bodies = root_comp.bRepBodies
+            features = root_comp.features
             
             # Get first body's edges (simplified implementation)
-            if root_comp.bRepBodies.count == 0:
+            if bodies.count == 0:
                 return {"error": "No bodies available for filleting"}
             
-            body = root_comp.bRepBodies.item(0)
-            if body.edges.count == 0:
+            body = bodies.item(0)
+            body_edges = body.edges
+            if body_edges.count == 0:
                 return {"error": "Body has no edges to fillet"}
             
             # Create fillet input
-            fillets = root_comp.features.filletFeatures
+            fillets = features.filletFeatures
             fillet_input = fillets.createInput()
             
             # Add edges (select first few edges as example)
-            edge_count = min(4, body.edges.count)  # Select at most 4 edges
-            edges = adsk.core.ObjectCollection.create()
+            edge_count = min(4, body_edges.count)  # Select at most 4 edges
+            edges = _K.COLLECTION()
             for i in range(edge_count):
-                edges.add(body.edges.item(i))
+                edges.add(body_edges.item(i))
             
-            fillet_input.addConstantRadiusEdgeSet(edges, adsk.core.ValueInput.createByReal(radius), True)
+            fillet_input.addConstantRadiusEdgeSet(edges, _K.VALUE(radius), True)
             
             # Execute fillet
             fillet_feature = fillets.add(fillet_input)
@@ -1025,9 +1554,10 @@ class MCPCommunicationServer:
                 "feature_name": fillet_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create fillet: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create fillet", "detail": e.args[0] if e.args else None}
     
+    @_register('create_chamfer')
     def _create_chamfer(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create chamfer feature"""
         global app
@@ -1037,29 +1567,32 @@ class MCPCommunicationServer:
                 
             distance = params.get('distance', 1.0)
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            bodies = root_comp.bRepBodies
+            features = root_comp.features
             
             # Get first body's edges
-            if root_comp.bRepBodies.count == 0:
+            if bodies.count == 0:
                 return {"error": "No bodies available for chamfering"}
             
-            body = root_comp.bRepBodies.item(0)
-            if body.edges.count == 0:
+            body = bodies.item(0)
+            body_edges = body.edges
+            if body_edges.count == 0:
                 return {"error": "Body has no edges to chamfer"}
             
             # Create chamfer input
-            chamfers = root_comp.features.chamferFeatures
+            chamfers = features.chamferFeatures
             chamfer_input = chamfers.createInput()
             
             # Add edges
-            edge_count = min(2, body.edges.count)  # Select at most 2 edges
-            edges = adsk.core.ObjectCollection.create()
+            edge_count = min(2, body_edges.count)  # Select at most 2 edges
+            edges = _K.COLLECTION()
             for i in range(edge_count):
-                edges.add(body.edges.item(i))
+                edges.add(body_edges.item(i))
             
-            chamfer_input.addEqualDistanceEdgeSet(edges, adsk.core.ValueInput.createByReal(distance), True)
+            chamfer_input.addEqualDistanceEdgeSet(edges, _K.VALUE(distance), True)
             
             # Execute chamfer
             chamfer_feature = chamfers.add(chamfer_input)
@@ -1072,9 +1605,10 @@ class MCPCommunicationServer:
                 "feature_name": chamfer_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create chamfer: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create chamfer", "detail": e.args[0] if e.args else None}
     
+    @_register('create_shell')
     def _create_shell(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create shell feature"""
         global app
@@ -1084,27 +1618,29 @@ class MCPCommunicationServer:
                 
             thickness = params.get('thickness', 1.0)
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            bodies = root_comp.bRepBodies
+            features = root_comp.features
             
             # Get first body
-            if root_comp.bRepBodies.count == 0:
+            if bodies.count == 0:
                 return {"error": "No bodies available for shelling"}
             
-            body = root_comp.bRepBodies.item(0)
+            body = bodies.item(0)
             if body.faces.count == 0:
                 return {"error": "Body has no faces to remove"}
             
             # Create shell input
-            shells = root_comp.features.shellFeatures
+            shells = features.shellFeatures
             shell_input = shells.createInput(body)
             
             # Set thickness
-            shell_input.insideThickness = adsk.core.ValueInput.createByReal(thickness)
+            shell_input.insideThickness = _K.VALUE(thickness)
             
             # Remove top face (first face)
-            faces_to_remove = adsk.core.ObjectCollection.create()
+            faces_to_remove = _K.COLLECTION()
             faces_to_remove.add(body.faces.item(0))
             shell_input.facesToRemove = faces_to_remove
             
@@ -1119,9 +1655,10 @@ class MCPCommunicationServer:
                 "feature_name": shell_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create shell: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create shell", "detail": e.args[0] if e.args else None}
     
+    @_register('boolean_operation')
     def _boolean_operation(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Boolean operation"""
         global app
@@ -1131,31 +1668,33 @@ class MCPCommunicationServer:
                 
             operation = params.get('operation', 'union')
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            bodies = root_comp.bRepBodies
+            features = root_comp.features
             
             # Need at least 2 bodies for boolean operation
-            if root_comp.bRepBodies.count < 2:
+            if bodies.count < 2:
                 return {"error": "Boolean operation requires at least 2 bodies"}
             
-            target_body = root_comp.bRepBodies.item(0)
-            tool_body = root_comp.bRepBodies.item(1)
+            target_body = bodies.item(0)
+            tool_body = bodies.item(1)
             
             # Create combine input
-            combines = root_comp.features.combineFeatures
-            combine_input = combines.createInput(target_body, adsk.core.ObjectCollection.create())
+            combines = features.combineFeatures
+            combine_input = combines.createInput(target_body, _K.COLLECTION())
             combine_input.toolBodies.add(tool_body)
             
             # Set operation type
             if operation == 'union':
-                combine_input.operation = adsk.fusion.FeatureOperations.JoinFeatureOperation
+                combine_input.operation = _K.JOIN
             elif operation == 'subtract':
-                combine_input.operation = adsk.fusion.FeatureOperations.CutFeatureOperation
+                combine_input.operation = _K.CUT
             elif operation == 'intersect':
-                combine_input.operation = adsk.fusion.FeatureOperations.IntersectFeatureOperation
+                combine_input.operation = _K.INTERSECT
             else:
-                combine_input.operation = adsk.fusion.FeatureOperations.JoinFeatureOperation
+                combine_input.operation = _K.JOIN
             
             # Execute boolean operation
             combine_feature = combines.add(combine_input)
@@ -1169,9 +1708,10 @@ class MCPCommunicationServer:
                 "feature_name": combine_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Boolean operation failed: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Boolean operation failed", "detail": e.args[0] if e.args else None}
     
+    @_register('split_body')
     def _split_body(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Split body"""
         global app
@@ -1179,21 +1719,23 @@ class MCPCommunicationServer:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            bodies = root_comp.bRepBodies
+            features = root_comp.features
             
             # Need body and splitting tool
-            if root_comp.bRepBodies.count < 1:
+            if bodies.count < 1:
                 return {"error": "No bodies to split"}
             
-            body_to_split = root_comp.bRepBodies.item(0)
+            body_to_split = bodies.item(0)
             
             # Use construction plane as splitting tool (simplified implementation)
             splitting_tool = root_comp.xYConstructionPlane
             
             # Create split input
-            splits = root_comp.features.splitBodyFeatures
+            splits = features.splitBodyFeatures
             split_input = splits.createInput(body_to_split, splitting_tool, True)
             
             # Execute split
@@ -1207,9 +1749,10 @@ class MCPCommunicationServer:
                 "feature_name": split_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to split body: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to split body", "detail": e.args[0] if e.args else None}
     
+    @_register('create_pattern_rectangular')
     def _create_pattern_rectangular(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create rectangular pattern"""
         global app
@@ -1222,32 +1765,34 @@ class MCPCommunicationServer:
             distance1 = params.get('distance1', 10.0)
             distance2 = params.get('distance2', 10.0)
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            features = root_comp.features
             
             # Need at least one feature to pattern
-            if root_comp.features.count == 0:
+            feature_count = features.count
+            if feature_count == 0:
                 return {"error": "No features available to pattern"}
             
             # Get last feature
-            last_feature = root_comp.features.item(root_comp.features.count - 1)
+            last_feature = features.item(feature_count - 1)
             
             # Create rectangular pattern input
-            rect_patterns = root_comp.features.rectangularPatternFeatures
-            rect_input = rect_patterns.createInput(adsk.core.ObjectCollection.create(),
+            rect_patterns = features.rectangularPatternFeatures
+            rect_input = rect_patterns.createInput(_K.COLLECTION(),
                                                   root_comp.xConstructionAxis,
-                                                  adsk.core.ValueInput.createByReal(quantity1),
-                                                  adsk.core.ValueInput.createByReal(distance1),
-                                                  adsk.fusion.PatternDistanceType.SpacingPatternDistanceType)
+                                                  _K.VALUE(quantity1),
+                                                  _K.VALUE(distance1),
+                                                  _K.SPACING)
             
             # Add feature
             rect_input.inputEntities.add(last_feature)
             
             # Set second direction
             rect_input.setDirectionTwo(root_comp.yConstructionAxis,
-                                     adsk.core.ValueInput.createByReal(quantity2),
-                                     adsk.core.ValueInput.createByReal(distance2))
+                                     _K.VALUE(quantity2),
+                                     _K.VALUE(distance2))
             
             # Execute pattern
             rect_pattern = rect_patterns.add(rect_input)
@@ -1262,9 +1807,10 @@ class MCPCommunicationServer:
                 "feature_name": rect_pattern.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create rectangular pattern: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create rectangular pattern", "detail": e.args[0] if e.args else None}
     
+    @_register('create_pattern_circular')
     def _create_pattern_circular(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create circular pattern"""
         global app
@@ -1275,28 +1821,30 @@ class MCPCommunicationServer:
             quantity = params.get('quantity', 6)
             angle = params.get('angle', 6.28)  # 360 degrees
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            features = root_comp.features
             
             # Need at least one feature to pattern
-            if root_comp.features.count == 0:
+            feature_count = features.count
+            if feature_count == 0:
                 return {"error": "No features available to pattern"}
             
             # Get last feature
-            last_feature = root_comp.features.item(root_comp.features.count - 1)
+            last_feature = features.item(feature_count - 1)
             
             # Create circular pattern input
-            circ_patterns = root_comp.features.circularPatternFeatures
-            circ_input = circ_patterns.createInput(adsk.core.ObjectCollection.create(),
+            circ_patterns = features.circularPatternFeatures
+            circ_input = circ_patterns.createInput(_K.COLLECTION(),
                                                   root_comp.zConstructionAxis)
             
             # Add feature
             circ_input.inputEntities.add(last_feature)
             
             # Set pattern parameters
-            circ_input.quantity = adsk.core.ValueInput.createByReal(quantity)
-            circ_input.totalAngle = adsk.core.ValueInput.createByReal(angle)
+            circ_input.quantity = _K.VALUE(quantity)
+            circ_input.totalAngle = _K.VALUE(angle)
             
             # Execute pattern
             circ_pattern = circ_patterns.add(circ_input)
@@ -1309,9 +1857,10 @@ class MCPCommunicationServer:
                 "feature_name": circ_pattern.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create circular pattern: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create circular pattern", "detail": e.args[0] if e.args else None}
     
+    @_register('create_mirror')
     def _create_mirror(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create mirror feature"""
         global app
@@ -1319,20 +1868,22 @@ class MCPCommunicationServer:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
+            features = root_comp.features
             
             # Need at least one feature to mirror
-            if root_comp.features.count == 0:
+            feature_count = features.count
+            if feature_count == 0:
                 return {"error": "No features available to mirror"}
             
             # Get last feature
-            last_feature = root_comp.features.item(root_comp.features.count - 1)
+            last_feature = features.item(feature_count - 1)
             
             # Create mirror input
-            mirrors = root_comp.features.mirrorFeatures
-            mirror_input = mirrors.createInput(adsk.core.ObjectCollection.create(),
+            mirrors = features.mirrorFeatures
+            mirror_input = mirrors.createInput(_K.COLLECTION(),
                                               root_comp.yZConstructionPlane)
             
             # Add feature
@@ -1348,13 +1899,14 @@ class MCPCommunicationServer:
                 "feature_name": mirror_feature.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create mirror: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create mirror", "detail": e.args[0] if e.args else None}
 
     # =====================================================
     # Assembly Methods
     # =====================================================
     
+    @_register('create_component')
     def _create_component(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create component"""
         global app
@@ -1362,16 +1914,13 @@ class MCPCommunicationServer:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            if not design:
+            root_comp = self._get_root_comp()
+            if root_comp is None:
                 return {"error": "Current product is not a design"}
-            
-            root_comp = design.rootComponent
             name = params.get('name', 'New Component')
             
             # Create new component
-            new_comp = root_comp.occurrences.addNewComponent(adsk.core.Matrix3D.create())
+            new_comp = root_comp.occurrences.addNewComponent(_K.MATRIX())
             new_comp.component.name = name
             
             return {
@@ -1380,9 +1929,10 @@ class MCPCommunicationServer:
                 "component_id": new_comp.entityToken
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create component: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create component", "detail": e.args[0] if e.args else None}
     
+    @_register('insert_component_from_file')
     def _insert_component_from_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Insert component from file"""
         global app
@@ -1394,12 +1944,18 @@ class MCPCommunicationServer:
             if not file_path:
                 return {"error": "File path not specified"}
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            # Create transform matrix
-            transform = adsk.core.Matrix3D.create()
+            # Create transform matrix; transform_matrix holds its 16 cells
+            # in row-major order
+            transform = _K.MATRIX()
+            transform_matrix = params.get('transform_matrix')
+            if transform_matrix is not None:
+                if len(transform_matrix) != 16 or not transform.setWithArray(
+                        [float(cell) for cell in transform_matrix]):
+                    return {"error": "transform_matrix must be 16 numbers (a 4x4 matrix, row-major)"}
             
             # Insert component
             occurrence = root_comp.occurrences.addByInsert(file_path, transform, True)
@@ -1411,13 +1967,15 @@ class MCPCommunicationServer:
                 "component_inserted": True
             }
             
-        except Exception as e:
-            return {"error": f"Failed to insert component from file: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to insert component from file", "detail": e.args[0] if e.args else None}
     
-    def _get_assembly_info(self) -> Dict[str, Any]:
+    @_register('get_assembly_info')
+    def _get_assembly_info(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get assembly information"""
         return self._get_component_hierarchy()
     
+    @_register('create_mate_constraint')
     def _create_mate_constraint(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create mate constraint"""
         global app
@@ -1427,9 +1985,9 @@ class MCPCommunicationServer:
                 
             constraint_type = params.get('constraint_type', 'rigid')
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
             # Need at least 2 components
             if root_comp.occurrences.count < 2:
@@ -1444,14 +2002,7 @@ class MCPCommunicationServer:
             joint_input = joints.createInput(occ1, occ2)
             
             # Set joint type
-            if constraint_type == 'rigid':
-                joint_input.jointMotion = adsk.fusion.RigidJointMotion.create()
-            elif constraint_type == 'revolute':
-                joint_input.jointMotion = adsk.fusion.RevoluteJointMotion.create()
-            elif constraint_type == 'slider':
-                joint_input.jointMotion = adsk.fusion.SliderJointMotion.create()
-            else:
-                joint_input.jointMotion = adsk.fusion.RigidJointMotion.create()
+            joint_input.jointMotion = _JOINT_MOTION_FACTORY.get(constraint_type, _JOINT_DEFAULT)()
             
             # Create joint
             joint = joints.add(joint_input)
@@ -1465,9 +2016,10 @@ class MCPCommunicationServer:
                 "joint_name": joint.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create mate constraint: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create mate constraint", "detail": e.args[0] if e.args else None}
     
+    @_register('create_joint')
     def _create_joint(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create joint"""
         global app
@@ -1477,9 +2029,9 @@ class MCPCommunicationServer:
                 
             joint_type = params.get('joint_type', 'rigid')
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
             # Need at least 2 components
             if root_comp.occurrences.count < 2:
@@ -1494,23 +2046,12 @@ class MCPCommunicationServer:
             joint_input = joints.createInput(occ1, occ2)
             
             # Set joint geometry
-            joint_geometry = adsk.fusion.JointGeometry.createByPoint(adsk.core.Point3D.create(0, 0, 0))
+            joint_geometry = _K.JOINT_POINT(_K.POINT(0, 0, 0))
             joint_input.geometryOrOriginOne = joint_geometry
             joint_input.geometryOrOriginTwo = joint_geometry
             
             # Set joint type
-            if joint_type == 'rigid':
-                joint_input.jointMotion = adsk.fusion.RigidJointMotion.create()
-            elif joint_type == 'revolute':
-                joint_input.jointMotion = adsk.fusion.RevoluteJointMotion.create()
-            elif joint_type == 'slider':
-                joint_input.jointMotion = adsk.fusion.SliderJointMotion.create()
-            elif joint_type == 'cylindrical':
-                joint_input.jointMotion = adsk.fusion.CylindricalJointMotion.create()
-            elif joint_type == 'ball':
-                joint_input.jointMotion = adsk.fusion.BallJointMotion.create()
-            else:
-                joint_input.jointMotion = adsk.fusion.RigidJointMotion.create()
+            joint_input.jointMotion = _JOINT_MOTION_FACTORY.get(joint_type, _JOINT_DEFAULT)()
             
             # Create joint
             joint = joints.add(joint_input)
@@ -1524,9 +2065,10 @@ class MCPCommunicationServer:
                 "joint_name": joint.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create joint: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create joint", "detail": e.args[0] if e.args else None}
     
+    @_register('create_motion_study')
     def _create_motion_study(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create motion analysis"""
         global app
@@ -1547,9 +2089,10 @@ class MCPCommunicationServer:
                 "message": "Motion analysis configured, needs to be executed in simulation workspace"
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create motion analysis: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create motion analysis", "detail": e.args[0] if e.args else None}
     
+    @_register('check_interference')
     def _check_interference(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Check interference"""
         global app
@@ -1558,55 +2101,98 @@ class MCPCommunicationServer:
                 return {"error": "Application not initialized"}
             
             tolerance = params.get('tolerance', 0.001)
+            # Indexed results return parallel index lists into one names list
+            # instead of a dict per pair, for dense assemblies
+            indexed = params.get('indexed', False)
+            # Quick polls (e.g. a UI badge) only need the number of overlaps
+            counts_only = params.get('counts_only', False)
+            
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
-            
-            # Get all bodies
-            bodies = []
-            for i in range(root_comp.bRepBodies.count):
-                bodies.append(root_comp.bRepBodies.item(i))
+            component_ids = params.get('component_ids')
+            if component_ids:
+                # Only the named occurrences' bodies enter the pair search,
+                # so its cost follows the selection, not the whole design
+                design = root_comp.parentDesign
+                bodies = []
+                for token in component_ids:
+                    for entity in design.findEntityByToken(token):
+                        occurrence_bodies = getattr(entity, 'bRepBodies', None)
+                        if occurrence_bodies is not None:
+                            bodies.extend(occurrence_bodies)
+            else:
+                # Get all bodies
+                bodies = list(root_comp.bRepBodies)
             
             if len(bodies) < 2:
                 return {"error": "Need at least 2 bodies to check interference"}
             
-            # Simplified interference check (compare bounding boxes)
-            interferences = []
-            for i in range(len(bodies)):
-                for j in range(i + 1, len(bodies)):
-                    body1 = bodies[i]
-                    body2 = bodies[j]
-                    
-                    # Get bounding boxes
-                    bbox1 = body1.boundingBox
-                    bbox2 = body2.boundingBox
-                    
-                    # Check if bounding boxes overlap
-                    if (bbox1.maxPoint.x >= bbox2.minPoint.x - tolerance and
-                        bbox1.minPoint.x <= bbox2.maxPoint.x + tolerance and
-                        bbox1.maxPoint.y >= bbox2.minPoint.y - tolerance and
-                        bbox1.minPoint.y <= bbox2.maxPoint.y + tolerance and
-                        bbox1.maxPoint.z >= bbox2.minPoint.z - tolerance and
-                        bbox1.minPoint.z <= bbox2.maxPoint.z + tolerance):
-                        
-                        interferences.append({
-                            "body1": body1.name,
-                            "body2": body2.name,
-                            "type": "potential_interference"
-                        })
+            # Simplified interference check (compare bounding boxes).
+            # Every box corner is read across the Fusion API once per body;
+            # the pair tests below only touch these local rows.
+            count = len(bodies)
+            mins = []
+            maxs = []
+            for body in bodies:
+                bbox = body.boundingBox
+                min_point = bbox.minPoint
+                max_point = bbox.maxPoint
+                mins.append((min_point.x, min_point.y, min_point.z))
+                maxs.append((max_point.x, max_point.y, max_point.z))
+            
+            if count < _SMALL_MIN_BODIES:
+                pairs = _aabb_pairs_small(mins, maxs, tolerance)
+            elif NUMBA_AVAILABLE and count > _NUMBA_MIN_BODIES:
+                pairs = _aabb_pairs_numba(np.array(mins), np.array(maxs), tolerance)
+            elif NUMPY_AVAILABLE and count < _SWEEP_MIN_BODIES:
+                pairs = _aabb_pairs_broadcast(np.array(mins), np.array(maxs), tolerance).tolist()
+            else:
+                pairs = _aabb_pairs_sweep(mins, maxs, tolerance)
+            
+            if counts_only:
+                return {
+                    "success": True,
+                    "tolerance": tolerance,
+                    "total_bodies": count,
+                    "interference_count": len(pairs)
+                }
+            
+            names = [body.name for body in bodies]
+            
+            if indexed:
+                return {
+                    "success": True,
+                    "tolerance": tolerance,
+                    "total_bodies": count,
+                    "names": names,
+                    "body1_indices": [i for i, _ in pairs],
+                    "body2_indices": [j for _, j in pairs],
+                    "interference_count": len(pairs)
+                }
+            
+            interferences = [
+                {
+                    "body1": names[i],
+                    "body2": names[j],
+                    "type": "potential_interference"
+                }
+                for i, j in pairs
+            ]
             
             return {
                 "success": True,
                 "tolerance": tolerance,
-                "total_bodies": len(bodies),
+                "total_bodies": count,
                 "interferences": interferences,
                 "interference_count": len(interferences)
             }
             
-        except Exception as e:
-            return {"error": f"Interference check failed: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Interference check failed", "detail": e.args[0] if e.args else None}
     
+    @_register('create_exploded_view')
     def _create_exploded_view(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create exploded view"""
         global app
@@ -1617,9 +2203,9 @@ class MCPCommunicationServer:
             name = params.get('name', 'Exploded View')
             explosion_distance = params.get('explosion_distance', 100.0)
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
             # Exploded views in Fusion 360 are implemented through "Representations" feature
             # Return basic configuration info
@@ -1634,9 +2220,10 @@ class MCPCommunicationServer:
                 "message": "Exploded view configured, can be viewed in graphical interface"
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create exploded view: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create exploded view", "detail": e.args[0] if e.args else None}
     
+    @_register('animate_assembly')
     def _animate_assembly(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Assembly animation"""
         global app
@@ -1647,6 +2234,10 @@ class MCPCommunicationServer:
             name = params.get('name', 'Assembly Animation')
             duration = params.get('duration', 5.0)
             keyframes = params.get('keyframes', [])
+            # The MCP server sends keyframes as {"time": [...], "joint_id": [...],
+            # "value": [...]} columns; a list of keyframe dicts also works
+            if isinstance(keyframes, dict):
+                keyframes = keyframes.get('time', [])
             
             # Assembly animation requires timeline and keyframe setup
             # Return animation configuration info
@@ -1659,23 +2250,34 @@ class MCPCommunicationServer:
                 "message": "Assembly animation configured, needs to be played in timeline"
             }
             
-        except Exception as e:
-            return {"error": f"Assembly animation failed: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Assembly animation failed", "detail": e.args[0] if e.args else None}
 
     # =====================================================
     # Measurement and Analysis Methods
     # =====================================================
     
+    @_register('measure_distance')
     def _measure_distance(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Measure distance (mathematical calculation)"""
         try:
             point1 = params.get('point1', [0, 0, 0])
             point2 = params.get('point2', [0, 0, 0])
             
+            # Lists of points measure N pairs in one call
+            if _is_point_batch(point1):
+                if not _valid_point_rows(point1, point2):
+                    return {"error": "point1 and point2 must be equal-length lists of [x, y, z]"}
+                distances = _distances_batch(point1, point2)
+                return {
+                    "success": True,
+                    "distances": distances,
+                    "count": len(distances)
+                }
+            
             if len(point1) != 3 or len(point2) != 3:
                 return {"error": "Point coordinates must contain 3 values [x, y, z]"}
             
-            import math
             dx = point2[0] - point1[0]
             dy = point2[1] - point1[1]
             dz = point2[2] - point1[2]
@@ -1690,9 +2292,10 @@ class MCPCommunicationServer:
                 "delta": [dx, dy, dz]
             }
             
-        except Exception as e:
-            return {"error": f"Failed to measure distance: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to measure distance", "detail": e.args[0] if e.args else None}
     
+    @_register('measure_area')
     def _measure_area(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Measure area"""
         global app
@@ -1703,9 +2306,9 @@ class MCPCommunicationServer:
             entity_id = params.get('entity_id')
             entity_type = params.get('entity_type', 'face')
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
             # Get first face of first body (simplified implementation)
             if root_comp.bRepBodies.count == 0:
@@ -1716,7 +2319,7 @@ class MCPCommunicationServer:
                 return {"error": "Body has no faces to measure"}
             
             face = body.faces.item(0)
-            area = face.area  # Square centimeters
+            area = self._face_area(face)  # Square centimeters
             area_mm2 = area * 100  # Convert to square millimeters
             
             return {
@@ -1727,9 +2330,10 @@ class MCPCommunicationServer:
                 "face_name": face.body.name + "_face_" + str(0)
             }
             
-        except Exception as e:
-            return {"error": f"Failed to measure area: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to measure area", "detail": e.args[0] if e.args else None}
     
+    @_register('measure_angle')
     def _measure_angle(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Measure angle (mathematical calculation)"""
         try:
@@ -1737,24 +2341,38 @@ class MCPCommunicationServer:
             vertex = params.get('vertex', [0, 0, 0])
             point2 = params.get('point2', [0, 1, 0])
             
+            # Lists of points measure N angles in one call; vertex may be shared
+            if _is_point_batch(point1):
+                shared_vertex = not _is_point_batch(vertex)
+                rows = (point1, point2) if shared_vertex else (point1, point2, vertex)
+                if not _valid_point_rows(*rows) or (shared_vertex and not _valid_point_rows([vertex])):
+                    return {"error": "point1, point2 (and a per-row vertex) must be equal-length lists of [x, y, z]"}
+                angles = _angles_batch(point1, vertex, point2)
+                if angles is None:
+                    return {"error": "Vector length cannot be zero"}
+                return {
+                    "success": True,
+                    "angles_radians": angles,
+                    "angles_degrees": [math.degrees(a) for a in angles],
+                    "count": len(angles)
+                }
+            
             if len(point1) != 3 or len(vertex) != 3 or len(point2) != 3:
                 return {"error": "Point coordinates must contain 3 values [x, y, z]"}
             
-            import math
-            
             # Calculate vectors
             vec1 = [point1[0] - vertex[0], point1[1] - vertex[1], point1[2] - vertex[2]]
             vec2 = [point2[0] - vertex[0], point2[1] - vertex[1], point2[2] - vertex[2]]
             
             # Calculate vector magnitudes
-            len1 = math.sqrt(sum(x*x for x in vec1))
-            len2 = math.sqrt(sum(x*x for x in vec2))
+            len1 = math.hypot(vec1[0], vec1[1], vec1[2])
+            len2 = math.hypot(vec2[0], vec2[1], vec2[2])
             
             if len1 == 0 or len2 == 0:
                 return {"error": "Vector length cannot be zero"}
             
             # Calculate dot product
-            dot_product = sum(a*b for a, b in zip(vec1, vec2))
+            dot_product = vec1[0]*vec2[0] + vec1[1]*vec2[1] + vec1[2]*vec2[2]
             
             # Calculate angle
             cos_angle = dot_product / (len1 * len2)
@@ -1771,9 +2389,10 @@ class MCPCommunicationServer:
                 "vector2": vec2
             }
             
-        except Exception as e:
-            return {"error": f"Failed to measure angle: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to measure angle", "detail": e.args[0] if e.args else None}
     
+    @_register('measure_volume')
     def _measure_volume(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Measure volume"""
         global app
@@ -1785,17 +2404,14 @@ class MCPCommunicationServer:
             if not body_id:
                 return {"error": "Body ID not specified"}
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            if not design:
+            root_comp = self._get_root_comp()
+            if root_comp is None:
                 return {"error": "Current product is not a design"}
             
-            root_comp = design.rootComponent
-            
             # Try to get first body as example
             if root_comp.bRepBodies.count > 0:
                 body = root_comp.bRepBodies.item(0)
-                volume = body.volume  # Cubic centimeters
+                volume = self._body_volume(body)  # Cubic centimeters
                 volume_mm3 = volume * 1000  # Convert to cubic millimeters
                 
                 return {
@@ -1807,9 +2423,10 @@ class MCPCommunicationServer:
             else:
                 return {"error": "No measurable bodies found"}
             
-        except Exception as e:
-            return {"error": f"Failed to measure volume: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to measure volume", "detail": e.args[0] if e.args else None}
     
+    @_register('calculate_mass_properties')
     def _calculate_mass_properties(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate mass properties"""
         global app
@@ -1819,28 +2436,36 @@ class MCPCommunicationServer:
                 
             material_density = params.get('material_density', 2.7)  # g/cm³
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
-            if root_comp.bRepBodies.count == 0:
+            # One enumeration of the collection; name and volume are then the
+            # only per-body API reads
+            bodies = list(root_comp.bRepBodies)
+            if not bodies:
                 return {"error": "No bodies to calculate mass properties"}
             
             # Calculate total volume and mass of all bodies
-            total_volume_cm3 = 0
-            bodies_info = []
+            names = [body.name for body in bodies]
+            if NUMPY_AVAILABLE:
+                volumes = np.fromiter(map(self._body_volume, bodies), dtype=np.float64, count=len(bodies))
+                total_volume_cm3 = float(volumes.sum())
+                masses = (volumes * material_density).tolist()
+                volumes = volumes.tolist()
+            else:
+                volumes = [self._body_volume(body) for body in bodies]
+                total_volume_cm3 = sum(volumes)
+                masses = [volume_cm3 * material_density for volume_cm3 in volumes]
             
-            for i in range(root_comp.bRepBodies.count):
-                body = root_comp.bRepBodies.item(i)
-                volume_cm3 = body.volume
-                mass_g = volume_cm3 * material_density
-                
-                total_volume_cm3 += volume_cm3
-                bodies_info.append({
-                    "name": body.name,
+            bodies_info = [
+                {
+                    "name": name,
                     "volume_cm3": volume_cm3,
                     "mass_g": mass_g
-                })
+                }
+                for name, volume_cm3, mass_g in zip(names, volumes, masses)
+            ]
             
             total_mass_g = total_volume_cm3 * material_density
             
@@ -1855,9 +2480,10 @@ class MCPCommunicationServer:
                 }
             }
             
-        except Exception as e:
-            return {"error": f"Failed to calculate mass properties: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to calculate mass properties", "detail": e.args[0] if e.args else None}
     
+    @_register('create_section_analysis')
     def _create_section_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create section analysis"""
         global app
@@ -1868,19 +2494,17 @@ class MCPCommunicationServer:
             cutting_plane_point = params.get('cutting_plane_point', [0, 0, 0])
             cutting_plane_normal = params.get('cutting_plane_normal', [0, 0, 1])
             
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            root_comp = design.rootComponent
+            root_comp = self._get_root_comp()
+            if root_comp is None:
+                return {"error": "Current product is not a design"}
             
             # Create section analysis plane
             planes = root_comp.constructionPlanes
             plane_input = planes.createInput()
             
             # Define plane by point and normal vector
-            point = adsk.core.Point3D.create(cutting_plane_point[0], cutting_plane_point[1], cutting_plane_point[2])
-            normal = adsk.core.Vector3D.create(cutting_plane_normal[0], cutting_plane_normal[1], cutting_plane_normal[2])
-            
-            plane_input.setByPlane(adsk.core.Plane.create(point, normal))
+            plane_input.setByPlane(_K.PLANE(_K.POINT(*cutting_plane_point),
+                                            _K.VECTOR(*cutting_plane_normal)))
             
             # Create construction plane
             construction_plane = planes.add(plane_input)
@@ -1893,9 +2517,10 @@ class MCPCommunicationServer:
                 "plane_name": construction_plane.name
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create section analysis: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create section analysis", "detail": e.args[0] if e.args else None}
     
+    @_register('perform_stress_analysis')
     def _perform_stress_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Perform stress analysis"""
         global app
@@ -1927,9 +2552,10 @@ class MCPCommunicationServer:
                 "message": "Stress analysis configured, needs to be executed in simulation workspace"
             }
             
-        except Exception as e:
-            return {"error": f"Stress analysis failed: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Stress analysis failed", "detail": e.args[0] if e.args else None}
     
+    @_register('perform_modal_analysis')
     def _perform_modal_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Perform modal analysis"""
         global app
@@ -1952,9 +2578,10 @@ class MCPCommunicationServer:
                 "message": "Modal analysis configured, needs to be executed in simulation workspace"
             }
             
-        except Exception as e:
-            return {"error": f"Modal analysis failed: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Modal analysis failed", "detail": e.args[0] if e.args else None}
     
+    @_register('perform_thermal_analysis')
     def _perform_thermal_analysis(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Perform thermal analysis"""
         global app
@@ -1985,9 +2612,10 @@ class MCPCommunicationServer:
                 "message": "Thermal analysis configured, needs to be executed in simulation workspace"
             }
             
-        except Exception as e:
-            return {"error": f"Thermal analysis failed: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Thermal analysis failed", "detail": e.args[0] if e.args else None}
     
+    @_register('generate_analysis_report')
     def _generate_analysis_report(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Generate analysis report"""
         try:
@@ -1995,8 +2623,6 @@ class MCPCommunicationServer:
             report_format = params.get('report_format', 'detailed')
             include_images = params.get('include_images', True)
             
-            from datetime import datetime
-            
             # Generate report content
             report_content = {
                 "report_info": {
@@ -2020,13 +2646,14 @@ class MCPCommunicationServer:
                 "report_generated": True
             }
             
-        except Exception as e:
-            return {"error": f"Failed to generate analysis report: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to generate analysis report", "detail": e.args[0] if e.args else None}
 
     # =====================================================
     # Utility Methods
     # =====================================================
     
+    @_register('create_parameter')
     def _create_parameter(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create user parameter"""
         global app
@@ -2034,9 +2661,8 @@ class MCPCommunicationServer:
             if not app:
                 return {"error": "Application not initialized"}
                 
-            product = app.activeProduct
-            design = adsk.fusion.Design.cast(product)
-            if not design:
+            design = app.activeProduct
+            if not isinstance(design, _K.DESIGN):
                 return {"error": "Current product is not a design"}
             
             name = params.get('name', 'New Parameter')
@@ -2046,7 +2672,7 @@ class MCPCommunicationServer:
             
             # Create user parameter
             user_params = design.userParameters
-            value_input = adsk.core.ValueInput.createByReal(value)
+            value_input = _K.VALUE(value)
             param = user_params.add(name, value_input, units, comment)
             
             return {
@@ -2057,8 +2683,24 @@ class MCPCommunicationServer:
                 "comment": param.comment
             }
             
-        except Exception as e:
-            return {"error": f"Failed to create parameter: {str(e)}"}
+        except RuntimeError as e:
+            return {"error": "Failed to create parameter", "detail": e.args[0] if e.args else None}
+
+
+class _DocumentChangedHandler(adsk.core.DocumentEventHandler):
+    """Invalidate the server's design cache when documents are switched or closed"""
+    
+    def notify(self, args):
+        if mcp_server:
+            mcp_server.invalidate_design_cache()
+
+
+class _CommandTerminatedHandler(adsk.core.ApplicationCommandEventHandler):
+    """Invalidate cached volumes and areas after any interactive command, which may edit geometry"""
+    
+    def notify(self, args):
+        if mcp_server:
+            mcp_server.invalidate_geometry_cache()
 
 
 def run(context):
@@ -2072,6 +2714,16 @@ def run(context):
         mcp_server = MCPCommunicationServer()
         mcp_server.start()
         
+        # Keep the handler referenced in handlers so it is not garbage collected
+        on_document_changed = _DocumentChangedHandler()
+        app.documentActivated.add(on_document_changed)
+        app.documentClosed.add(on_document_changed)
+        handlers.append(on_document_changed)
+        
+        on_command_terminated = _CommandTerminatedHandler()
+        ui.commandTerminated.add(on_command_terminated)
+        handlers.append(on_command_terminated)
+        
     except Exception:
         if ui:
             ui.messageBox('Failed to start plugin:\n{}'.format(traceback.format_exc()))
@@ -2083,6 +2735,13 @@ def stop(context):
     try:
         if mcp_server:
             mcp_server.stop()
+        for handler in handlers:
+            if isinstance(handler, _CommandTerminatedHandler):
+                ui.commandTerminated.remove(handler)
+            else:
+                app.documentActivated.remove(handler)
+                app.documentClosed.remove(handler)
+        handlers.clear()
         if ui:
             ui.messageBox("MCP plugin stopped")
             
@@ -5,11 +5,49 @@ Fusion360 Plugin Communication Client
 Responsible for Socket communication with plugin running inside Fusion360
 """
 
+import select
 import socket
+import struct
 import json
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ..core.config import logger
+# Only read-only commands are repeated when the response is lost
+from . import READ_ONLY_COMMANDS as _READ_ONLY_COMMANDS
+
+# orjson encodes straight to bytes and parses several times faster than the
+# stdlib; it is optional, so fall back to json with the same bytes interface
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+# MessagePack encodes floats in 9 bytes instead of ~20 characters of JSON
+# and parses faster; it is used when both ends have it installed
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Frame header the add-in expects: payload length and content type
+_FRAME_HEADER = struct.Struct('!IB')
+CONTENT_JSON = 0x01
+CONTENT_MSGPACK = 0x02
+
+
+def _is_read_only(request: Dict[str, Any]) -> bool:
+    """Whether every command in a request (single command or batch) is read-only"""
+    batch = request.get("batch")
+    if batch is not None:
+        return all(item.get("command") in _READ_ONLY_COMMANDS for item in batch)
+    return request.get("command") in _READ_ONLY_COMMANDS
 
 
 class Fusion360PluginClient:
@@ -24,6 +62,7 @@ class Fusion360PluginClient:
         self.timeout = timeout
         self._socket = None
         self._connected = False
+        self._content_type = CONTENT_MSGPACK if MSGPACK_AVAILABLE else CONTENT_JSON
     
     def connect(self) -> bool:
         """Connect to Fusion360 plugin
@@ -34,6 +73,10 @@ class Fusion360PluginClient:
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.settimeout(self.timeout)
+            # Commands are small request/response messages: disable Nagle so
+            # they are not held back, and keep the long-lived socket alive
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self._socket.connect((self.host, self.port))
             self._connected = True
             logger.info(f"Connected to Fusion360 plugin {self.host}:{self.port}")
@@ -55,6 +98,18 @@ class Fusion360PluginClient:
         self._connected = False
         logger.info("Disconnected from Fusion360 plugin")
     
+    def _recv_exact(self, size: int) -> bytearray:
+        """Read exactly size bytes from the plugin socket into one preallocated buffer"""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = self._socket.recv_into(view[received:], min(65536, size - received))
+            if not count:
+                raise ConnectionResetError("Connection closed by Fusion360 plugin")
+            received += count
+        return buffer
+    
     def is_connected(self) -> bool:
         """Check if connected"""
         return self._connected and self._socket is not None
@@ -69,24 +124,62 @@ class Fusion360PluginClient:
         Returns:
             Dict[str, Any]: Plugin response
         """
-        if not self.is_connected():
-            if not self.connect():
-                return {"error": "Unable to connect to Fusion360 plugin"}
-        
         request = {
             "command": command,
             "params": params or {}
         }
+        return self._send_request(request)
+    
+    def _is_closed_by_peer(self) -> bool:
+        """Whether the plugin has closed the idle socket
         
+        The plugin drops connections idle for 30 s. A send on such a socket
+        still succeeds and only the response read fails, when the request
+        may already count as delivered, so check before sending: an idle
+        socket that is readable has either hit EOF or gone bad.
+        """
         try:
-            # Send request
-            request_data = json.dumps(request).encode('utf-8')
-            self._socket.send(request_data)
+            readable, _, _ = select.select([self._socket], [], [], 0)
+            if not readable:
+                return False
+            return not self._socket.recv(1, socket.MSG_PEEK)
+        except (OSError, ValueError):
+            return True
+    
+    def _send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request object (single command or batch) and return the response"""
+        if self.is_connected() and self._is_closed_by_peer():
+            self.disconnect()
+        if not self.is_connected():
+            if not self.connect():
+                return {"error": "Unable to connect to Fusion360 plugin"}
+        
+        try:
+            try:
+                self._send_frame(request)
+            except (BrokenPipeError, ConnectionResetError) as e:
+                # The socket is reused across calls, so the plugin may have
+                # dropped it while idle; the request never reached it, so
+                # reconnect and resend exactly once
+                if not self._reconnect(e):
+                    return {"error": "Unable to connect to Fusion360 plugin"}
+                self._send_frame(request)
             
-            # Receive response
-            response_data = self._socket.recv(4096)
-            response = json.loads(response_data.decode('utf-8'))
+            try:
+                response = self._recv_frame()
+            except (BrokenPipeError, ConnectionResetError) as e:
+                # The plugin may have run the request before the connection
+                # went; only a read-only one is safe to run again
+                if not _is_read_only(request):
+                    raise
+                if not self._reconnect(e):
+                    return {"error": "Unable to connect to Fusion360 plugin"}
+                response = self._exchange(request)
             
+            if response.get("unsupported_content_type") == CONTENT_MSGPACK:
+                # The add-in has no msgpack; use JSON from now on
+                self._content_type = CONTENT_JSON
+                response = self._exchange(request)
             return response
             
         except Exception as e:
@@ -94,6 +187,53 @@ class Fusion360PluginClient:
             self.disconnect()
             return {"error": f"Communication error: {str(e)}"}
     
+    def _reconnect(self, error: Exception) -> bool:
+        """Replace a connection the plugin dropped; whether that succeeded"""
+        logger.info(f"Plugin connection lost ({error}), reconnecting")
+        self.disconnect()
+        return self.connect()
+    
+    def _send_frame(self, request: Dict[str, Any]):
+        """Send one framed request"""
+        content_type = self._content_type
+        if content_type == CONTENT_MSGPACK:
+            request_data = msgpack.packb(request, use_bin_type=True)
+        else:
+            request_data = _dumps(request)
+        self._socket.sendall(_FRAME_HEADER.pack(len(request_data), content_type) + request_data)
+    
+    def _recv_frame(self) -> Dict[str, Any]:
+        """Read one framed response"""
+        length, content_type = _FRAME_HEADER.unpack(self._recv_exact(_FRAME_HEADER.size))
+        response_data = self._recv_exact(length)
+        if content_type == CONTENT_MSGPACK:
+            return msgpack.unpackb(response_data, raw=False)
+        return _loads(response_data)
+    
+    def _exchange(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one framed request and read its framed response"""
+        self._send_frame(request)
+        return self._recv_frame()
+    
+    def send_batch(self, commands: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Send several commands in one round trip
+        
+        Args:
+            commands: (command, params) pairs, executed in order by the plugin
+            
+        Returns:
+            List[Dict[str, Any]]: One response per command, in the same order
+        """
+        batch = [{"command": command, "params": params or {}} for command, params in commands]
+        response = self._send_request({"batch": batch})
+        if "results" not in response:
+            return [response] * len(batch)
+        return response["results"]
+    
+    def batch(self) -> "CommandBatch":
+        """Start a chained batch, e.g. client.batch().create_sketch(name="S").run()"""
+        return CommandBatch(self)
+    
     def get_design_info(self) -> Dict[str, Any]:
         """Get design information"""
         return self.send_command("get_design_info")
@@ -166,3 +306,36 @@ class Fusion360PluginClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.disconnect()
+
+
+class CommandBatch:
+    """Collects plugin commands and sends them with Fusion360PluginClient.send_batch
+    
+    Any attribute call queues a command of that name with its keyword
+    arguments as params, so batch.create_circle(sketch_name="S", radius=2)
+    queues "create_circle". Calls return the batch for chaining.
+    """
+    
+    def __init__(self, client: Fusion360PluginClient):
+        self._client = client
+        self._commands: List[Tuple[str, Dict[str, Any]]] = []
+    
+    def add(self, command: str, **params) -> "CommandBatch":
+        """Queue a command"""
+        self._commands.append((command, params))
+        return self
+    
+    def __getattr__(self, command: str):
+        if command.startswith('_'):
+            raise AttributeError(command)
+        return lambda **params: self.add(command, **params)
+    
+    def __len__(self) -> int:
+        return len(self._commands)
+    
+    def run(self) -> List[Dict[str, Any]]:
+        """Send the queued commands in one round trip and clear the batch"""
+        commands, self._commands = self._commands, []
+        if not commands:
+            return []
+        return self._client.send_batch(commands)
@@ -9,12 +9,22 @@ Connects to Fusion 360 plugin via Socket, integrates all tool modules (44 tools)
 """
 
 import asyncio
+import contextlib
+import functools
+import inspect
+import io
+import itertools
 import json
 import logging
-import sys
+import math
+import os
 import socket
+import sys
+import struct
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 # MCP related imports
 from mcp.server.fastmcp import FastMCP
@@ -24,6 +34,100 @@ from mcp.types import (
     EmbeddedResource
 )
 
+# orjson encodes straight to UTF-8 and parses several times faster than the
+# stdlib (from bytes or a memoryview, no decode step); it is optional, so
+# fall back to json with the same interface
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+    # Results may carry int keys or numpy values
+    _TEXT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps_text(obj: Any, indent: bool = False) -> str:
+        option = _TEXT_OPTIONS | orjson.OPT_INDENT_2 if indent else _TEXT_OPTIONS
+        return orjson.dumps(obj, option=option).decode('utf-8')
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data) -> Any:
+        return json.loads(data if isinstance(data, str) else str(data, 'utf-8'))
+
+    def _json_default(obj: Any) -> Any:
+        if hasattr(obj, 'tolist'):  # numpy arrays and scalars
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps_text(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None,
+                          default=_json_default)
+
+def _utf8(payload) -> str:
+    """Text of a UTF-8 JSON payload (bytes or memoryview)"""
+    return str(payload, 'utf-8')
+
+def _err(message: str) -> str:
+    """Serialised {"error": message} tool result"""
+    return _dumps_text({"error": message})
+
+# Results shared by every call that hits the same failure are serialised
+# once. They must not be mutated; _result_text() finds their text by
+# identity, which is stable because they live as long as the module.
+_SHARED_RESULT_TEXT: Dict[int, str] = {}
+
+def _shared_error(message: str) -> Dict[str, str]:
+    result = {"error": message}
+    _SHARED_RESULT_TEXT[id(result)] = _dumps_text(result)
+    return result
+
+def _result_text(result: Dict[str, Any]) -> str:
+    """Serialised tool result, reusing the text of shared results"""
+    return _SHARED_RESULT_TEXT.get(id(result)) or _dumps_text(result)
+
+_NOT_CONNECTED = _shared_error("Unable to connect to Fusion 360 plugin")
+
+# The common transient failures map to shared results, so they skip
+# formatting str(e) and serialising a fresh dict
+_ERR_BY_TYPE = {
+    ConnectionRefusedError: _shared_error("Failed to send command: Fusion 360 plugin refused the connection"),
+    ConnectionResetError: _shared_error("Failed to send command: Fusion 360 plugin closed the connection"),
+    BrokenPipeError: _shared_error("Failed to send command: connection to Fusion 360 plugin is broken"),
+    asyncio.IncompleteReadError: _shared_error("Failed to send command: Fusion 360 plugin closed the connection"),
+    asyncio.TimeoutError: _shared_error("Failed to send command: timed out waiting for Fusion 360 plugin"),
+}
+_ERR_BY_TYPE.setdefault(TimeoutError, _ERR_BY_TYPE[asyncio.TimeoutError])
+
+_CONNECT_FAILED_TEXT = _dumps_text({
+    "success": False,
+    "message": "Failed to connect to Fusion 360 plugin, please ensure:\n1. Fusion 360 is running\n2. FusionMCP plugin is installed and running\n3. Plugin server is listening on port 8765"
+})
+
+@functools.lru_cache(maxsize=None)
+def _connected_text(host: str, port: int) -> str:
+    return _dumps_text({
+        "success": True,
+        "message": "Successfully connected to Fusion 360 plugin",
+        "host": host,
+        "port": port
+    })
+
+# ijson parses large responses incrementally, so a paged tool only builds
+# the records it returns; it is optional and only used above _STREAM_MIN_BYTES
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+_STREAM_MIN_BYTES = 256 * 1024
+
+# History log queue and batch measurement helpers, shared with the
+# analysis tools
+from tools.analysis import history, measurement
+
 # Import context manager
 try:
     from context.persistence import ContextPersistenceManager
@@ -37,90 +141,691 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("fusion360-mcp")
 
 # Create FastMCP application
-mcp = FastMCP("Fusion360 MCP Server - Complete", version="2.0.0")
+@contextlib.asynccontextmanager
+async def _lifespan(server):
+    """Warm the plugin connection pool in the background while serving"""
+    warmup = asyncio.ensure_future(fusion_bridge.warmup())
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await history.flush_history()
+        await fusion_bridge.disconnect()
+
+mcp = FastMCP("Fusion360 MCP Server - Complete", version="2.0.0", lifespan=_lifespan)
+
+# Frame header the plugin expects: payload length and content type. The
+# plugin answers in the content type of the request.
+_FRAME_HEADER = struct.Struct('!IB')
+CONTENT_JSON = 0x01
+CONTENT_MSGPACK = 0x02
+
+# MessagePack sends floats as 9 fixed bytes instead of decimal text; it is
+# optional, and only used for requests whose response the bridge decodes
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+def _unpack(payload) -> Any:
+    return msgpack.unpackb(payload, raw=False)
+
+# Tool operation names mapped to the names the plugin understands. Revolve,
+# sweep and loft support every feature operation except intersect.
+_EXTRUDE_OP_MAP = {"new_body": "new", "join": "join", "cut": "cut", "intersect": "intersect"}
+_REVOLVE_OP_MAP = {"new_body": "new", "join": "join", "cut": "cut"}
+_BOOL_OP_MAP = {"union": "union", "subtract": "subtract", "intersect": "intersect"}
+
+# Kernel send/receive buffer size requested for bridge sockets
+_SOCKET_BUFFER_SIZE = 128 * 1024
+
+class _FrameProtocol(asyncio.BufferedProtocol):
+    """One connection's receive side
+
+    The transport reads straight into a buffer that lives as long as the
+    connection, so no bytes object is allocated per read. Each complete
+    frame is decoded in place (MessagePack frames with _unpack, others with
+    decode) and handed to the request waiting on it.
+    """
+
+    def __init__(self, size: int = 65536):
+        self._buf = bytearray(size)
+        self._start = 0  # First byte not yet consumed
+        self._end = 0    # One past the last byte received
+        self._needed = 0  # Buffer size the frame being received requires
+        self.transport: Optional[asyncio.Transport] = None
+        self.waiter: Optional[asyncio.Future] = None
+        self.decode = _loads
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_exception(exc or ConnectionResetError("Fusion 360 plugin closed the connection"))
+
+    def get_buffer(self, sizehint):
+        # Compacting and growing happen here, while no view of the buffer
+        # is held by the transport
+        if self._start:
+            pending = self._end - self._start
+            self._buf[:pending] = self._buf[self._start:self._end]
+            self._start, self._end = 0, pending
+        if self._needed > len(self._buf) or self._end == len(self._buf):
+            self._buf.extend(bytes(max(self._needed, 2 * len(self._buf)) - len(self._buf)))
+        return memoryview(self._buf)[self._end:]
+
+    def buffer_updated(self, nbytes):
+        self._end += nbytes
+        header_size = _FRAME_HEADER.size
+        while self._end - self._start >= header_size:
+            length, content_type = _FRAME_HEADER.unpack_from(self._buf, self._start)
+            frame_end = self._start + header_size + length
+            if frame_end > self._end:
+                self._needed = header_size + length
+                return
+            waiter, self.waiter = self.waiter, None
+            if waiter is not None and not waiter.done():
+                decode = _unpack if content_type == CONTENT_MSGPACK else self.decode
+                try:
+                    with memoryview(self._buf)[self._start + header_size:frame_end] as payload:
+                        waiter.set_result(decode(payload))
+                except ValueError as e:
+                    waiter.set_exception(e)
+            # Otherwise nobody is waiting any more (e.g. timed out)
+            self._start = frame_end
+            self._needed = 0
+
+@functools.lru_cache(maxsize=None)
+def _command_head(command: str) -> bytes:
+    """Encoded request up to its params value: {"command":...,"params":"""
+    return b'{"command":' + _dumps(command) + b',"params":'
 
 class Fusion360SocketBridge:
     """Fusion 360 Socket Bridge
 
-    Connects to Fusion 360 plugin via Socket to enable API calls
+    Connects to Fusion 360 plugin via Socket to enable API calls. All I/O
+    runs on the event loop through _FrameProtocol. Up to max_size
+    connections are opened lazily and kept alive between calls; each request
+    borrows one, so concurrent tool calls run in parallel instead of queueing
+    behind a single socket. Requests carry an id that the plugin echoes back
+    and that is checked against the response read off the same connection.
+
+    Requests that are decoded on arrival go out as MessagePack when it is
+    installed, falling back to JSON for good if the plugin lacks it.
+    Forwarded (raw) requests are always JSON.
+
+    With a coalesce_window (seconds) above zero, commands sent within that
+    window of each other are collected and sent as one batch frame; the
+    plugin runs them in the order they were sent.
     """
 
-    def __init__(self, host='localhost', port=8765):
+    def __init__(self, host='localhost', port=8765, timeout=5.0, max_size=8,
+                 coalesce_window=0.0):
         self.host = host
         self.port = port
-        self.socket = None
-        self.is_connected = False
+        self.timeout = timeout  # Seconds, for connecting and for each request
+        self.max_size = max_size
+        self.coalesce_window = coalesce_window
+        self.use_msgpack = MSGPACK_AVAILABLE
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._idle: List[Tuple[asyncio.Transport, _FrameProtocol]] = []
+        self._open_count = 0
+        # Created on first use so it belongs to the running event loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._request_ids = itertools.count(1)
+
+    @property
+    def is_connected(self) -> bool:
+        return self._open_count > 0
+
+    async def _open(self) -> Tuple[asyncio.Transport, _FrameProtocol]:
+        """Open one connection to the plugin"""
+        conn = await asyncio.wait_for(
+            asyncio.get_running_loop().create_connection(_FrameProtocol, self.host, self.port),
+            timeout=self.timeout
+        )
+        sock = conn[0].get_extra_info('socket')
+        if sock is not None:
+            # Commands are small request/response messages: disable Nagle so
+            # they are not held back, and keep the long-lived pooled sockets
+            # alive so a vanished plugin is noticed. Larger kernel buffers let
+            # big model responses arrive in fewer reads.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+        self._open_count += 1
+        return conn
+
+    def _close(self, conn: Tuple[asyncio.Transport, _FrameProtocol]):
+        """Close one connection; the next request to need it opens a fresh one"""
+        self._open_count -= 1
+        try:
+            conn[0].close()
+        except Exception:
+            pass
+
+    async def _acquire(self) -> Tuple[asyncio.Transport, _FrameProtocol]:
+        """Borrow an idle connection, opening one while under max_size"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                conn = self._idle.pop()
+                if not conn[0].is_closing():
+                    return conn
+                self._close(conn)
+            return await self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, conn, healthy: bool = True):
+        """Return a borrowed connection, discarding it if it failed"""
+        if healthy:
+            self._idle.append(conn)
+        else:
+            self._close(conn)
+        self._slots.release()
 
-    def connect(self) -> bool:
+    async def connect(self) -> bool:
         """Connect to Fusion 360 plugin"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5.0)  # 5 second timeout
-            self.socket.connect((self.host, self.port))
-            self.is_connected = True
+            self._release(await self._acquire())
             logger.info(f"Connected to Fusion 360 plugin ({self.host}:{self.port})")
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Fusion 360 plugin: {e}")
-            self.is_connected = False
             return False
 
-    def disconnect(self):
-        """Disconnect"""
-        if self.socket:
+    async def warmup(self, n: int = 2, attempts: int = 6) -> bool:
+        """Open n pooled connections ahead of the first tool call
+
+        Each connection is checked with a ping. Failures are retried with
+        exponential backoff and never raised, so a plugin that is not
+        running yet does not hold up or break server startup.
+        """
+        delay = 0.5
+        for _ in range(attempts):
+            conns = []
+            healthy = False
             try:
-                self.socket.close()
-            except:
+                for _ in range(min(n, self.max_size)):
+                    conns.append(await self._acquire())
+                for conn in conns:
+                    request_id = next(self._request_ids)
+                    request_data = _dumps({"id": request_id, "command": "ping", "params": {}})
+                    await asyncio.wait_for(
+                        self._exchange(conn, request_id, request_data, _loads), timeout=self.timeout
+                    )
+                healthy = True
+            except Exception:
                 pass
-            self.socket = None
-        self.is_connected = False
-
-    def send_command(self, command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+            finally:
+                for conn in conns:
+                    self._release(conn, healthy)
+            if healthy:
+                logger.info(f"Warmed {len(conns)} connections to Fusion 360 plugin")
+                return True
+            await asyncio.sleep(delay)
+            delay *= 2
+        return False
+
+    async def disconnect(self):
+        """Disconnect idle connections; borrowed ones close when returned"""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            self._close(conn)
+
+    async def _exchange(self, conn, request_id: int, request_data: bytes, decode,
+                        content_type: int = CONTENT_JSON) -> Any:
+        """Send one framed request on conn and read its framed response"""
+        transport, protocol = conn
+        if transport.is_closing():
+            raise ConnectionResetError("Fusion 360 plugin closed the connection")
+        protocol.waiter = asyncio.get_running_loop().create_future()
+        protocol.decode = decode
+        # writelines() lets the transport gather-write both buffers without
+        # concatenating them first
+        transport.writelines((_FRAME_HEADER.pack(len(request_data), content_type), request_data))
+        response = await protocol.waiter
+        if not isinstance(response, dict):
+            return response  # Undecoded payload
+        # A response the plugin could not tag (e.g. an unparseable request)
+        # has no id; anything else must answer this request
+        echoed = response.pop("id", None)
+        if echoed is not None and echoed != request_id:
+            raise ConnectionError(f"Response id {echoed} does not match request {request_id}")
+        return response
+
+    async def send_command(self, command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send command to Fusion 360 plugin"""
-        if not self.is_connected:
-            if not self.connect():
-                return {"error": "Unable to connect to Fusion 360 plugin"}
-
+        request = {"command": command, "params": params or {}}
+        if self.coalesce_window > 0:
+            return await self._coalesce(request)
+        return await self._request(request, command)
+
+    async def _coalesce(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue request for the next batch flush and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) == 1:
+            loop.call_later(self.coalesce_window, lambda: asyncio.ensure_future(self._flush()))
+        return await future
+
+    async def _flush(self):
+        """Send the queued requests as one batch and hand out the results"""
+        pending, self._pending = self._pending, []
+        if len(pending) == 1:
+            request, future = pending[0]
+            response = await self._request(request, request["command"])
+            results = [response]
+        else:
+            response = await self._request({"batch": [request for request, _ in pending]},
+                                           f"batch of {len(pending)}")
+            # A failed round trip fails every queued request the same way
+            results = response.get("results") or [response] * len(pending)
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def send_command_raw(self, command: str, params: Dict[str, Any] = None,
+                               decode=bytes) -> Any:
+        """Send command and return the plugin's JSON response undecoded
+
+        The request is sent without an id, so the payload is exactly what the
+        command handler returned and can be forwarded as is. decode=_utf8
+        gives the payload as text rather than bytes. Connection failures are
+        still reported as an {"error": ...} dict.
+        """
+        # Only the parameters are encoded per call; the envelope around them
+        # is the same bytes for every call of a command
         try:
-            request = {
-                "command": command,
-                "params": params or {}
-            }
+            request_data = _command_head(command) + _dumps(params or {}) + b"}"
+        except TypeError as e:
+            return {"error": f"Failed to send command: {str(e)}"}
+        return await self._request(request_data, command, decode, tag=False)
 
-            # Send request
-            request_data = json.dumps(request).encode('utf-8')
-            self.socket.send(request_data)
+    async def send_batch(self, commands: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send several commands in one frame
 
-            # Receive response
-            response_data = self.socket.recv(4096)
-            response = json.loads(response_data.decode('utf-8'))
+        Args:
+            commands: Requests of the form {"command": ..., "params": {...}},
+                optionally with a "cmd_id" that is copied onto its result
 
+        Returns:
+            {"results": [...]} with one result per command, in order
+        """
+        return await self._request({"batch": commands}, f"batch of {len(commands)}")
+
+    async def _request(self, request: Union[Dict[str, Any], bytes], label: str, decode=_loads,
+                       tag: bool = True) -> Any:
+        """Send one request on a pooled connection and return its response
+
+        Untagged requests skip the id round trip; a connection only ever
+        carries one request at a time, so the id is a consistency check.
+        A bytes request is already encoded and is sent untagged.
+        """
+        try:
+            conn = await self._acquire()
+        except Exception as e:
+            logger.error(f"Failed to connect to Fusion 360 plugin: {e}")
+            return _NOT_CONNECTED
+
+        healthy = False
+        try:
+            request_id = next(self._request_ids)
+            content_type = CONTENT_JSON
+            if isinstance(request, bytes):
+                request_data = request
+            else:
+                if tag:
+                    request = {"id": request_id, **request}
+                if self.use_msgpack:
+                    request_data = msgpack.packb(request, use_bin_type=True)
+                    content_type = CONTENT_MSGPACK
+                else:
+                    request_data = _dumps(request)
+            response = await asyncio.wait_for(
+                self._exchange(conn, request_id, request_data, decode, content_type),
+                timeout=self.timeout
+            )
+            if (content_type == CONTENT_MSGPACK and isinstance(response, dict)
+                    and "unsupported_content_type" in response):
+                logger.info("Fusion 360 plugin has no MessagePack support, using JSON")
+                self.use_msgpack = False
+                response = await asyncio.wait_for(
+                    self._exchange(conn, request_id, _dumps(request), decode),
+                    timeout=self.timeout
+                )
+            healthy = True
             return response
 
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out waiting for command ({label})")
+            return _ERR_BY_TYPE[asyncio.TimeoutError]
+
         except Exception as e:
-            logger.error(f"Failed to send command ({command}): {e}")
-            self.disconnect()
-            return {"error": f"Failed to send command: {str(e)}"}
+            logger.error(f"Failed to send command ({label}): {e}")
+            return _ERR_BY_TYPE.get(type(e)) or {"error": f"Failed to send command: {str(e)}"}
+
+        finally:
+            # Only this connection is dropped on failure; the rest stay warm
+            self._release(conn, healthy)
 
 # Create global instance
-fusion_bridge = Fusion360SocketBridge()
+# FUSION_MCP_COALESCE_MS batches commands sent within that many milliseconds
+# of each other into one round trip; unset or 0 sends each one immediately
+fusion_bridge = Fusion360SocketBridge(
+    coalesce_window=float(os.environ.get("FUSION_MCP_COALESCE_MS", "0")) / 1000
+)
+
+def _log_tool_execution(tool_name: str, parameters: Dict[str, Any], result: Any) -> None:
+    """Queue tool execution for the history log
 
-def _log_tool_execution(tool_name: str, parameters: Dict[str, Any], result: Dict[str, Any]) -> None:
-    """Log tool execution to history"""
+    result is a response dict or the plugin's JSON response text; the
+    shared history queue parses and saves it off the tool's path.
+    """
     if context_manager:
-        context_manager.add_history_entry(
-            action_type=tool_name,
-            action_description=f"Execute tool: {tool_name}",
-            parameters=parameters,
-            result=result,
-            user_context="MCP tool call"
-        )
+        # Queued by reference; the tool hands both over and keeps neither
+        history.log_tool_execution(context_manager, tool_name, parameters, result)
+
+# Commands that leave the design unchanged; anything else invalidates the
+# cached reads below. A copy of fusion360.READ_ONLY_COMMANDS, since that
+# package's client only imports as part of src (checked equal by the unit
+# tests)
+_READ_ONLY_COMMANDS = frozenset({
+    'ping', 'get_design_info', 'get_component_hierarchy', 'get_sketches', 'get_features',
+    'get_assembly_info', 'check_interference', 'measure_distance', 'measure_area',
+    'measure_angle', 'measure_volume', 'calculate_mass_properties',
+    'perform_stress_analysis', 'perform_modal_analysis', 'perform_thermal_analysis',
+    'generate_analysis_report'
+})
+
+_TTL_CACHES: List[Dict[Any, Tuple[float, Any]]] = []
+# Bumped on every clear, so a read that was in flight across a write does
+# not store its (possibly stale) result
+_ttl_generation = 0
+
+def _is_success(value: Any) -> bool:
+    """Whether a result dict, or forwarded response text, is not an error"""
+    if isinstance(value, str):
+        # The plugin's error responses are {"error": ...} dicts
+        return not value.startswith('{"error"')
+    return "error" not in value
+
+def _ttl_cache(seconds: float):
+    """Cache a coroutine's successful results per argument tuple for seconds
+
+    A burst of identical reads costs one round trip. Cached results are
+    shared between callers and must not be mutated.
+    """
+    def decorate(fetch):
+        entries: Dict[Any, Tuple[float, Any]] = {}
+        _TTL_CACHES.append(entries)
+
+        @functools.wraps(fetch)
+        async def cached(*args):
+            now = time.monotonic()
+            entry = entries.get(args)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = _ttl_generation
+            value = await fetch(*args)
+            if _is_success(value) and generation == _ttl_generation:
+                entries[args] = (now + seconds, value)
+            return value
+        return cached
+    return decorate
+
+def _ttl_cache_clear() -> None:
+    """Drop every cached read; called whenever the design may have changed"""
+    global _ttl_generation
+    _ttl_generation += 1
+    for entries in _TTL_CACHES:
+        entries.clear()
+
+@_ttl_cache(seconds=0.25)
+async def _read_info(command: str) -> Union[str, Dict[str, Any]]:
+    """Response text of a parameterless read-only command
+
+    Connection failures come back as an {"error": ...} dict.
+    """
+    return await fusion_bridge.send_command_raw(command, None, _utf8)
+
+async def _dispatch(tool_name: str, command: str, parameters: Dict[str, Any]) -> str:
+    """Send one plugin command on behalf of a tool and log the outcome"""
+    if command not in _READ_ONLY_COMMANDS:
+        _ttl_cache_clear()
+    try:
+        if fusion_bridge.coalesce_window > 0:
+            result = await fusion_bridge.send_command(command, parameters)
+            _log_tool_execution(tool_name, parameters, result)
+            return _result_text(result)
+        # The plugin's response is forwarded as the tool result without a
+        # decode/encode round trip; only the history log needs it parsed
+        result = await fusion_bridge.send_command_raw(command, parameters, _utf8)
+        _log_tool_execution(tool_name, parameters, result)
+        return result if isinstance(result, str) else _result_text(result)
+
+    except Exception as e:
+        result = _ERR_BY_TYPE.get(type(e)) or {"error": str(e)}
+        _log_tool_execution(tool_name, parameters, result)
+        return _result_text(result)
+
+def _rule(name: str, predicate, message: str) -> Tuple[str, Any, str]:
+    """Validation rule for _precheck; the error is serialised once, here"""
+    return (name, predicate, _err(message))
+
+def _precheck(rules: Sequence[Tuple[str, Any, str]], parameters: Dict[str, Any]) -> Optional[str]:
+    """Serialised error for the first rule parameters break, or None
+
+    Arguments left as None are not checked.
+    """
+    for name, predicate, error in rules:
+        value = parameters.get(name)
+        if value is not None and not predicate(value):
+            return error
+    return None
+
+def _vec3(value) -> Tuple[float, float, float]:
+    """[x, y, z] as a tuple of three floats; raises ValueError/TypeError otherwise"""
+    x, y, z = value
+    return (float(x), float(y), float(z))
+
+def _normalize_vectors(vectors: Sequence[Tuple[str, str]], parameters: Dict[str, Any]) -> Optional[str]:
+    """Replace each named [x, y, z] argument with its _vec3 form in place
+
+    Returns the serialised error for the first malformed vector, or None.
+    Arguments left as None are skipped.
+    """
+    for name, error in vectors:
+        value = parameters.get(name)
+        if value is not None:
+            try:
+                parameters[name] = _vec3(value)
+            except (TypeError, ValueError):
+                return error
+    return None
+
+def _positive(value) -> bool:
+    return value > 0
+
+def _nonzero_vector(value) -> bool:
+    return len(value) == 3 and any(value)
+
+_RECTANGLE_RULES = (
+    _rule("width", lambda v: v != 0, "width must not be zero"),
+    _rule("height", lambda v: v != 0, "height must not be zero"),
+)
+_RADIUS_RULES = (_rule("radius", _positive, "radius must be positive"),)
+_POLYGON_RULES = _RADIUS_RULES + (_rule("sides", lambda v: v >= 3, "sides must be at least 3"),)
+_AXIS_RULES = (_rule("axis_direction", _nonzero_vector, "axis_direction must be a non-zero [x, y, z] vector"),)
+_CHAMFER_RULES = (_rule("distance", _positive, "distance must be positive"),)
+_SHELL_RULES = (_rule("thickness", _positive, "thickness must be positive"),)
+_PATTERN_RECTANGULAR_RULES = (
+    _rule("direction1", _nonzero_vector, "direction1 must be a non-zero [x, y, z] vector"),
+    _rule("direction2", _nonzero_vector, "direction2 must be a non-zero [x, y, z] vector"),
+    _rule("quantity1", lambda v: v >= 1, "quantity1 must be at least 1"),
+    _rule("quantity2", lambda v: v >= 1, "quantity2 must be at least 1"),
+)
+_PATTERN_CIRCULAR_RULES = _AXIS_RULES + (_rule("quantity", lambda v: v >= 1, "quantity must be at least 1"),)
+_MIRROR_RULES = (_rule("mirror_plane_normal", _nonzero_vector, "mirror_plane_normal must be a non-zero [x, y, z] vector"),)
+_SECTION_RULES = (_rule("cutting_plane_normal", _nonzero_vector, "cutting_plane_normal must be a non-zero [x, y, z] vector"),)
+_INTERFERENCE_RULES = (_rule("tolerance", lambda v: v >= 0, "tolerance must not be negative"),)
+
+# Tools registered through _plugin_tool and _tool_wrapper, by name, so
+# composite tools can call them. _TOOL_PARAMETERS holds each one's
+# (parameter names, required names), read from its signature once here so
+# calls that bypass FastMCP's validation can be checked without reflection.
+# _TOOL_COMMANDS maps each _plugin_tool to the plugin command it sends.
+_TOOLS: Dict[str, Any] = {}
+_TOOL_PARAMETERS: Dict[str, Tuple[frozenset, frozenset]] = {}
+_TOOL_COMMANDS: Dict[str, str] = {}
+
+def _register_tool(tool_name: str, tool, signature: inspect.Signature):
+    """Add tool to the registries and to the MCP server"""
+    _TOOLS[tool_name] = tool
+    _TOOL_PARAMETERS[tool_name] = (
+        frozenset(signature.parameters),
+        frozenset(name for name, param in signature.parameters.items()
+                  if param.default is inspect.Parameter.empty)
+    )
+    return mcp.tool()(tool)
+
+def _check_arguments(tool_name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """Serialised error if arguments do not fit the tool's parameters, or None"""
+    names, required = _TOOL_PARAMETERS[tool_name]
+    unknown = arguments.keys() - names
+    if unknown:
+        return _err(f"Unknown arguments for {tool_name}: {', '.join(sorted(unknown))}")
+    missing = required - arguments.keys()
+    if missing:
+        return _err(f"Missing arguments for {tool_name}: {', '.join(sorted(missing))}")
+    return None
+
+def _plugin_tool(
+    command: str,
+    operations: Optional[Dict[str, str]] = None,
+    rules: Sequence[Tuple[str, Any, str]] = (),
+    vectors: Sequence[str] = ()
+):
+    """Register a tool that forwards its arguments to a plugin command
+
+    The decorated function only declares the tool: FastMCP builds the schema
+    from its signature and docstring (reached through __wrapped__). Its body
+    is never run; every call goes straight to _dispatch.
+
+    With operations, the tool's "operation" argument is translated to the
+    plugin's name for it. The arguments named in vectors are normalised to
+    three floats before rules are checked. Unknown operations, malformed
+    vectors and arguments breaking one of rules are rejected without a
+    round trip.
+    """
+    def register(declaration):
+        tool_name = declaration.__name__
+        # Read the signature once. **kwargs already is a fresh dict of the
+        # call's arguments and becomes the request parameters as is; FastMCP
+        # passes every argument, so defaults are only filled in for direct
+        # calls that leave some out.
+        signature = inspect.signature(declaration)
+        parameter_count = len(signature.parameters)
+        defaults = {
+            name: param.default
+            for name, param in signature.parameters.items()
+            if param.default is not inspect.Parameter.empty
+        }
+
+        vector_errors = tuple((name, _err(f"{name} must be three numbers [x, y, z]")) for name in vectors)
+
+        if operations is None and not rules and not vectors:
+            @functools.wraps(declaration)
+            async def tool(**parameters) -> str:
+                if len(parameters) < parameter_count:
+                    parameters = {**defaults, **parameters}
+                return await _dispatch(tool_name, command, parameters)
+        else:
+            unknown_operation = operations and _err(f"operation must be one of: {', '.join(operations)}")
+
+            @functools.wraps(declaration)
+            async def tool(**parameters) -> str:
+                if len(parameters) < parameter_count:
+                    parameters = {**defaults, **parameters}
+                error = _normalize_vectors(vector_errors, parameters) or _precheck(rules, parameters)
+                if error is not None:
+                    return error
+                if operations is not None:
+                    operation = operations.get(parameters.get("operation"))
+                    if operation is None:
+                        return unknown_operation
+                    parameters["operation"] = operation
+                return await _dispatch(tool_name, command, parameters)
+
+        _TOOL_COMMANDS[tool_name] = command
+        return _register_tool(tool_name, tool, signature)
+    return register
+
+def _tool_wrapper(log: bool = True, offload=None):
+    """Register a tool whose body computes and returns its result dict
+
+    The wrapper serialises the result, turns an exception into an
+    {"error": ...} result and, unless log is False, records the call in the
+    history log with the tool's arguments as its parameters. A str result is
+    taken to be already serialised (e.g. a _precheck error) and returned as is.
+
+    The body may be a plain function when it does no I/O; it then runs
+    inline, or in a worker thread when offload(parameters) is true, so a
+    large computation does not stall the event loop. Its return annotation
+    describes the body; the registered tool is declared to return str.
+    """
+    def register(implementation):
+        tool_name = implementation.__name__
+        is_async = inspect.iscoroutinefunction(implementation)
+        signature = inspect.signature(implementation)
+        parameter_count = len(signature.parameters)
+        defaults = {
+            name: param.default
+            for name, param in signature.parameters.items()
+            if param.default is not inspect.Parameter.empty
+        }
+
+        @functools.wraps(implementation)
+        async def tool(**parameters) -> str:
+            if len(parameters) < parameter_count:
+                parameters = {**defaults, **parameters}
+            try:
+                if is_async:
+                    result = await implementation(**parameters)
+                elif offload is not None and offload(parameters):
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        None, functools.partial(implementation, **parameters)
+                    )
+                else:
+                    result = implementation(**parameters)
+            except Exception as e:
+                result = _ERR_BY_TYPE.get(type(e)) or {"error": str(e)}
+            if isinstance(result, str):
+                return result
+            if log:
+                _log_tool_execution(tool_name, parameters, result)
+            return _result_text(result)
+
+        # FastMCP reads the signature through __wrapped__, which would give
+        # the body's return type; the tool itself always returns text
+        tool.__signature__ = signature.replace(return_annotation=str)
+        tool.__annotations__ = {**implementation.__annotations__, "return": str}
+        return _register_tool(tool_name, tool, tool.__signature__)
+    return register
 
 # =====================================================
 # Connection Tools
 # =====================================================
 
-@mcp.tool()
+@_tool_wrapper(log=False)
 async def connect_fusion360() -> str:
     """
     Connect to Fusion 360 plugin
@@ -128,30 +833,120 @@ async def connect_fusion360() -> str:
     Returns:
         Connection status information
     """
-    try:
-        success = fusion_bridge.connect()
-        if success:
-            result = {
-                "success": True,
-                "message": "Successfully connected to Fusion 360 plugin",
-                "host": fusion_bridge.host,
-                "port": fusion_bridge.port
-            }
-        else:
-            result = {
-                "success": False,
-                "message": "Failed to connect to Fusion 360 plugin, please ensure:\n1. Fusion 360 is running\n2. FusionMCP plugin is installed and running\n3. Plugin server is listening on port 8765"
-            }
-        return json.dumps(result, ensure_ascii=False)
-    except Exception as e:
-        result = {"error": str(e)}
-        return json.dumps(result, ensure_ascii=False)
+    if await fusion_bridge.connect():
+        return _connected_text(fusion_bridge.host, fusion_bridge.port)
+    return _CONNECT_FAILED_TEXT
+
+@_tool_wrapper()
+async def batch_commands(commands: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run several plugin commands in one round trip
+
+    Args:
+        commands: List of {"command": name, "params": {...}} entries, run in order;
+            a failing entry does not stop the ones after it. An entry may
+            carry a "cmd_id", which is copied onto its result.
+
+    Returns:
+        {"results": [...]} with one result per command
+    """
+    _ttl_cache_clear()
+    return await fusion_bridge.send_batch(commands)
+
+async def _run_calls(calls: List[Any], run, concurrent: bool, max_concurrency: int) -> str:
+    """Run every call through run and splice the serialised results in order
+
+    With concurrent, at most max_concurrency calls are in flight at once,
+    each on its own pooled connection; otherwise they run one after another,
+    so a call that changes the design is done before the next one starts.
+    A call that raises yields an {"error": ...} entry.
+    """
+    if concurrent:
+        slots = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def limited(call: Any) -> str:
+            async with slots:
+                return await run(call)
+
+        texts = await asyncio.gather(*[limited(call) for call in calls], return_exceptions=True)
+    else:
+        texts = []
+        for call in calls:
+            try:
+                texts.append(await run(call))
+            except Exception as e:
+                texts.append(e)
+    # Every result is already serialised; splice them instead of re-encoding
+    return '{"results":[' + ",".join(
+        _err(str(text)) if isinstance(text, BaseException) else text for text in texts
+    ) + "]}"
+
+@mcp.tool()
+async def batch_parallel(calls: List[Dict[str, Any]], max_concurrency: int = 4) -> str:
+    """
+    Run several tool calls, concurrently when that is safe
+
+    Calls to read-only tools (queries, measurements, analyses) run
+    concurrently, at most max_concurrency at a time, so the total wait is
+    the slowest call rather than the sum of all of them. If any call may
+    change the design, every call runs in order instead.
+
+    Args:
+        calls: List of {"tool": name, "params": {...}} entries
+        max_concurrency: Most calls in flight at once
+
+    Returns:
+        {"results": [...]} with one result per call, in order
+    """
+    async def run(call: Dict[str, Any]) -> str:
+        tool_name = call.get("tool")
+        tool = _TOOLS.get(tool_name)
+        if tool is None:
+            return _err(f"Unknown tool: {tool_name}")
+        arguments = call.get("params") or {}
+        return _check_arguments(tool_name, arguments) or await tool(**arguments)
+
+    # Only plugin tools sending a read-only command are known not to mutate
+    concurrent = all(
+        _TOOL_COMMANDS.get(call.get("tool")) in _READ_ONLY_COMMANDS for call in calls
+    )
+    return await _run_calls(calls, run, concurrent, max_concurrency)
+
+@mcp.tool()
+async def parallel_commands(commands: List[Dict[str, Any]], max_concurrency: int = 4) -> str:
+    """
+    Run several plugin commands, concurrently when that is safe
+
+    Read-only commands (queries, measurements, analyses) run concurrently,
+    each on its own pooled connection, at most max_concurrency at a time.
+    If any command changes the design, the whole list runs in order as one
+    batch instead, so later commands see the results of earlier ones.
+
+    Args:
+        commands: List of {"command": name, "params": {...}} entries
+        max_concurrency: Most commands in flight at once
+
+    Returns:
+        {"results": [...]} with one result per command, in order
+    """
+    if not all(command.get("command") in _READ_ONLY_COMMANDS for command in commands):
+        _ttl_cache_clear()
+        return _result_text(await fusion_bridge.send_batch(commands))
+
+    async def run(command: Dict[str, Any]) -> str:
+        # The plugin's response is forwarded as it is
+        result = await fusion_bridge.send_command_raw(
+            command["command"], command.get("params"), _utf8
+        )
+        return result if isinstance(result, str) else _result_text(result)
+
+    return await _run_calls(commands, run, True, max_concurrency)
 
 # =====================================================
-# Sketch Tools (9)
+# Sketch Tools (11)
 # =====================================================
 
-@mcp.tool()
+@_plugin_tool("create_sketch")
 async def create_sketch(
     plane: str = "XY",
     name: Optional[str] = None
@@ -163,19 +958,8 @@ async def create_sketch(
         plane: Sketch plane (XY, XZ, YZ)
         name: Sketch name (optional)
     """
-    parameters = {"plane": plane, "name": name}
 
-    try:
-        result = fusion_bridge.send_command("create_sketch", parameters)
-        _log_tool_execution("create_sketch", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_sketch", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("draw_line")
 async def draw_line(
     start_x: float,
     start_y: float,
@@ -193,23 +977,8 @@ async def draw_line(
         end_y: End point Y coordinate
         sketch_name: Target sketch name (if empty, use active sketch)
     """
-    parameters = {
-        "start_x": start_x, "start_y": start_y,
-        "end_x": end_x, "end_y": end_y,
-        "sketch_name": sketch_name
-    }
 
-    try:
-        result = fusion_bridge.send_command("draw_line", parameters)
-        _log_tool_execution("draw_line", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("draw_line", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_rectangle", rules=_RECTANGLE_RULES)
 async def draw_rectangle(
     width: float,
     height: float,
@@ -227,23 +996,8 @@ async def draw_rectangle(
         center_y: Center point Y coordinate
         sketch_name: Target sketch name (if empty, create new sketch)
     """
-    parameters = {
-        "width": width, "height": height,
-        "center_x": center_x, "center_y": center_y,
-        "sketch_name": sketch_name
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_rectangle", parameters)
-        _log_tool_execution("draw_rectangle", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("draw_rectangle", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-@mcp.tool()
+@_plugin_tool("create_circle", rules=_RADIUS_RULES)
 async def draw_circle(
     radius: float,
     center_x: float = 0.0,
@@ -259,22 +1013,8 @@ async def draw_circle(
         center_y: Center Y coordinate
         sketch_name: Target sketch name (if empty, create new sketch)
     """
-    parameters = {
-        "radius": radius, "center_x": center_x,
-        "center_y": center_y, "sketch_name": sketch_name
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_circle", parameters)
-        _log_tool_execution("draw_circle", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("draw_circle", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-@mcp.tool()
+@_plugin_tool("draw_arc", rules=_RADIUS_RULES)
 async def draw_arc(
     center_x: float,
     center_y: float,
@@ -294,23 +1034,8 @@ async def draw_arc(
         end_angle: End angle (radians)
         sketch_name: Target sketch name (if empty, use active sketch)
     """
-    parameters = {
-        "center_x": center_x, "center_y": center_y,
-        "radius": radius, "start_angle": start_angle,
-        "end_angle": end_angle, "sketch_name": sketch_name
-    }
-
-    try:
-        result = fusion_bridge.send_command("draw_arc", parameters)
-        _log_tool_execution("draw_arc", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("draw_arc", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-@mcp.tool()
+@_plugin_tool("draw_polygon", rules=_POLYGON_RULES)
 async def draw_polygon(
     center_x: float,
     center_y: float,
@@ -328,23 +1053,45 @@ async def draw_polygon(
         sides: Number of sides
         sketch_name: Target sketch name (if empty, use active sketch)
     """
-    parameters = {
-        "center_x": center_x, "center_y": center_y,
-        "radius": radius, "sides": sides,
-        "sketch_name": sketch_name
-    }
 
-    try:
-        result = fusion_bridge.send_command("draw_polygon", parameters)
-        _log_tool_execution("draw_polygon", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+# Plugin command and validation rules behind each shape type accepted by draw_many
+_SHAPE_COMMANDS = {
+    "line": ("draw_line", ()),
+    "rectangle": ("create_rectangle", _RECTANGLE_RULES),
+    "circle": ("create_circle", _RADIUS_RULES),
+    "arc": ("draw_arc", _RADIUS_RULES),
+    "polygon": ("draw_polygon", _POLYGON_RULES),
+}
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("draw_polygon", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+@_tool_wrapper()
+async def draw_many(
+    shapes: List[Dict[str, Any]],
+    sketch_name: Optional[str] = None
+) -> Union[str, Dict[str, Any]]:
+    """
+    Draw several shapes in one round trip
 
-@mcp.tool()
+    Args:
+        shapes: List of shapes, each with "type" (line, rectangle, circle, arc,
+            polygon) plus the arguments of the matching draw_* tool
+        sketch_name: Target sketch for shapes that do not name their own
+    """
+    commands = []
+    for shape in shapes:
+        params = dict(shape)
+        command, rules = _SHAPE_COMMANDS.get(params.pop("type", None), (None, ()))
+        if command is None:
+            return {"error": f"Unknown shape type: {shape.get('type')}"}
+        error = _precheck(rules, params)
+        if error is not None:
+            return error
+        params.setdefault("sketch_name", sketch_name)
+        commands.append({"command": command, "params": params})
+
+    _ttl_cache_clear()
+    return await fusion_bridge.send_batch(commands)
+
+@_plugin_tool("get_sketches")
 async def get_sketch_info(sketch_name: Optional[str] = None) -> str:
     """
     Get sketch information
@@ -352,19 +1099,36 @@ async def get_sketch_info(sketch_name: Optional[str] = None) -> str:
     Args:
         sketch_name: Sketch name (if empty, get all sketches)
     """
-    parameters = {"sketch_name": sketch_name}
 
-    try:
-        result = fusion_bridge.send_command("get_sketches", parameters)
-        _log_tool_execution("get_sketch_info", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+def _page(body: bytes, key: str, offset: int, limit: int) -> Dict[str, Any]:
+    """Records offset..offset+limit of the list under key in a JSON response"""
+    if IJSON_AVAILABLE and len(body) > _STREAM_MIN_BYTES:
+        # Error responses are small, so a large body is a successful one
+        records = ijson.items(io.BytesIO(body), f"{key}.item")
+        page = list(itertools.islice(records, offset, offset + limit))
+    else:
+        response = _loads(body)
+        if "error" in response:
+            return response
+        page = response.get(key, [])[offset:offset + limit]
+    return {"success": True, key: page, "offset": offset, "count": len(page)}
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("get_sketch_info", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+@_tool_wrapper()
+async def get_sketch_info_stream(offset: int = 0, limit: int = 100) -> Dict[str, Any]:
+    """
+    Get one page of sketch information
 
-@mcp.tool()
+    Large responses are parsed incrementally, so only the requested page of
+    sketches is built in memory.
+
+    Args:
+        offset: Index of the first sketch to return
+        limit: Maximum number of sketches to return
+    """
+    body = await fusion_bridge.send_command_raw("get_sketches")
+    return body if isinstance(body, dict) else _page(body, "sketches", offset, limit)
+
+@_plugin_tool("add_geometric_constraint")
 async def add_geometric_constraint(
     constraint_type: str,
     entities: List[str],
@@ -378,23 +1142,8 @@ async def add_geometric_constraint(
         entities: List of entity IDs to constrain
         sketch_name: Target sketch name
     """
-    parameters = {
-        "constraint_type": constraint_type,
-        "entities": entities,
-        "sketch_name": sketch_name
-    }
-
-    try:
-        result = fusion_bridge.send_command("add_geometric_constraint", parameters)
-        _log_tool_execution("add_geometric_constraint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("add_geometric_constraint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("add_dimensional_constraint")
 async def add_dimensional_constraint(
     dimension_type: str,
     entities: List[str],
@@ -410,28 +1159,12 @@ async def add_dimensional_constraint(
         value: Dimension value
         sketch_name: Target sketch name
     """
-    parameters = {
-        "dimension_type": dimension_type,
-        "entities": entities,
-        "value": value,
-        "sketch_name": sketch_name
-    }
-
-    try:
-        result = fusion_bridge.send_command("add_dimensional_constraint", parameters)
-        _log_tool_execution("add_dimensional_constraint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("add_dimensional_constraint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
 # =====================================================
 # Modeling Feature Tools (12)
 # =====================================================
 
-@mcp.tool()
+@_plugin_tool("create_extrude", _EXTRUDE_OP_MAP)
 async def create_extrude(
     sketch_name: str,
     distance: float,
@@ -445,40 +1178,6 @@ async def create_extrude(
         distance: Extrusion distance
         operation: Extrusion operation type (new_body, join, cut, intersect)
     """
-    # Fix operation parameter mapping - this is the key reason for crashes
-    operation_mapping = {
-        "new_body": "new",
-        "join": "join",
-        "cut": "cut",
-        "intersect": "intersect"
-    }
-
-    # Map operation parameter to plugin expected format
-    mapped_operation = operation_mapping.get(operation, "new")
-
-    parameters = {
-        "sketch_name": sketch_name,
-        "distance": distance,
-        "operation": mapped_operation  # Use mapped value
-    }
-
-    try:
-        # Ensure connection is established first
-        if not fusion_bridge.is_connected:
-            connect_result = fusion_bridge.connect()
-            if not connect_result:
-                result = {"error": "Unable to connect to Fusion 360 plugin"}
-                _log_tool_execution("create_extrude", parameters, result)
-                return json.dumps(result, ensure_ascii=False)
-
-        result = fusion_bridge.send_command("create_extrude", parameters)
-        _log_tool_execution("create_extrude", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_extrude", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
 @mcp.tool()
 async def extrude_feature(
@@ -495,9 +1194,9 @@ async def extrude_feature(
         operation: Operation type (new_body, cut, join, intersect)
     """
     # Directly call create_extrude function
-    return await create_extrude(sketch_name, distance, operation)
+    return await create_extrude(sketch_name=sketch_name, distance=distance, operation=operation)
 
-@mcp.tool()
+@_plugin_tool("create_revolve", _REVOLVE_OP_MAP, _AXIS_RULES, ("axis_point", "axis_direction"))
 async def create_revolve(
     sketch_name: str,
     axis_point: List[float],
@@ -513,27 +1212,10 @@ async def create_revolve(
         axis_point: Point on rotation axis [x, y, z]
         axis_direction: Rotation axis direction [x, y, z]
         angle: Rotation angle (radians)
-        operation: Revolve operation type (new_body, join, cut, intersect)
-    """
-    parameters = {
-        "sketch_name": sketch_name,
-        "axis_point": axis_point,
-        "axis_direction": axis_direction,
-        "angle": angle,
-        "operation": operation
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_revolve", parameters)
-        _log_tool_execution("create_revolve", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_revolve", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+        operation: Revolve operation type (new_body, join, cut)
+    """
 
-@mcp.tool()
+@_plugin_tool("create_sweep", _REVOLVE_OP_MAP)
 async def create_sweep(
     profile_sketch_name: str,
     path_sketch_name: str,
@@ -546,27 +1228,11 @@ async def create_sweep(
     Args:
         profile_sketch_name: Profile sketch name
         path_sketch_name: Path sketch name
-        operation: Sweep operation type (new_body, join, cut, intersect)
+        operation: Sweep operation type (new_body, join, cut)
         twist_angle: Twist angle (radians)
     """
-    parameters = {
-        "profile_sketch_name": profile_sketch_name,
-        "path_sketch_name": path_sketch_name,
-        "operation": operation,
-        "twist_angle": twist_angle
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_sweep", parameters)
-        _log_tool_execution("create_sweep", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_sweep", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_loft", _REVOLVE_OP_MAP)
 async def create_loft(
     profile_sketch_names: List[str],
     operation: str = "new_body",
@@ -577,26 +1243,11 @@ async def create_loft(
 
     Args:
         profile_sketch_names: List of profile sketch names
-        operation: Loft operation type (new_body, join, cut, intersect)
+        operation: Loft operation type (new_body, join, cut)
         guide_rails: List of guide rail sketch names (optional)
     """
-    parameters = {
-        "profile_sketch_names": profile_sketch_names,
-        "operation": operation,
-        "guide_rails": guide_rails
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_loft", parameters)
-        _log_tool_execution("create_loft", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_loft", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_fillet", rules=_RADIUS_RULES)
 async def create_fillet(
     edge_ids: List[str],
     radius: float,
@@ -610,23 +1261,8 @@ async def create_fillet(
         radius: Fillet radius
         fillet_type: Fillet type (constant, variable, chord_length)
     """
-    parameters = {
-        "edge_ids": edge_ids,
-        "radius": radius,
-        "fillet_type": fillet_type
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_fillet", parameters)
-        _log_tool_execution("create_fillet", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_fillet", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_chamfer", rules=_CHAMFER_RULES)
 async def create_chamfer(
     edge_ids: List[str],
     distance: float,
@@ -640,23 +1276,8 @@ async def create_chamfer(
         distance: Chamfer distance
         chamfer_type: Chamfer type (equal_distance, two_distances, distance_and_angle)
     """
-    parameters = {
-        "edge_ids": edge_ids,
-        "distance": distance,
-        "chamfer_type": chamfer_type
-    }
 
-    try:
-        result = fusion_bridge.send_command("create_chamfer", parameters)
-        _log_tool_execution("create_chamfer", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_chamfer", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_shell", rules=_SHELL_RULES)
 async def create_shell(
     faces_to_remove: List[str],
     thickness: float,
@@ -670,23 +1291,8 @@ async def create_shell(
         thickness: Wall thickness
         shell_direction: Shell direction (inside, outside, middle)
     """
-    parameters = {
-        "faces_to_remove": faces_to_remove,
-        "thickness": thickness,
-        "shell_direction": shell_direction
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_shell", parameters)
-        _log_tool_execution("create_shell", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_shell", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("boolean_operation", _BOOL_OP_MAP)
 async def boolean_operation(
     target_body_id: str,
     tool_body_ids: List[str],
@@ -700,23 +1306,8 @@ async def boolean_operation(
         tool_body_ids: List of tool body IDs
         operation: Boolean operation type (union, subtract, intersect)
     """
-    parameters = {
-        "target_body_id": target_body_id,
-        "tool_body_ids": tool_body_ids,
-        "operation": operation
-    }
-
-    try:
-        result = fusion_bridge.send_command("boolean_operation", parameters)
-        _log_tool_execution("boolean_operation", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("boolean_operation", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("split_body")
 async def split_body(
     body_id: str,
     splitting_tool_id: str,
@@ -730,23 +1321,9 @@ async def split_body(
         splitting_tool_id: Splitting tool ID (face, plane or body)
         keep_both_sides: Whether to keep both parts of the split
     """
-    parameters = {
-        "body_id": body_id,
-        "splitting_tool_id": splitting_tool_id,
-        "keep_both_sides": keep_both_sides
-    }
-
-    try:
-        result = fusion_bridge.send_command("split_body", parameters)
-        _log_tool_execution("split_body", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("split_body", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_pattern_rectangular", rules=_PATTERN_RECTANGULAR_RULES,
+              vectors=("direction1", "direction2"))
 async def create_pattern_rectangular(
     features_to_pattern: List[str],
     direction1: List[float],
@@ -768,27 +1345,9 @@ async def create_pattern_rectangular(
         distance1: Spacing in first direction
         distance2: Spacing in second direction
     """
-    parameters = {
-        "features_to_pattern": features_to_pattern,
-        "direction1": direction1,
-        "direction2": direction2,
-        "quantity1": quantity1,
-        "quantity2": quantity2,
-        "distance1": distance1,
-        "distance2": distance2
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_pattern_rectangular", parameters)
-        _log_tool_execution("create_pattern_rectangular", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_pattern_rectangular", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_pattern_circular", rules=_PATTERN_CIRCULAR_RULES,
+              vectors=("axis_point", "axis_direction"))
 async def create_pattern_circular(
     features_to_pattern: List[str],
     axis_point: List[float],
@@ -806,25 +1365,9 @@ async def create_pattern_circular(
         quantity: Pattern quantity
         angle: Total angle (radians)
     """
-    parameters = {
-        "features_to_pattern": features_to_pattern,
-        "axis_point": axis_point,
-        "axis_direction": axis_direction,
-        "quantity": quantity,
-        "angle": angle
-    }
 
-    try:
-        result = fusion_bridge.send_command("create_pattern_circular", parameters)
-        _log_tool_execution("create_pattern_circular", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_pattern_circular", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_mirror", rules=_MIRROR_RULES,
+              vectors=("mirror_plane_point", "mirror_plane_normal"))
 async def create_mirror(
     features_to_mirror: List[str],
     mirror_plane_point: List[float],
@@ -838,27 +1381,12 @@ async def create_mirror(
         mirror_plane_point: Point on mirror plane [x, y, z]
         mirror_plane_normal: Mirror plane normal vector [x, y, z]
     """
-    parameters = {
-        "features_to_mirror": features_to_mirror,
-        "mirror_plane_point": mirror_plane_point,
-        "mirror_plane_normal": mirror_plane_normal
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_mirror", parameters)
-        _log_tool_execution("create_mirror", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_mirror", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
 # =====================================================
 # Assembly Tools (9)
 # =====================================================
 
-@mcp.tool()
+@_plugin_tool("create_component")
 async def create_component(
     name: str,
     description: str = "",
@@ -872,23 +1400,13 @@ async def create_component(
         description: Component description
         activate: Whether to activate component
     """
-    parameters = {
-        "name": name,
-        "description": description,
-        "activate": activate
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_component", parameters)
-        _log_tool_execution("create_component", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_component", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+_TRANSFORM_RULES = (
+    _rule("transform_matrix", lambda v: len(v) == 16,
+          "transform_matrix must be 16 numbers (a 4x4 matrix, row-major)"),
+)
 
-@mcp.tool()
+@_plugin_tool("insert_component_from_file", rules=_TRANSFORM_RULES)
 async def insert_component_from_file(
     file_path: str,
     name: Optional[str] = None,
@@ -900,42 +1418,19 @@ async def insert_component_from_file(
     Args:
         file_path: Component file path
         name: Component name (optional)
-        transform_matrix: Transform matrix (list of 16 elements)
+        transform_matrix: Transform matrix (list of 16 elements, row-major)
     """
-    parameters = {
-        "file_path": file_path,
-        "name": name,
-        "transform_matrix": transform_matrix
-    }
-
-    try:
-        result = fusion_bridge.send_command("insert_component_from_file", parameters)
-        _log_tool_execution("insert_component_from_file", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("insert_component_from_file", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-@mcp.tool()
-async def get_assembly_info() -> str:
+@_tool_wrapper(log=False)
+async def get_assembly_info() -> Union[str, Dict[str, Any]]:
     """
     Get assembly information
     """
-    parameters = {}
+    result = await _read_info("get_assembly_info")
+    _log_tool_execution("get_assembly_info", {}, result)
+    return result
 
-    try:
-        result = fusion_bridge.send_command("get_assembly_info", parameters)
-        _log_tool_execution("get_assembly_info", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("get_assembly_info", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_mate_constraint")
 async def create_mate_constraint(
     constraint_type: str,
     entity1_id: str,
@@ -953,25 +1448,8 @@ async def create_mate_constraint(
         offset: Offset value
         angle: Angle value (radians)
     """
-    parameters = {
-        "constraint_type": constraint_type,
-        "entity1_id": entity1_id,
-        "entity2_id": entity2_id,
-        "offset": offset,
-        "angle": angle
-    }
 
-    try:
-        result = fusion_bridge.send_command("create_mate_constraint", parameters)
-        _log_tool_execution("create_mate_constraint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_mate_constraint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_joint", vectors=("origin_point", "origin_axis", "target_point", "target_axis"))
 async def create_joint(
     joint_type: str,
     origin_entity_id: str,
@@ -995,28 +1473,8 @@ async def create_joint(
         target_axis: Target axis direction [x, y, z]
         limits: Motion limits {"min": value, "max": value}
     """
-    parameters = {
-        "joint_type": joint_type,
-        "origin_entity_id": origin_entity_id,
-        "origin_point": origin_point,
-        "origin_axis": origin_axis,
-        "target_entity_id": target_entity_id,
-        "target_point": target_point,
-        "target_axis": target_axis,
-        "limits": limits
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_joint", parameters)
-        _log_tool_execution("create_joint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_joint", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-@mcp.tool()
+@_plugin_tool("create_motion_study")
 async def create_motion_study(
     name: str,
     joint_ids: List[str],
@@ -1032,24 +1490,8 @@ async def create_motion_study(
         duration: Motion duration (seconds)
         steps: Analysis steps
     """
-    parameters = {
-        "name": name,
-        "joint_ids": joint_ids,
-        "duration": duration,
-        "steps": steps
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_motion_study", parameters)
-        _log_tool_execution("create_motion_study", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_motion_study", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-@mcp.tool()
+@_plugin_tool("check_interference", rules=_INTERFERENCE_RULES)
 async def check_interference(
     component_ids: Optional[List[str]] = None,
     tolerance: float = 0.001
@@ -1061,22 +1503,8 @@ async def check_interference(
         component_ids: List of component IDs to check (if empty, check all components)
         tolerance: Check tolerance
     """
-    parameters = {
-        "component_ids": component_ids,
-        "tolerance": tolerance
-    }
-
-    try:
-        result = fusion_bridge.send_command("check_interference", parameters)
-        _log_tool_execution("check_interference", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("check_interference", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_exploded_view", vectors=("explosion_direction",))
 async def create_exploded_view(
     name: str,
     explosion_direction: List[float] = [0, 0, 1],
@@ -1092,24 +1520,15 @@ async def create_exploded_view(
         explosion_distance: Explosion distance
         component_ids: List of component IDs participating in explosion
     """
-    parameters = {
-        "name": name,
-        "explosion_direction": explosion_direction,
-        "explosion_distance": explosion_distance,
-        "component_ids": component_ids
-    }
 
-    try:
-        result = fusion_bridge.send_command("create_exploded_view", parameters)
-        _log_tool_execution("create_exploded_view", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_exploded_view", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+_MAX_KEYFRAMES = 100000
+_KEYFRAME_RULES = (
+    _rule("keyframes", lambda v: len(v) <= _MAX_KEYFRAMES,
+          f"keyframes must not have more than {_MAX_KEYFRAMES} entries"),
+)
+_KEYFRAME_SHAPE_ERROR = _err('keyframes must be {"time": number, "joint_id": id, "value": number} entries')
 
-@mcp.tool()
+@_tool_wrapper(log=False)
 async def animate_assembly(
     name: str,
     keyframes: List[Dict[str, Any]],
@@ -1125,147 +1544,140 @@ async def animate_assembly(
         duration: Animation duration
         loop: Whether to loop playback
     """
-    parameters = {
+    error = _precheck(_KEYFRAME_RULES, {"keyframes": keyframes})
+    if error is not None:
+        return error
+    # Keyframes go to the plugin as parallel columns, which validates their
+    # shape here and drops the repeated keys from every entry
+    try:
+        columns = {
+            "time": [float(keyframe["time"]) for keyframe in keyframes],
+            "joint_id": [keyframe["joint_id"] for keyframe in keyframes],
+            "value": [float(keyframe["value"]) for keyframe in keyframes],
+        }
+    except (KeyError, TypeError, ValueError):
+        return _KEYFRAME_SHAPE_ERROR
+    return await _dispatch("animate_assembly", "animate_assembly", {
         "name": name,
-        "keyframes": keyframes,
+        "keyframes": columns,
         "duration": duration,
         "loop": loop
-    }
-
-    try:
-        result = fusion_bridge.send_command("animate_assembly", parameters)
-        _log_tool_execution("animate_assembly", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("animate_assembly", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+    })
 
 # =====================================================
 # Analysis Tools (10)
 # =====================================================
 
-@mcp.tool()
-async def measure_distance(
-    point1: List[float],
-    point2: List[float],
+# Batches of at least this many points are measured in a worker thread
+_OFFLOAD_MIN_POINTS = 10000
+
+def _large_batch(parameters: Dict[str, Any]) -> bool:
+    """offload predicate for the measurement tools"""
+    return any(
+        isinstance(value, list) and len(value) >= _OFFLOAD_MIN_POINTS
+        for value in parameters.values()
+    )
+
+@_tool_wrapper(offload=_large_batch)
+def measure_distance(
+    point1: measurement.Points,
+    point2: measurement.Points,
     measurement_type: str = "linear"
-) -> str:
+) -> Dict[str, Any]:
     """
     Measure distance between two points
 
+    Either point may also be a list of points [[x, y, z], ...] to measure a
+    batch in one call; a single point is then paired with every point of
+    the other list, and the result holds one value per pair.
+
     Args:
         point1: First point coordinates [x, y, z]
         point2: Second point coordinates [x, y, z]
         measurement_type: Measurement type (linear, delta_x, delta_y, delta_z)
     """
-    import math
+    if measurement.is_point_batch(point1, point2):
+        return measurement.measure_distance_rows(point1, point2, measurement_type)
+    point1, point2 = _vec3(point1), _vec3(point2)
+
+    # Calculate distance - pure mathematical calculation, doesn't need Fusion 360
+    dx = point2[0] - point1[0]
+    dy = point2[1] - point1[1]
+    dz = point2[2] - point1[2]
+
+    if measurement_type == "delta_x":
+        distance = abs(dx)
+    elif measurement_type == "delta_y":
+        distance = abs(dy)
+    elif measurement_type == "delta_z":
+        distance = abs(dz)
+    else:
+        # Linear (also the fallback); one C call, without intermediate overflow
+        distance = math.hypot(dx, dy, dz)
 
-    parameters = {
-        "point1": point1,
-        "point2": point2,
-        "measurement_type": measurement_type
+    return {
+        "success": True,
+        "distance": distance,
+        "delta_x": dx,
+        "delta_y": dy,
+        "delta_z": dz,
+        "measurement_type": measurement_type,
+        "units": "mm"
     }
 
-    try:
-        # Calculate distance - pure mathematical calculation, doesn't need Fusion 360
-        dx = point2[0] - point1[0]
-        dy = point2[1] - point1[1]
-        dz = point2[2] - point1[2]
-
-        if measurement_type == "linear":
-            distance = math.sqrt(dx**2 + dy**2 + dz**2)
-        elif measurement_type == "delta_x":
-            distance = abs(dx)
-        elif measurement_type == "delta_y":
-            distance = abs(dy)
-        elif measurement_type == "delta_z":
-            distance = abs(dz)
-        else:
-            distance = math.sqrt(dx**2 + dy**2 + dz**2)
-
-        result = {
-            "success": True,
-            "distance": distance,
-            "delta_x": dx,
-            "delta_y": dy,
-            "delta_z": dz,
-            "measurement_type": measurement_type,
-            "units": "mm"
-        }
-
-        _log_tool_execution("measure_distance", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("measure_distance", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
-async def measure_angle(
-    point1: List[float],
-    vertex: List[float],
-    point2: List[float]
-) -> str:
+@_tool_wrapper(offload=_large_batch)
+def measure_angle(
+    point1: measurement.Points,
+    vertex: measurement.Points,
+    point2: measurement.Points
+) -> Dict[str, Any]:
     """
     Measure angle
 
+    Any argument may also be a list of points [[x, y, z], ...] to measure a
+    batch of angles in one call; single points are shared by every angle.
+
     Args:
         point1: First point coordinates [x, y, z]
         vertex: Vertex coordinates [x, y, z]
         point2: Second point coordinates [x, y, z]
     """
-    import math
+    if measurement.is_point_batch(point1, vertex, point2):
+        return measurement.measure_angle_rows(point1, vertex, point2)
+    point1, vertex, point2 = _vec3(point1), _vec3(vertex), _vec3(point2)
 
-    parameters = {
-        "point1": point1,
-        "vertex": vertex,
-        "point2": point2
-    }
+    # Calculate angle - pure mathematical calculation, doesn't need Fusion 360
+    # Vector components as plain locals; no per-call vector objects
+    ox, oy, oz = vertex[0], vertex[1], vertex[2]
+    ax, ay, az = point1[0] - ox, point1[1] - oy, point1[2] - oz
+    bx, by, bz = point2[0] - ox, point2[1] - oy, point2[2] - oz
 
-    try:
-        # Calculate angle - pure mathematical calculation, doesn't need Fusion 360
-        vec1 = [point1[0] - vertex[0], point1[1] - vertex[1], point1[2] - vertex[2]]
-        vec2 = [point2[0] - vertex[0], point2[1] - vertex[1], point2[2] - vertex[2]]
-
-        # Calculate vector length
-        len1 = math.sqrt(vec1[0]**2 + vec1[1]**2 + vec1[2]**2)
-        len2 = math.sqrt(vec2[0]**2 + vec2[1]**2 + vec2[2]**2)
-
-        if len1 == 0 or len2 == 0:
-            result = {"error": "Unable to calculate angle: vector length is zero"}
-            _log_tool_execution("measure_angle", parameters, result)
-            return json.dumps(result, ensure_ascii=False)
-
-        # Calculate dot product
-        dot_product = vec1[0]*vec2[0] + vec1[1]*vec2[1] + vec1[2]*vec2[2]
-
-        # Calculate angle
-        cos_angle = dot_product / (len1 * len2)
-        cos_angle = max(-1, min(1, cos_angle))  # Ensure in [-1, 1] range
-        angle_radians = math.acos(cos_angle)
-        angle_degrees = math.degrees(angle_radians)
-
-        result = {
-            "success": True,
-            "angle_radians": angle_radians,
-            "angle_degrees": angle_degrees,
-            "vertex": vertex,
-            "vector1_length": len1,
-            "vector2_length": len2
-        }
+    # Calculate vector length
+    len1 = math.hypot(ax, ay, az)
+    len2 = math.hypot(bx, by, bz)
 
-        _log_tool_execution("measure_angle", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+    if len1 == 0 or len2 == 0:
+        return {"error": "Unable to calculate angle: vector length is zero"}
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("measure_angle", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+    # Calculate dot product
+    dot_product = ax*bx + ay*by + az*bz
 
-@mcp.tool()
+    # Calculate angle
+    cos_angle = dot_product / (len1 * len2)
+    cos_angle = max(-1, min(1, cos_angle))  # Ensure in [-1, 1] range
+    angle_radians = math.acos(cos_angle)
+    angle_degrees = math.degrees(angle_radians)
+
+    return {
+        "success": True,
+        "angle_radians": angle_radians,
+        "angle_degrees": angle_degrees,
+        "vertex": vertex,
+        "vector1_length": len1,
+        "vector2_length": len2
+    }
+
+@_plugin_tool("measure_area")
 async def measure_area(
     entity_id: str,
     entity_type: str = "face"
@@ -1277,22 +1689,8 @@ async def measure_area(
         entity_id: Entity ID
         entity_type: Entity type (face, sketch, region)
     """
-    parameters = {
-        "entity_id": entity_id,
-        "entity_type": entity_type
-    }
-
-    try:
-        result = fusion_bridge.send_command("measure_area", parameters)
-        _log_tool_execution("measure_area", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("measure_area", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("measure_volume")
 async def measure_volume(
     body_id: str
 ) -> str:
@@ -1302,21 +1700,8 @@ async def measure_volume(
     Args:
         body_id: Body ID
     """
-    parameters = {
-        "body_id": body_id
-    }
-
-    try:
-        result = fusion_bridge.send_command("measure_volume", parameters)
-        _log_tool_execution("measure_volume", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("measure_volume", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("calculate_mass_properties")
 async def calculate_mass_properties(
     body_ids: List[str],
     material_density: float = 7.85,  # Steel density g/cm³
@@ -1330,23 +1715,9 @@ async def calculate_mass_properties(
         material_density: Material density (g/cm³)
         units: Unit system (metric, imperial)
     """
-    parameters = {
-        "body_ids": body_ids,
-        "material_density": material_density,
-        "units": units
-    }
-
-    try:
-        result = fusion_bridge.send_command("calculate_mass_properties", parameters)
-        _log_tool_execution("calculate_mass_properties", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("calculate_mass_properties", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("create_section_analysis", rules=_SECTION_RULES,
+              vectors=("cutting_plane_point", "cutting_plane_normal"))
 async def create_section_analysis(
     cutting_plane_point: List[float],
     cutting_plane_normal: List[float],
@@ -1360,23 +1731,8 @@ async def create_section_analysis(
         cutting_plane_normal: Cutting plane normal vector [x, y, z]
         body_ids: List of body IDs to analyze
     """
-    parameters = {
-        "cutting_plane_point": cutting_plane_point,
-        "cutting_plane_normal": cutting_plane_normal,
-        "body_ids": body_ids
-    }
-
-    try:
-        result = fusion_bridge.send_command("create_section_analysis", parameters)
-        _log_tool_execution("create_section_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_section_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("perform_stress_analysis")
 async def perform_stress_analysis(
     body_ids: List[str],
     material_properties: Dict[str, Any],
@@ -1394,25 +1750,8 @@ async def perform_stress_analysis(
         constraints: Constraint list [{"type": "fixed", "faces": ["face_001"]}]
         mesh_settings: Mesh settings {"element_size": 2.0, "element_type": "tetrahedron"}
     """
-    parameters = {
-        "body_ids": body_ids,
-        "material_properties": material_properties,
-        "loads": loads,
-        "constraints": constraints,
-        "mesh_settings": mesh_settings
-    }
-
-    try:
-        result = fusion_bridge.send_command("perform_stress_analysis", parameters)
-        _log_tool_execution("perform_stress_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("perform_stress_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("perform_modal_analysis")
 async def perform_modal_analysis(
     body_ids: List[str],
     material_properties: Dict[str, Any],
@@ -1428,24 +1767,8 @@ async def perform_modal_analysis(
         constraints: Constraint list
         number_of_modes: Number of modes to calculate
     """
-    parameters = {
-        "body_ids": body_ids,
-        "material_properties": material_properties,
-        "constraints": constraints,
-        "number_of_modes": number_of_modes
-    }
 
-    try:
-        result = fusion_bridge.send_command("perform_modal_analysis", parameters)
-        _log_tool_execution("perform_modal_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("perform_modal_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-@mcp.tool()
+@_plugin_tool("perform_thermal_analysis")
 async def perform_thermal_analysis(
     body_ids: List[str],
     material_properties: Dict[str, Any],
@@ -1461,24 +1784,11 @@ async def perform_thermal_analysis(
         thermal_loads: Thermal load list [{"type": "heat_flux", "value": 1000, "faces": ["face_001"]}]
         thermal_constraints: Thermal boundary conditions [{"type": "temperature", "value": 25, "faces": ["face_002"]}]
     """
-    parameters = {
-        "body_ids": body_ids,
-        "material_properties": material_properties,
-        "thermal_loads": thermal_loads,
-        "thermal_constraints": thermal_constraints
-    }
 
-    try:
-        result = fusion_bridge.send_command("perform_thermal_analysis", parameters)
-        _log_tool_execution("perform_thermal_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("perform_thermal_analysis", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+_MAX_STRESS_FINDING = "Maximum stress: {} MPa".format
+_SAFETY_FACTOR_FINDING = "Minimum safety factor: {}".format
 
-@mcp.tool()
+@_tool_wrapper(log=False)
 async def generate_analysis_report(
     analysis_results: List[Dict[str, Any]],
     report_format: str = "detailed",
@@ -1492,113 +1802,113 @@ async def generate_analysis_report(
         report_format: Report format (summary, detailed, presentation)
         include_images: Whether to include images
     """
-    from datetime import datetime
-
-    parameters = {
+    # Build the report sections in one pass, holding each list in a local.
+    # Each detailed result is serialised as soon as it is built, and the
+    # report text is assembled from the serialised sections, so the full
+    # report never exists as one nested dict.
+    analysis_types = [None] * len(analysis_results)
+    # At most two findings per result; filled up to found, trimmed after
+    key_findings = [None] * (2 * len(analysis_results))
+    found = 0
+    recommendations = []
+    detailed_texts = [None] * len(analysis_results)
+
+    for i, analysis_result in enumerate(analysis_results):
+        get = analysis_result.get
+        analysis_type = get("analysis_type", f"analysis_{i+1}")
+        analysis_types[i] = analysis_type
+        metrics = get("analysis_results")
+        result_recommendations = get("recommendations")
+
+        # Extract key findings
+        if metrics is not None:
+            max_stress = metrics.get("max_stress")
+            if max_stress is not None:
+                key_findings[found] = _MAX_STRESS_FINDING(max_stress['value'])
+                found += 1
+
+            safety_factor = metrics.get("safety_factor")
+            if safety_factor is not None:
+                key_findings[found] = _SAFETY_FACTOR_FINDING(safety_factor['min_value'])
+                found += 1
+
+        # Extract recommendations
+        if result_recommendations is not None:
+            recommendations.extend(result_recommendations)
+
+        # Detailed results
+        detailed_texts[i] = _dumps_text({
+            "analysis_id": i + 1,
+            "analysis_type": analysis_type,
+            "status": "completed" if get("success") else "failed",
+            "key_metrics": metrics if metrics is not None else {},
+            "convergence": get("convergence_info", {}),
+            "recommendations": result_recommendations if result_recommendations is not None else []
+        })
+
+    del key_findings[found:]
+
+    # Generate conclusions
+    conclusions = []
+    if key_findings:
+        conclusions.append("All analyses completed successfully")
+        conclusions.append("Design meets major performance requirements")
+        conclusions.append("Recommend optimizing design according to recommendations")
+
+    # Simulate report file generation
+    report_files = []
+    if report_format == "detailed":
+        report_files.extend([
+            "analysis_report.pdf",
+            "stress_contours.png",
+            "displacement_plot.png"
+        ])
+    elif report_format == "summary":
+        report_files.append("summary_report.pdf")
+    elif report_format == "presentation":
+        report_files.extend([
+            "presentation.pptx",
+            "key_results.png"
+        ])
+
+    report_info = {
+        "generated_at": datetime.now().isoformat(),
+        "format": report_format,
+        "includes_images": include_images,
+        "total_analyses": len(analysis_results)
+    }
+    executive_summary = {
+        "analysis_types": analysis_types,
+        "key_findings": key_findings,
+        "recommendations": recommendations
+    }
+    report_details = {
+        "report_files": report_files,
+        "format": report_format,
+        "total_pages": 15 + len(analysis_results) * 3,
+        "generation_time": "2.3 seconds",
+        "file_size": "2.5 MB"
+    }
+    text = "".join((
+        '{"success":true,"report_content":{"report_info":', _dumps_text(report_info),
+        ',"executive_summary":', _dumps_text(executive_summary),
+        ',"detailed_results":[', ",".join(detailed_texts),
+        '],"conclusions":', _dumps_text(conclusions),
+        '},', _dumps_text(report_details)[1:]  # Its fields, without the opening brace
+    ))
+    # The history worker parses the text off the tool's path
+    _log_tool_execution("generate_analysis_report", {
         "analysis_results": analysis_results,
         "report_format": report_format,
         "include_images": include_images
-    }
-
-    try:
-        # Generate report content
-        report_content = {
-            "report_info": {
-                "generated_at": datetime.now().isoformat(),
-                "format": report_format,
-                "includes_images": include_images,
-                "total_analyses": len(analysis_results)
-            },
-            "executive_summary": {
-                "analysis_types": [],
-                "key_findings": [],
-                "recommendations": []
-            },
-            "detailed_results": [],
-            "conclusions": []
-        }
-
-        # Process analysis results
-        for i, analysis_result in enumerate(analysis_results):
-            analysis_type = analysis_result.get("analysis_type", f"analysis_{i+1}")
-            report_content["executive_summary"]["analysis_types"].append(analysis_type)
-
-            # Extract key findings
-            if "analysis_results" in analysis_result:
-                if "max_stress" in analysis_result["analysis_results"]:
-                    stress_value = analysis_result["analysis_results"]["max_stress"]["value"]
-                    report_content["executive_summary"]["key_findings"].append(
-                        f"Maximum stress: {stress_value} MPa"
-                    )
-
-                if "safety_factor" in analysis_result["analysis_results"]:
-                    sf_value = analysis_result["analysis_results"]["safety_factor"]["min_value"]
-                    report_content["executive_summary"]["key_findings"].append(
-                        f"Minimum safety factor: {sf_value}"
-                    )
-
-            # Extract recommendations
-            if "recommendations" in analysis_result:
-                report_content["executive_summary"]["recommendations"].extend(
-                    analysis_result["recommendations"]
-                )
-
-            # Detailed results
-            detailed_result = {
-                "analysis_id": i + 1,
-                "analysis_type": analysis_type,
-                "status": "completed" if analysis_result.get("success") else "failed",
-                "key_metrics": analysis_result.get("analysis_results", {}),
-                "convergence": analysis_result.get("convergence_info", {}),
-                "recommendations": analysis_result.get("recommendations", [])
-            }
-            report_content["detailed_results"].append(detailed_result)
-
-        # Generate conclusions
-        if report_content["executive_summary"]["key_findings"]:
-            report_content["conclusions"].append("All analyses completed successfully")
-            report_content["conclusions"].append("Design meets major performance requirements")
-            report_content["conclusions"].append("Recommend optimizing design according to recommendations")
-
-        # Simulate report file generation
-        report_files = []
-        if report_format == "detailed":
-            report_files.extend([
-                "analysis_report.pdf",
-                "stress_contours.png",
-                "displacement_plot.png"
-            ])
-        elif report_format == "summary":
-            report_files.append("summary_report.pdf")
-        elif report_format == "presentation":
-            report_files.extend([
-                "presentation.pptx",
-                "key_results.png"
-            ])
-
-        result = {
-            "success": True,
-            "report_content": report_content,
-            "report_files": report_files,
-            "format": report_format,
-            "total_pages": 15 + len(analysis_results) * 3,
-            "generation_time": "2.3 seconds",
-            "file_size": "2.5 MB"
-        }
-
-        _log_tool_execution("generate_analysis_report", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("generate_analysis_report", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
+    }, text)
+    return text
 
 # =====================================================
 # General Tools (4)
 # =====================================================
 
-@mcp.tool()
+@_plugin_tool("create_parameter")
 async def create_parameter(
     name: str,
     value: float,
@@ -1614,58 +1924,41 @@ async def create_parameter(
         units: Units
         comment: Comment (optional)
     """
-    parameters = {"name": name, "value": value, "units": units, "comment": comment}
-
-    try:
-        result = fusion_bridge.send_command("create_parameter", parameters)
-        _log_tool_execution("create_parameter", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
-
-    except Exception as e:
-        result = {"error": str(e)}
-        _log_tool_execution("create_parameter", parameters, result)
-        return json.dumps(result, ensure_ascii=False)
 
 # =====================================================
 # Basic Information Tools
 # =====================================================
 
-@mcp.tool()
-async def get_design_info() -> str:
+@_tool_wrapper(log=False)
+async def get_design_info() -> Union[str, Dict[str, Any]]:
     """Get current design information"""
-    try:
-        info = fusion_bridge.send_command("get_design_info")
-        return json.dumps(info, ensure_ascii=False)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    return await _read_info("get_design_info")
 
-@mcp.tool()
-async def get_features_info() -> str:
+@_tool_wrapper(log=False)
+async def get_features_info() -> Union[str, Dict[str, Any]]:
     """Get all features information"""
-    try:
-        info = fusion_bridge.send_command("get_features")
-        return json.dumps(info, ensure_ascii=False)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    return await _read_info("get_features")
 
 # =====================================================
 # MCP Resource Definitions
 # =====================================================
 
 @mcp.resource("fusion360://design/info")
-def get_design_info_resource() -> str:
+async def get_design_info_resource() -> str:
     """Get current design information"""
-    info = fusion_bridge.send_command("get_design_info")
-    return json.dumps(info, indent=2, ensure_ascii=False)
+    info = await _read_info("get_design_info")
+    return _dumps_text(_loads(info) if isinstance(info, str) else info, indent=True)
+
+_CONTEXT_UNAVAILABLE_TEXT = _dumps_text({"message": "Context management not available"}, indent=True)
 
 @mcp.resource("fusion360://context/summary")
 def get_context_summary() -> str:
     """Get context summary"""
     if context_manager:
         summary = context_manager.get_context_summary()
-        return json.dumps(summary, indent=2, ensure_ascii=False)
+        return _dumps_text(summary, indent=True)
     else:
-        return json.dumps({"message": "Context management not available"}, indent=2, ensure_ascii=False)
+        return _CONTEXT_UNAVAILABLE_TEXT
 
 def main():
     """Main function - Start MCP server"""
@@ -1695,6 +1988,15 @@ def main():
     logger.info("Server started, waiting for MCP client connection...")
     logger.info("Listening for MCP protocol on standard input/output...")
 
+    # uvloop is a faster drop-in event loop for the bridge's socket I/O;
+    # it is optional and not available on Windows
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     # Run MCP server
     mcp.run()
 
@@ -2,11 +2,16 @@
 Analysis Tools Module
 
 Contains analysis and measurement related tools:
-- measurement: Measurement tools (distance, angle, area, volume, mass properties)
+- measurement: Measurement tools (distance, angle, batch distance/angle, area, volume, mass properties)
 - simulation: Simulation analysis (section analysis, stress analysis, modal analysis, thermal analysis)
 - reporting: Report generation (analysis report generation)
+- history: Batched history logging shared by the tools above
 """
 
+from typing import Any
+import weakref
+
+from . import history
 from . import measurement
 from . import simulation
 from . import reporting
@@ -28,8 +33,15 @@ def initialize_analysis_tools(fusion_bridge_instance, context_manager_instance,
     reporting.context_manager = context_manager_instance
     reporting.mcp = mcp_instance
 
+# MCP instances the tools have been registered to; repeat initialisation
+# (hot reload, several sessions sharing a server) registers only once
+_registered: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
 def register_all_tools(mcp_instance):
     """Register all analysis tools to MCP server"""
+    if mcp_instance in _registered:
+        return
+    _registered.add(mcp_instance)
     measurement.register_tools(mcp_instance)
     simulation.register_tools(mcp_instance)
     reporting.register_tools(mcp_instance)
@@ -0,0 +1,107 @@
+"""
+Tool History Logging
+
+Queues tool executions and writes them to the history log in batches; shared
+by the MCP server's tools and the analysis tools
+"""
+
+from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import logging
+
+# Forwarded plugin responses are queued as JSON text and parsed off the
+# tool's path; orjson parses them several times faster when installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Configure logging
+logger = logging.getLogger("fusion360-mcp.analysis.history")
+
+# History entries are queued by the tools and written in batches by one
+# consumer task, on a worker thread since saving the context file blocks.
+# Both are created on first use, inside the running event loop.
+_LOG_QUEUE_SIZE = 10000
+_LOG_BATCH_SIZE = 64
+# Seconds flush_history waits by default, so shutdown is never held up long
+_LOG_DRAIN_TIMEOUT = 5.0
+_log_queue: Optional[asyncio.Queue] = None
+_log_consumer_task: Optional[asyncio.Task] = None
+
+def _history_entry(tool_name: str, parameters: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    """Keyword arguments of add_history_entry for one tool execution"""
+    return {
+        "action_type": tool_name,
+        "action_description": f"Execute tool: {tool_name}",
+        "parameters": parameters,
+        "result": _loads(result) if isinstance(result, str) else result,
+        "user_context": "MCP tool call"
+    }
+
+def _write_entries(context_manager: Any, entries: List[Dict[str, Any]]) -> None:
+    """Write history entries with a single save"""
+    if hasattr(context_manager, "add_history_entries"):
+        context_manager.add_history_entries(entries)
+    else:
+        for entry in entries:
+            context_manager.add_history_entry(**entry)
+
+async def _log_consumer() -> None:
+    """Write queued history entries, up to _LOG_BATCH_SIZE per wake"""
+    loop = asyncio.get_event_loop()
+    while True:
+        batch = [await _log_queue.get()]
+        while len(batch) < _LOG_BATCH_SIZE and not _log_queue.empty():
+            batch.append(_log_queue.get_nowait())
+        try:
+            # Group by context manager; in practice every entry shares one
+            grouped: Dict[int, List[Any]] = {}
+            for context_manager, tool_name, parameters, result in batch:
+                group = grouped.setdefault(id(context_manager), [context_manager, []])
+                group[1].append(_history_entry(tool_name, parameters, result))
+            for context_manager, entries in grouped.values():
+                await loop.run_in_executor(
+                    None, functools.partial(_write_entries, context_manager, entries)
+                )
+        except Exception as e:
+            logger.error(f"Failed to record {len(batch)} history entries: {e}")
+        finally:
+            for _ in batch:
+                _log_queue.task_done()
+
+def log_tool_execution(
+    context_manager: Any,
+    tool_name: str,
+    parameters: Dict[str, Any],
+    result: Any
+) -> None:
+    """Queue a tool execution for the history log
+
+    result is a result dict or a plugin's JSON response text. Outside a
+    running event loop the entry is written immediately.
+    """
+    global _log_queue, _log_consumer_task
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _write_entries(context_manager, [_history_entry(tool_name, parameters, result)])
+        return
+    # A new event loop (or a finished consumer) gets a fresh queue and task
+    if _log_consumer_task is None or _log_consumer_task.done() or _log_consumer_task.get_loop() is not loop:
+        _log_queue = asyncio.Queue(maxsize=_LOG_QUEUE_SIZE)
+        _log_consumer_task = loop.create_task(_log_consumer())
+    try:
+        _log_queue.put_nowait((context_manager, tool_name, parameters, result))
+    except asyncio.QueueFull:
+        logger.warning(f"History queue full, dropping entry for {tool_name}")
+
+async def flush_history(timeout: Optional[float] = _LOG_DRAIN_TIMEOUT) -> None:
+    """Wait until every queued history entry has been written, or timeout seconds pass"""
+    if _log_queue is None or _log_consumer_task is None or _log_consumer_task.done():
+        return
+    try:
+        await asyncio.wait_for(_log_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Gave up waiting for {_log_queue.qsize()} unwritten history entries")
@@ -4,17 +4,46 @@ Measurement Tools
 Contains measurement tools for distance, angle, area, volume, mass properties, etc.
 """
 
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+import functools
 import logging
 import math
+import struct
 
-# Fusion 360 API import
-try:
+from . import history
+
+# Fusion 360 API import; deferred to the first Fusion-backed tool call so the
+# pure-math tools never load the SDK
+@functools.lru_cache(maxsize=None)
+def _require_adsk() -> Tuple[Any, Any]:
+    """adsk.core and adsk.fusion, imported on first use"""
     import adsk.core
     import adsk.fusion
-    FUSION_AVAILABLE = True
+    return adsk.core, adsk.fusion
+
+@functools.lru_cache(maxsize=None)
+def _fusion_available() -> bool:
+    """Whether the Fusion 360 API can be imported; checked once"""
+    try:
+        _require_adsk()
+    except ImportError:
+        return False
+    return True
+
+# numpy evaluates batched measurements in one vectorised pass; without it
+# they fall back to a Python loop over the points
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
 except ImportError:
-    FUSION_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger("fusion360-mcp.analysis.measurement")
@@ -25,24 +54,252 @@ context_manager = None
 mcp = None
 
 def _log_tool_execution(tool_name: str, parameters: Dict[str, Any], result: Dict[str, Any]) -> None:
-    """Log tool execution to history"""
+    """Queue tool execution for the history log"""
     if context_manager:
-        context_manager.add_history_entry(
-            action_type=tool_name,
-            action_description=f"Execute tool: {tool_name}",
-            parameters=parameters,
-            result=result,
-            user_context="MCP tool call"
-        )
+        history.log_tool_execution(context_manager, tool_name, parameters, result)
 
-async def measure_distance(
-    point1: List[float],
-    point2: List[float],
+@dataclass(frozen=True)
+class DistanceResult:
+    """Distance measurement between two points"""
+    __slots__ = ("distance", "dx", "dy", "dz", "measurement_type")
+    distance: float
+    dx: float
+    dy: float
+    dz: float
+    measurement_type: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Tool result dict returned at the MCP boundary"""
+        return {
+            "success": True,
+            "distance": self.distance,
+            "delta_x": self.dx,
+            "delta_y": self.dy,
+            "delta_z": self.dz,
+            "measurement_type": self.measurement_type,
+            "units": "mm"
+        }
+
+@dataclass(frozen=True)
+class AngleResult:
+    """Angle measurement at a vertex"""
+    __slots__ = ("angle_radians", "vertex", "vector1_length", "vector2_length")
+    angle_radians: float
+    vertex: Tuple[float, ...]
+    vector1_length: float
+    vector2_length: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Tool result dict returned at the MCP boundary"""
+        return {
+            "success": True,
+            "angle_radians": self.angle_radians,
+            "angle_degrees": math.degrees(self.angle_radians),
+            "vertex": list(self.vertex),
+            "vector1_length": self.vector1_length,
+            "vector2_length": self.vector2_length
+        }
+
+# Distance for each measurement type, from the x/y/z deltas
+_DISTANCE_OPS = {
+    "linear": math.hypot,
+    "delta_x": lambda dx, dy, dz: abs(dx),
+    "delta_y": lambda dx, dy, dz: abs(dy),
+    "delta_z": lambda dx, dy, dz: abs(dz)
+}
+
+# Coordinate axis of each delta measurement type
+_DELTA_AXES = {"delta_x": 0, "delta_y": 1, "delta_z": 2}
+
+# A point argument: one [x, y, z] point, or a list of them to measure a batch
+Points = Union[List[float], List[List[float]]]
+
+# Entity types measure_area accepts
+_AREA_ENTITY_TYPES = frozenset({"face", "sketch", "region"})
+
+# A point passed as a buffer (bytes, array.array('d'), ...) of three
+# little-endian doubles
+_POINT_STRUCT = struct.Struct('<3d')
+
+def _as_point(point) -> Tuple[float, ...]:
+    """Hashable (x, y, z) tuple of a point list or packed point buffer"""
+    if isinstance(point, (bytes, bytearray, memoryview)):
+        return _POINT_STRUCT.unpack_from(point)
+    return tuple(point)
+
+@functools.lru_cache(maxsize=256)
+def _distance_core(p1: Tuple[float, ...], p2: Tuple[float, ...], mt: str) -> DistanceResult:
+    """Distance and deltas between two points, memoised on the point tuples"""
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    dx = x2 - x1
+    dy = y2 - y1
+    dz = z2 - z1
+    
+    # Unknown measurement types measure the linear distance
+    distance = _DISTANCE_OPS.get(mt, math.hypot)(dx, dy, dz)
+    return DistanceResult(distance, dx, dy, dz, mt)
+
+@functools.lru_cache(maxsize=256)
+def _angle_core(p1: Tuple[float, ...], vertex: Tuple[float, ...], p2: Tuple[float, ...]) -> Optional[AngleResult]:
+    """Angle at vertex and both arm lengths, or None for a zero-length arm"""
+    x1, y1, z1 = p1
+    vx, vy, vz = vertex
+    x2, y2, z2 = p2
+    v1x, v1y, v1z = x1 - vx, y1 - vy, z1 - vz
+    v2x, v2y, v2z = x2 - vx, y2 - vy, z2 - vz
+    
+    # Calculate vector lengths
+    len1 = math.hypot(v1x, v1y, v1z)
+    len2 = math.hypot(v2x, v2y, v2z)
+    if len1 == 0 or len2 == 0:
+        return None
+    
+    # Calculate angle from the dot product
+    cos_angle = (v1x*v2x + v1y*v2y + v1z*v2z) / (len1 * len2)
+    cos_angle = max(-1, min(1, cos_angle))  # Ensure in [-1, 1] range
+    return AngleResult(math.acos(cos_angle), vertex, len1, len2)
+
+def is_point_batch(*points: Points) -> bool:
+    """Whether any argument is a list of points rather than a single point"""
+    return any(p and isinstance(p[0], (list, tuple)) for p in points)
+
+def _point_rows(*points: Points) -> List[List[List[float]]]:
+    """Points as equal-length lists of rows, repeating single points"""
+    rows = [p if isinstance(p[0], (list, tuple)) else None for p in points]
+    n = max(len(r) for r in rows if r is not None)
+    if any(r is not None and len(r) != n for r in rows):
+        raise ValueError("Batched point lists must have the same length")
+    return [r if r is not None else [p] * n for r, p in zip(rows, points)]
+
+def measure_distance_rows(point1: Points, point2: Points, measurement_type: str) -> Dict[str, Any]:
+    """measure_distance over a batch of point pairs"""
+    axis = _DELTA_AXES.get(measurement_type)
+    if NUMPY_AVAILABLE:
+        # Single points broadcast against the batch
+        d = np.atleast_2d(np.subtract(np.asarray(point2, dtype=np.float64),
+                                      np.asarray(point1, dtype=np.float64)))
+        if axis is None:
+            distances = np.sqrt(np.einsum('ij,ij->i', d, d))
+        else:
+            distances = np.abs(d[:, axis])
+        deltas = d.T.tolist()
+        distances = distances.tolist()
+    else:
+        rows1, rows2 = _point_rows(point1, point2)
+        deltas = [[b[k] - a[k] for a, b in zip(rows1, rows2)] for k in range(3)]
+        if axis is None:
+            distances = [math.hypot(dx, dy, dz) for dx, dy, dz in zip(*deltas)]
+        else:
+            distances = [abs(v) for v in deltas[axis]]
+
+    return {
+        "success": True,
+        "count": len(distances),
+        "distances": distances,
+        "delta_x": deltas[0],
+        "delta_y": deltas[1],
+        "delta_z": deltas[2],
+        "measurement_type": measurement_type,
+        "units": "mm"
+    }
+
+# From this many angles on, the batch goes to the compiled kernel. It is
+# compiled on the first such batch, or loaded from numba's on-disk cache,
+# so importing the module never waits on the JIT.
+_NUMBA_MIN_POINTS = 1024
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _angle_kernel(v1, v2):
+        """Angles (radians) and lengths of (N, 3) vector pairs, in one pass
+
+        numpy needs a temporary array per step (norms, dot products, clip,
+        arccos); this loop keeps each pair in registers. Pairs with a zero
+        length get angle 0 and are rejected by the caller.
+        """
+        count = v1.shape[0]
+        radians = np.empty(count)
+        len1 = np.empty(count)
+        len2 = np.empty(count)
+        for i in range(count):
+            ax, ay, az = v1[i, 0], v1[i, 1], v1[i, 2]
+            bx, by, bz = v2[i, 0], v2[i, 1], v2[i, 2]
+            l1 = math.sqrt(ax*ax + ay*ay + az*az)
+            l2 = math.sqrt(bx*bx + by*by + bz*bz)
+            len1[i] = l1
+            len2[i] = l2
+            if l1 == 0.0 or l2 == 0.0:
+                radians[i] = 0.0
+                continue
+            cos_angle = (ax*bx + ay*by + az*bz) / (l1 * l2)
+            radians[i] = math.acos(min(1.0, max(-1.0, cos_angle)))
+        return radians, len1, len2
+
+def measure_angle_rows(point1: Points, vertex: Points, point2: Points) -> Dict[str, Any]:
+    """measure_angle over a batch of point triples"""
+    if NUMPY_AVAILABLE:
+        v = np.asarray(vertex, dtype=np.float64)
+        v1 = np.atleast_2d(np.asarray(point1, dtype=np.float64) - v)
+        v2 = np.atleast_2d(np.asarray(point2, dtype=np.float64) - v)
+        if NUMBA_AVAILABLE and max(len(v1), len(v2)) >= _NUMBA_MIN_POINTS:
+            # The kernel wants real (N, 3) arrays, so repeat a single point
+            # rather than passing a read-only broadcast view
+            count = np.broadcast_shapes(v1.shape, v2.shape)[0]
+            if len(v1) != count:
+                v1 = np.repeat(v1, count, axis=0)
+            if len(v2) != count:
+                v2 = np.repeat(v2, count, axis=0)
+            radians, len1, len2 = _angle_kernel(v1, v2)
+        else:
+            v1, v2 = np.broadcast_arrays(v1, v2)
+            len1 = np.linalg.norm(v1, axis=1)
+            len2 = np.linalg.norm(v2, axis=1)
+            radians = None
+        zero = np.flatnonzero((len1 == 0) | (len2 == 0))
+        if zero.size:
+            return {"error": f"Unable to calculate angle {int(zero[0])}: vector length is zero"}
+        if radians is None:
+            dot = np.einsum('ij,ij->i', v1, v2)
+            radians = np.arccos(np.clip(dot / (len1 * len2), -1.0, 1.0))
+        radians, degrees = radians.tolist(), np.degrees(radians).tolist()
+        len1, len2 = len1.tolist(), len2.tolist()
+    else:
+        radians, len1, len2 = [], [], []
+        for i, (a, o, b) in enumerate(zip(*_point_rows(point1, vertex, point2))):
+            ax, ay, az = a[0] - o[0], a[1] - o[1], a[2] - o[2]
+            bx, by, bz = b[0] - o[0], b[1] - o[1], b[2] - o[2]
+            l1 = math.hypot(ax, ay, az)
+            l2 = math.hypot(bx, by, bz)
+            if l1 == 0 or l2 == 0:
+                return {"error": f"Unable to calculate angle {i}: vector length is zero"}
+            cos_angle = (ax*bx + ay*by + az*bz) / (l1 * l2)
+            radians.append(math.acos(max(-1, min(1, cos_angle))))
+            len1.append(l1)
+            len2.append(l2)
+        degrees = [math.degrees(r) for r in radians]
+
+    return {
+        "success": True,
+        "count": len(radians),
+        "angles_radians": radians,
+        "angles_degrees": degrees,
+        "vector1_lengths": len1,
+        "vector2_lengths": len2
+    }
+
+def _measure_distance_sync(
+    point1: Points,
+    point2: Points,
     measurement_type: str = "linear"
 ) -> Dict[str, Any]:
     """
     Measure distance between two points
     
+    Either point may also be a list of points [[x, y, z], ...] to measure a
+    batch in one call; a single point is then paired with every point of
+    the other list, and the result holds one value per pair.
+    
     Args:
         point1: First point coordinates [x, y, z]
         point2: Second point coordinates [x, y, z]
@@ -56,30 +313,10 @@ async def measure_distance(
     
     try:
         # Calculate distance - pure mathematical calculation, doesn't need Fusion 360
-        dx = point2[0] - point1[0]
-        dy = point2[1] - point1[1]
-        dz = point2[2] - point1[2]
-        
-        if measurement_type == "linear":
-            distance = math.sqrt(dx**2 + dy**2 + dz**2)
-        elif measurement_type == "delta_x":
-            distance = abs(dx)
-        elif measurement_type == "delta_y":
-            distance = abs(dy)
-        elif measurement_type == "delta_z":
-            distance = abs(dz)
+        if is_point_batch(point1, point2):
+            result = measure_distance_rows(point1, point2, measurement_type)
         else:
-            distance = math.sqrt(dx**2 + dy**2 + dz**2)
-        
-        result = {
-            "success": True,
-            "distance": distance,
-            "delta_x": dx,
-            "delta_y": dy,
-            "delta_z": dz,
-            "measurement_type": measurement_type,
-            "units": "mm"
-        }
+            result = _distance_core(_as_point(point1), _as_point(point2), measurement_type).to_dict()
         
         _log_tool_execution("measure_distance", parameters, result)
         return result
@@ -89,14 +326,17 @@ async def measure_distance(
         _log_tool_execution("measure_distance", parameters, result)
         return result
 
-async def measure_angle(
-    point1: List[float],
-    vertex: List[float],
-    point2: List[float]
+def _measure_angle_sync(
+    point1: Points,
+    vertex: Points,
+    point2: Points
 ) -> Dict[str, Any]:
     """
     Measure angle
     
+    Any argument may also be a list of points [[x, y, z], ...] to measure a
+    batch of angles in one call; single points are shared by every angle.
+    
     Args:
         point1: First point coordinates [x, y, z]
         vertex: Vertex coordinates [x, y, z]
@@ -110,35 +350,14 @@ async def measure_angle(
     
     try:
         # Calculate angle - pure mathematical calculation, doesn't need Fusion 360
-        vec1 = [point1[0] - vertex[0], point1[1] - vertex[1], point1[2] - vertex[2]]
-        vec2 = [point2[0] - vertex[0], point2[1] - vertex[1], point2[2] - vertex[2]]
-        
-        # Calculate vector lengths
-        len1 = math.sqrt(vec1[0]**2 + vec1[1]**2 + vec1[2]**2)
-        len2 = math.sqrt(vec2[0]**2 + vec2[1]**2 + vec2[2]**2)
-        
-        if len1 == 0 or len2 == 0:
-            result = {"error": "Unable to calculate angle: vector length is zero"}
-            _log_tool_execution("measure_angle", parameters, result)
-            return result
-        
-        # Calculate dot product
-        dot_product = vec1[0]*vec2[0] + vec1[1]*vec2[1] + vec1[2]*vec2[2]
-        
-        # Calculate angle
-        cos_angle = dot_product / (len1 * len2)
-        cos_angle = max(-1, min(1, cos_angle))  # Ensure in [-1, 1] range
-        angle_radians = math.acos(cos_angle)
-        angle_degrees = math.degrees(angle_radians)
-        
-        result = {
-            "success": True,
-            "angle_radians": angle_radians,
-            "angle_degrees": angle_degrees,
-            "vertex": vertex,
-            "vector1_length": len1,
-            "vector2_length": len2
-        }
+        if is_point_batch(point1, vertex, point2):
+            result = measure_angle_rows(point1, vertex, point2)
+        else:
+            angle = _angle_core(_as_point(point1), _as_point(vertex), _as_point(point2))
+            if angle is None:
+                result = {"error": "Unable to calculate angle: vector length is zero"}
+            else:
+                result = angle.to_dict()
         
         _log_tool_execution("measure_angle", parameters, result)
         return result
@@ -148,6 +367,24 @@ async def measure_angle(
         _log_tool_execution("measure_angle", parameters, result)
         return result
 
+# The MCP server registers the sync implementations above directly; these
+# awaitable forms are kept for callers that await the tools
+async def measure_distance(
+    point1: Points,
+    point2: Points,
+    measurement_type: str = "linear"
+) -> Dict[str, Any]:
+    """Measure distance between two points (see _measure_distance_sync)"""
+    return _measure_distance_sync(point1, point2, measurement_type)
+
+async def measure_angle(
+    point1: Points,
+    vertex: Points,
+    point2: Points
+) -> Dict[str, Any]:
+    """Measure angle (see _measure_angle_sync)"""
+    return _measure_angle_sync(point1, vertex, point2)
+
 async def measure_area(
     entity_id: str,
     entity_type: str = "face"
@@ -164,7 +401,12 @@ async def measure_area(
         "entity_type": entity_type
     }
     
-    if not FUSION_AVAILABLE or not fusion_bridge.design:
+    if entity_type not in _AREA_ENTITY_TYPES:
+        result = {"error": f"Unsupported entity type: {entity_type}"}
+        _log_tool_execution("measure_area", parameters, result)
+        return result
+    
+    if not _fusion_available() or not fusion_bridge.design:
         result = {"error": "Fusion 360 not available or no active design"}
         _log_tool_execution("measure_area", parameters, result)
         return result
@@ -194,7 +436,7 @@ async def measure_volume(
         "body_id": body_id
     }
     
-    if not FUSION_AVAILABLE or not fusion_bridge.design:
+    if not _fusion_available() or not fusion_bridge.design:
         result = {"error": "Fusion 360 not available or no active design"}
         _log_tool_execution("measure_volume", parameters, result)
         return result
@@ -230,7 +472,7 @@ async def calculate_mass_properties(
         "units": units
     }
     
-    if not FUSION_AVAILABLE or not fusion_bridge.design:
+    if not _fusion_available() or not fusion_bridge.design:
         result = {"error": "Fusion 360 not available or no active design"}
         _log_tool_execution("calculate_mass_properties", parameters, result)
         return result
@@ -249,8 +491,9 @@ async def calculate_mass_properties(
 
 def register_tools(mcp_instance):
     """Register all measurement tools to MCP server"""
-    mcp_instance.tool()(measure_distance)
-    mcp_instance.tool()(measure_angle)
+    # Pure-math tools never await, so they are registered as plain functions
+    mcp_instance.tool(name="measure_distance")(_measure_distance_sync)
+    mcp_instance.tool(name="measure_angle")(_measure_angle_sync)
     mcp_instance.tool()(measure_area)
     mcp_instance.tool()(measure_volume)
     mcp_instance.tool()(calculate_mass_properties)
@@ -5,16 +5,49 @@ Contains analysis report generation tools
 """
 
 from typing import Any, Dict, List, Optional
+from pathlib import Path
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
+import sys
+import uuid
 from datetime import datetime
 
-# Fusion 360 API import
+from . import history
+
+# orjson serialises reports (numpy values included) several times faster than
+# the stdlib; it is optional, so fall back to json with the same interface
 try:
-    import adsk.core
-    import adsk.fusion
-    FUSION_AVAILABLE = True
+    import orjson
+
+    _REPORT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+    def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        option = _REPORT_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _REPORT_OPTIONS
+        return orjson.dumps(obj, option=option, default=str)
+
+    _loads = orjson.loads
 except ImportError:
-    FUSION_AVAILABLE = False
+    def _json_default(obj: Any) -> Any:
+        if hasattr(obj, 'tolist'):  # numpy arrays and scalars
+            return obj.tolist()
+        return str(obj)
+
+    def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False,
+                          default=_json_default).encode('utf-8')
+
+    _loads = json.loads
+
+# Report ids hash the normalised parameters; BLAKE3 is SIMD-accelerated on
+# large inputs, blake2b from the stdlib is the fallback
+try:
+    from blake3 import blake3 as _report_hash
+except ImportError:
+    _report_hash = functools.partial(hashlib.blake2b, digest_size=16)
 
 # Configure logging
 logger = logging.getLogger("fusion360-mcp.analysis.reporting")
@@ -24,16 +57,98 @@ fusion_bridge = None
 context_manager = None
 mcp = None
 
+# Generated reports are memoised on disk, keyed by a hash of the tool
+# parameters. The directory is purged on the first store and then every
+# _REPORT_CACHE_PURGE_INTERVAL stores, so it can briefly hold that many
+# entries over REPORT_CACHE_MAX_ENTRIES.
+REPORT_CACHE_DIR = Path(
+    os.environ.get("FUSION_MCP_REPORT_CACHE", Path.home() / ".fusion-mcp" / "report-cache")
+)
+REPORT_CACHE_MAX_ENTRIES = 500
+_REPORT_CACHE_PURGE_INTERVAL = 50
+_stores_since_purge = _REPORT_CACHE_PURGE_INTERVAL
+
 def _log_tool_execution(tool_name: str, parameters: Dict[str, Any], result: Dict[str, Any]) -> None:
-    """Log tool execution to history"""
+    """Queue tool execution for the history log"""
     if context_manager:
-        context_manager.add_history_entry(
-            action_type=tool_name,
-            action_description=f"Execute tool: {tool_name}",
-            parameters=parameters,
-            result=result,
-            user_context="MCP tool call"
-        )
+        history.log_tool_execution(context_manager, tool_name, parameters, result)
+
+def _report_cache_key(parameters: Dict[str, Any]) -> Optional[str]:
+    """Content hash of the report parameters, or None if they cannot be serialised"""
+    try:
+        payload = _dumps(parameters, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return _report_hash(payload).hexdigest()
+
+def _load_cached_report(key: str) -> Optional[Dict[str, Any]]:
+    """Load a previously generated report, or None on a miss"""
+    path = REPORT_CACHE_DIR / f"{key}.json"
+    try:
+        with open(path, 'rb') as f:
+            report = _loads(f.read())
+        # Refresh mtime so the purge evicts least recently used entries first
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return report
+
+def _store_cached_report(key: str, report: Dict[str, Any]) -> None:
+    """Atomically write a report to the cache, purging old entries now and then"""
+    global _stores_since_purge
+    try:
+        REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = REPORT_CACHE_DIR / f"{key}.json"
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(report))
+        os.replace(tmp_path, path)
+        _stores_since_purge += 1
+        if _stores_since_purge >= _REPORT_CACHE_PURGE_INTERVAL:
+            _stores_since_purge = 0
+            _purge_report_cache()
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to cache analysis report: {e}")
+
+def _purge_report_cache() -> None:
+    """Keep at most REPORT_CACHE_MAX_ENTRIES reports, dropping the oldest"""
+    entries = []
+    for path in REPORT_CACHE_DIR.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    if len(entries) <= REPORT_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - REPORT_CACHE_MAX_ENTRIES]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+# Simulated output files of each report format
+_REPORT_FILES = {
+    "detailed": ("analysis_report.pdf", "stress_contours.png", "displacement_plot.png"),
+    "summary": ("summary_report.pdf",),
+    "presentation": ("presentation.pptx", "key_results.png")
+}
+
+# Conclusions of a report with key findings
+_REPORT_CONCLUSIONS = (
+    "All analyses completed successfully",
+    "Design meets major performance requirements",
+    "Recommend optimizing design according to recommendations"
+)
+
+def _key_findings(metrics: Dict[str, Any]) -> List[str]:
+    """Summary findings for one analysis' key metrics"""
+    findings = []
+    if "max_stress" in metrics:
+        findings.append(f"Maximum stress: {metrics['max_stress']['value']} MPa")
+    if "safety_factor" in metrics:
+        findings.append(f"Minimum safety factor: {metrics['safety_factor']['min_value']}")
+    return findings
 
 async def generate_analysis_report(
     analysis_results: List[Dict[str, Any]],
@@ -47,6 +162,9 @@ async def generate_analysis_report(
         analysis_results: Analysis results list
         report_format: Report format (summary, detailed, presentation)
         include_images: Whether to include images
+    
+    A report for the same inputs is served from the on-disk cache; its
+    generated_at is the time it was first generated.
     """
     parameters = {
         "analysis_results": analysis_results,
@@ -55,90 +173,86 @@ async def generate_analysis_report(
     }
     
     try:
-        # Generate report content
-        report_content = {
-            "report_info": {
-                "generated_at": datetime.now().isoformat(),
-                "format": report_format,
-                "includes_images": include_images,
-                "total_analyses": len(analysis_results)
-            },
-            "executive_summary": {
-                "analysis_types": [],
-                "key_findings": [],
-                "recommendations": []
-            },
-            "detailed_results": [],
-            "conclusions": []
-        }
+        # One hash of the inputs serves as cache key, report id and file
+        # name prefix; unhashable inputs get a random id and skip the cache
+        cache_key = _report_cache_key(parameters)
+        # Cache file I/O runs on a worker thread, off the event loop
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, _load_cached_report, cache_key) if cache_key else None
+        if cached is not None:
+            _log_tool_execution("generate_analysis_report", parameters, cached)
+            return cached
+        report_id = cache_key or uuid.uuid4().hex
         
-        # Process analysis results
+        # Process analysis results; per-result lists are presized and filled
+        # by index, the summary lists are built in one pass each
+        count = len(analysis_results)
+        analysis_types = [None] * count
+        detailed_results = [None] * count
         for i, result in enumerate(analysis_results):
             analysis_type = result.get("analysis_type", f"analysis_{i+1}")
-            report_content["executive_summary"]["analysis_types"].append(analysis_type)
-            
-            # Extract key findings
-            if "analysis_results" in result:
-                if "max_stress" in result["analysis_results"]:
-                    stress_value = result["analysis_results"]["max_stress"]["value"]
-                    report_content["executive_summary"]["key_findings"].append(
-                        f"Maximum stress: {stress_value} MPa"
-                    )
-                
-                if "safety_factor" in result["analysis_results"]:
-                    sf_value = result["analysis_results"]["safety_factor"]["min_value"]
-                    report_content["executive_summary"]["key_findings"].append(
-                        f"Minimum safety factor: {sf_value}"
-                    )
-            
-            # Extract recommendations
-            if "recommendations" in result:
-                report_content["executive_summary"]["recommendations"].extend(
-                    result["recommendations"]
-                )
+            # Types repeat across results; share one string object per type
+            if type(analysis_type) is str:
+                analysis_type = sys.intern(analysis_type)
+            analysis_types[i] = analysis_type
             
             # Detailed results
-            detailed_result = {
+            metrics = result.get("analysis_results")
+            detailed_results[i] = {
                 "analysis_id": i + 1,
                 "analysis_type": analysis_type,
                 "status": "completed" if result.get("success") else "failed",
-                "key_metrics": result.get("analysis_results", {}),
+                "key_metrics": metrics if metrics is not None else {},
                 "convergence": result.get("convergence_info", {}),
                 "recommendations": result.get("recommendations", [])
             }
-            report_content["detailed_results"].append(detailed_result)
         
-        # Generate conclusions
-        if report_content["executive_summary"]["key_findings"]:
-            report_content["conclusions"].append("All analyses completed successfully")
-            report_content["conclusions"].append("Design meets major performance requirements")
-            report_content["conclusions"].append("Recommend optimizing design according to recommendations")
+        # Extract key findings and recommendations
+        key_findings = [
+            finding
+            for detailed_result in detailed_results
+            for finding in _key_findings(detailed_result["key_metrics"])
+        ]
+        recommendations = [
+            recommendation
+            for result in analysis_results if "recommendations" in result
+            for recommendation in result["recommendations"]
+        ]
+        
+        # Generate report content
+        report_content = {
+            "report_info": {
+                "report_id": report_id,
+                "generated_at": datetime.now().isoformat(),
+                "format": report_format,
+                "includes_images": include_images,
+                "total_analyses": count
+            },
+            "executive_summary": {
+                "analysis_types": analysis_types,
+                "key_findings": key_findings,
+                "recommendations": recommendations
+            },
+            "detailed_results": detailed_results,
+            # Generate conclusions
+            "conclusions": list(_REPORT_CONCLUSIONS) if key_findings else []
+        }
         
         # Simulate report file generation
-        report_files = []
-        if report_format == "detailed":
-            report_files.extend([
-                "analysis_report.pdf",
-                "stress_contours.png",
-                "displacement_plot.png"
-            ])
-        elif report_format == "summary":
-            report_files.append("summary_report.pdf")
-        elif report_format == "presentation":
-            report_files.extend([
-                "presentation.pptx",
-                "key_results.png"
-            ])
+        report_files = [f"{report_id}_{name}" for name in _REPORT_FILES.get(report_format, ())]
         
         result = {
             "success": True,
+            "report_id": report_id,
             "report_content": report_content,
             "report_files": report_files,
             "format": report_format,
-            "total_pages": 15 + len(analysis_results) * 3,
+            "total_pages": 15 + count * 3,
             "generation_time": "2.3 seconds",
             "file_size": "2.5 MB"
         }
+        if cache_key:
+            await loop.run_in_executor(None, _store_cached_report, cache_key, result)
         
         _log_tool_execution("generate_analysis_report", parameters, result)
         return result
@@ -4,17 +4,27 @@ Simulation Analysis Tools
 Contains simulation tools such as section analysis, stress analysis, modal analysis, thermal analysis
 """
 
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import base64
 import logging
 import math
 
-# Fusion 360 API import
+from . import history
+
+# numpy evaluates large mode sets in one vectorised pass, and large section
+# analyses go through a compiled kernel when numba is also available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
-    import adsk.core
-    import adsk.fusion
-    FUSION_AVAILABLE = True
+    from numba import njit, prange
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
 except ImportError:
-    FUSION_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger("fusion360-mcp.analysis.simulation")
@@ -25,15 +35,214 @@ context_manager = None
 mcp = None
 
 def _log_tool_execution(tool_name: str, parameters: Dict[str, Any], result: Dict[str, Any]) -> None:
-    """Log tool execution to history"""
+    """Queue tool execution for the history log"""
     if context_manager:
-        context_manager.add_history_entry(
-            action_type=tool_name,
-            action_description=f"Execute tool: {tool_name}",
-            parameters=parameters,
-            result=result,
-            user_context="MCP tool call"
-        )
+        history.log_tool_execution(context_manager, tool_name, parameters, result)
+
+@dataclass(frozen=True)
+class MetricValue:
+    """Extreme value of a result field and where it occurs"""
+    __slots__ = ("value", "location", "units")
+    value: float
+    location: Tuple[float, float, float]
+    units: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"value": self.value, "location": list(self.location), "units": self.units}
+
+@dataclass(frozen=True)
+class GradientValue:
+    """Maximum of a gradient field and where it occurs"""
+    __slots__ = ("max_value", "location", "units")
+    max_value: float
+    location: Tuple[float, float, float]
+    units: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"max_value": self.max_value, "location": list(self.location), "units": self.units}
+
+@dataclass(frozen=True)
+class SafetyFactor:
+    """Minimum safety factor against yield"""
+    __slots__ = ("min_value", "location", "yield_strength")
+    min_value: float
+    location: Tuple[float, float, float]
+    yield_strength: float  # MPa
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "min_value": self.min_value,
+            "location": list(self.location),
+            "yield_strength": self.yield_strength
+        }
+
+@dataclass(frozen=True)
+class StressAnalysisResult:
+    """Static stress analysis results"""
+    __slots__ = ("max_stress", "min_stress", "max_displacement", "safety_factor")
+    max_stress: MetricValue
+    min_stress: MetricValue
+    max_displacement: MetricValue
+    safety_factor: SafetyFactor
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_stress": self.max_stress.to_dict(),
+            "min_stress": self.min_stress.to_dict(),
+            "max_displacement": self.max_displacement.to_dict(),
+            "safety_factor": self.safety_factor.to_dict()
+        }
+
+@dataclass(frozen=True)
+class ThermalAnalysisResult:
+    """Steady state thermal analysis results"""
+    __slots__ = ("max_temperature", "min_temperature", "max_heat_flux",
+                 "average_temperature", "temperature_gradient")
+    max_temperature: MetricValue
+    min_temperature: MetricValue
+    max_heat_flux: MetricValue
+    average_temperature: float
+    temperature_gradient: GradientValue
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_temperature": self.max_temperature.to_dict(),
+            "min_temperature": self.min_temperature.to_dict(),
+            "max_heat_flux": self.max_heat_flux.to_dict(),
+            "average_temperature": self.average_temperature,
+            "temperature_gradient": self.temperature_gradient.to_dict()
+        }
+
+# Simulated results; immutable, so built once and converted per call
+_SIMULATED_STRESS_RESULT = StressAnalysisResult(
+    max_stress=MetricValue(145.8, (12.5, 8.3, 15.7), "MPa"),
+    min_stress=MetricValue(0.5, (0.0, 0.0, 0.0), "MPa"),
+    max_displacement=MetricValue(0.025, (25.0, 0.0, 20.0), "mm"),
+    safety_factor=SafetyFactor(2.74, (12.5, 8.3, 15.7), 400.0)
+)
+
+_SIMULATED_THERMAL_RESULT = ThermalAnalysisResult(
+    max_temperature=MetricValue(125.8, (15.0, 10.0, 8.0), "°C"),
+    min_temperature=MetricValue(25.0, (0.0, 0.0, 0.0), "°C"),
+    max_heat_flux=MetricValue(2500.0, (12.0, 8.0, 5.0), "W/m²"),
+    average_temperature=67.3,
+    temperature_gradient=GradientValue(45.2, (14.0, 9.0, 7.0), "°C/mm")
+)
+
+# Per-node solver output is kept column-wise in a structured array (float32
+# value and location), so each field extreme is one reduction over
+# contiguous memory
+if NUMPY_AVAILABLE:
+    NODE_FIELD_DTYPE = np.dtype([('value', 'f4'), ('loc', 'f4', (3,))])
+
+def _field_extremes(nodes, units: str) -> Tuple[MetricValue, MetricValue]:
+    """Maximum and minimum of a NODE_FIELD_DTYPE array"""
+    values = nodes['value']
+    hi = int(values.argmax())
+    lo = int(values.argmin())
+    locations = nodes['loc']
+    return (
+        MetricValue(float(values[hi]), tuple(locations[hi].tolist()), units),
+        MetricValue(float(values[lo]), tuple(locations[lo].tolist()), units)
+    )
+
+def _stress_result_from_fields(stress_nodes, displacement_nodes, yield_strength: float) -> StressAnalysisResult:
+    """Stress analysis result reduced from per-node stress and displacement fields"""
+    max_stress, min_stress = _field_extremes(stress_nodes, "MPa")
+    max_displacement, _ = _field_extremes(displacement_nodes, "mm")
+    safety_factor = yield_strength / max_stress.value if max_stress.value > 0 else float("inf")
+    return StressAnalysisResult(
+        max_stress=max_stress,
+        min_stress=min_stress,
+        max_displacement=max_displacement,
+        safety_factor=SafetyFactor(round(safety_factor, 2), max_stress.location, yield_strength)
+    )
+
+# Per-node field values travel as base64 float16 (a quarter of float64 on
+# the wire, about three significant digits); scalar results stay float64
+_FLOAT16_MAX = 65504.0
+
+def _quantize_field(values) -> Dict[str, Any]:
+    """Half-precision transport encoding of a per-node field
+
+    Fields whose magnitude exceeds float16 range are divided by a power-of-two
+    scale first; decode with np.frombuffer(data, '<f2').astype(float) * scale.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    max_abs = float(np.abs(values).max()) if values.size else 0.0
+    scale = 1.0
+    if max_abs > _FLOAT16_MAX:
+        scale = 2.0 ** math.ceil(math.log2(max_abs / _FLOAT16_MAX))
+    half = (values / scale).astype('<f2')
+    return {
+        "data": base64.b64encode(half.tobytes()).decode('ascii'),
+        "count": int(values.size),
+        "quantization": {
+            "dtype": "float16",
+            "byte_order": "little",
+            "encoding": "base64",
+            "scale": scale,
+            "max_abs_error": float(np.abs(half.astype(np.float64) * scale - values).max()) if values.size else 0.0
+        }
+    }
+
+# From this many bodies on, section profiles come from the compiled kernel,
+# which is compiled on the first such analysis (or loaded from numba's
+# on-disk cache) rather than when the module is imported
+_NUMBA_MIN_BODIES = 1024
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _section_profiles_numba(plane_point, count):
+        """Section profile rows for count bodies, one body per parallel iteration
+
+        Columns: area, perimeter, centroid x/y/z, Ixx, Iyy, Ixy.
+        """
+        profiles = np.empty((count, 8))
+        for i in prange(count):
+            profiles[i, 0] = 85.5 + i * 10.0
+            profiles[i, 1] = 45.2 + i * 5.0
+            profiles[i, 2] = plane_point[0] + i * 2.0
+            profiles[i, 3] = plane_point[1] + i * 1.5
+            profiles[i, 4] = plane_point[2]
+            profiles[i, 5] = 125.4 + i * 20.0
+            profiles[i, 6] = 98.7 + i * 15.0
+            profiles[i, 7] = 12.3 + i * 2.0
+        return profiles
+
+# From this many modes on, modal results are computed with numpy
+_NUMPY_MIN_MODES = 64
+
+_MODE_SHAPES = ("Bending", "Torsion", "Mixed")
+
+def _modal_columns(number_of_modes: int):
+    """Rounded frequency, period and modal mass of each mode"""
+    if NUMPY_AVAILABLE and number_of_modes >= _NUMPY_MIN_MODES:
+        i = np.arange(number_of_modes, dtype=np.float64)
+        frequency = 125.5 * (i + 1) * (1 + i * 0.3)
+        period = 1.0 / frequency
+        modal_mass = np.clip(0.85 - i * 0.05, 0.0, None)
+        return (frequency.round(2).tolist(), period.round(6).tolist(),
+                modal_mass.round(3).tolist())
+    frequencies = [125.5 * (i + 1) * (1 + i * 0.3) for i in range(number_of_modes)]
+    return ([round(f, 2) for f in frequencies],
+            [round(1.0 / f, 6) for f in frequencies],
+            [round(max(0.85 - i * 0.05, 0.0), 3) for i in range(number_of_modes)])
+
+def _section_profile(body_id: str, row) -> Dict[str, Any]:
+    """Section profile dict from one kernel row"""
+    area, perimeter, cx, cy, cz, ixx, iyy, ixy = row
+    return {
+        "body_id": body_id,
+        "profile_area": area,
+        "perimeter": perimeter,
+        "centroid": [cx, cy, cz],
+        "second_moments": {
+            "Ixx": ixx,
+            "Iyy": iyy,
+            "Ixy": ixy
+        }
+    }
 
 async def create_section_analysis(
     cutting_plane_point: List[float],
@@ -63,24 +272,30 @@ async def create_section_analysis(
         # Actual section analysis logic needs to be implemented here
         
         # Simulate section analysis results
-        section_profiles = []
-        for i, body_id in enumerate(body_ids):
-            profile = {
-                "body_id": body_id,
-                "profile_area": 85.5 + i * 10,
-                "perimeter": 45.2 + i * 5,
-                "centroid": [
-                    cutting_plane_point[0] + i * 2,
-                    cutting_plane_point[1] + i * 1.5,
-                    cutting_plane_point[2]
-                ],
-                "second_moments": {
-                    "Ixx": 125.4 + i * 20,
-                    "Iyy": 98.7 + i * 15,
-                    "Ixy": 12.3 + i * 2
+        if NUMBA_AVAILABLE and len(body_ids) >= _NUMBA_MIN_BODIES:
+            rows = _section_profiles_numba(
+                np.asarray(cutting_plane_point, dtype=np.float64), len(body_ids)
+            ).tolist()
+            section_profiles = [_section_profile(body_id, row) for body_id, row in zip(body_ids, rows)]
+        else:
+            section_profiles = []
+            for i, body_id in enumerate(body_ids):
+                profile = {
+                    "body_id": body_id,
+                    "profile_area": 85.5 + i * 10,
+                    "perimeter": 45.2 + i * 5,
+                    "centroid": [
+                        cutting_plane_point[0] + i * 2,
+                        cutting_plane_point[1] + i * 1.5,
+                        cutting_plane_point[2]
+                    ],
+                    "second_moments": {
+                        "Ixx": 125.4 + i * 20,
+                        "Iyy": 98.7 + i * 15,
+                        "Ixy": 12.3 + i * 2
+                    }
                 }
-            }
-            section_profiles.append(profile)
+                section_profiles.append(profile)
         
         result = {
             "success": True,
@@ -145,28 +360,7 @@ async def perform_stress_analysis(
         }
         
         # Simulate analysis results
-        analysis_results = {
-            "max_stress": {
-                "value": 145.8,
-                "location": [12.5, 8.3, 15.7],
-                "units": "MPa"
-            },
-            "min_stress": {
-                "value": 0.5,
-                "location": [0.0, 0.0, 0.0],
-                "units": "MPa"
-            },
-            "max_displacement": {
-                "value": 0.025,
-                "location": [25.0, 0.0, 20.0],
-                "units": "mm"
-            },
-            "safety_factor": {
-                "min_value": 2.74,
-                "location": [12.5, 8.3, 15.7],
-                "yield_strength": 400.0  # MPa
-            }
-        }
+        analysis_results = _SIMULATED_STRESS_RESULT.to_dict()
         
         # Simulate convergence info
         convergence_info = {
@@ -230,19 +424,17 @@ async def perform_modal_analysis(
     
     try:
         # Simulate modal analysis results
-        modes = []
-        base_frequency = 125.5
-        
-        for i in range(number_of_modes):
-            frequency = base_frequency * (i + 1) * (1 + i * 0.3)
-            mode = {
+        frequencies, periods, modal_masses = _modal_columns(number_of_modes)
+        modes = [
+            {
                 "mode_number": i + 1,
-                "frequency": round(frequency, 2),
-                "period": round(1.0 / frequency, 6),
-                "modal_mass": round(0.85 - i * 0.05, 3),
-                "description": f"Mode {i+1}: {'Bending' if i % 3 == 0 else 'Torsion' if i % 3 == 1 else 'Mixed'}"
+                "frequency": frequencies[i],
+                "period": periods[i],
+                "modal_mass": modal_masses[i],
+                "description": f"Mode {i+1}: {_MODE_SHAPES[i % 3]}"
             }
-            modes.append(mode)
+            for i in range(number_of_modes)
+        ]
         
         result = {
             "success": True,
@@ -299,29 +491,7 @@ async def perform_thermal_analysis(
     
     try:
         # Simulate thermal analysis results
-        thermal_results = {
-            "max_temperature": {
-                "value": 125.8,
-                "location": [15.0, 10.0, 8.0],
-                "units": "°C"
-            },
-            "min_temperature": {
-                "value": 25.0,
-                "location": [0.0, 0.0, 0.0],
-                "units": "°C"
-            },
-            "max_heat_flux": {
-                "value": 2500.0,
-                "location": [12.0, 8.0, 5.0],
-                "units": "W/m²"
-            },
-            "average_temperature": 67.3,
-            "temperature_gradient": {
-                "max_value": 45.2,
-                "location": [14.0, 9.0, 7.0],
-                "units": "°C/mm"
-            }
-        }
+        thermal_results = _SIMULATED_THERMAL_RESULT.to_dict()
         
         # Simulate thermal stress (if needed)
         thermal_stress = {
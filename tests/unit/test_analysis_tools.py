@@ -365,7 +365,140 @@ class TestAnalysisToolsModular(unittest.TestCase):
         self.assertEqual(result.get("distance"), 5.0)  # sqrt(3^2 + 4^2)
         self.assertEqual(result.get("measurement_type"), "linear")
         self.assertEqual(result.get("units"), "mm")
-    
+
+    def test_measure_batch_functionality(self):
+        """Test measure_distance and measure_angle with lists of points"""
+        from tools.analysis import initialize_analysis_tools
+        from tools.analysis.history import flush_history
+        from tools.analysis.measurement import measure_distance, measure_angle
+
+        # Initialize module
+        initialize_analysis_tools(
+            self.mock_fusion_bridge,
+            self.mock_context_manager,
+            self.mock_mcp
+        )
+
+        async def run_batches():
+            distance_result = await measure_distance(
+                point1=[[0, 0, 0], [1, 1, 1]],
+                point2=[[3, 4, 0], [1, 1, 4]]
+            )
+            # A single vertex is shared by every angle
+            angle_result = await measure_angle(
+                point1=[[1, 0, 0], [1, 0, 0]],
+                vertex=[0, 0, 0],
+                point2=[[0, 1, 0], [0, 0, 0]]
+            )
+            await flush_history()
+            return distance_result, angle_result
+
+        distance_result, angle_result = asyncio.run(run_batches())
+
+        # Test batched measure_distance
+        self.assertTrue(distance_result.get("success"))
+        self.assertEqual(distance_result.get("distances"), [5.0, 3.0])
+        self.assertEqual(distance_result.get("count"), 2)
+
+        # Test batched measure_angle; the second angle has a zero-length arm
+        self.assertIn("error", angle_result)
+        self.assertIn("angle 1", angle_result["error"])
+
+        # One history entry per batch, not per point, written by the queue consumer
+        written = [
+            entry
+            for call in self.mock_context_manager.add_history_entries.call_args_list
+            for entry in call.args[0]
+        ]
+        self.assertEqual([entry["action_type"] for entry in written],
+                         ["measure_distance", "measure_angle"])
+
+    def test_register_all_tools_once(self):
+        """Test repeat registration on the same MCP instance is skipped"""
+        from tools.analysis import register_all_tools
+
+        register_all_tools(self.mock_mcp)
+        registered = self.mock_mcp.tool.call_count
+        register_all_tools(self.mock_mcp)
+
+        self.assertGreater(registered, 0)
+        self.assertEqual(self.mock_mcp.tool.call_count, registered)
+
+    def test_stress_result_from_fields(self):
+        """Test reducing per-node stress fields to a stress analysis result"""
+        from tools.analysis import simulation
+
+        if not simulation.NUMPY_AVAILABLE:
+            self.skipTest("numpy not available")
+
+        import numpy as np
+
+        stress = np.zeros(3, dtype=simulation.NODE_FIELD_DTYPE)
+        stress['value'] = [10.0, 200.0, 0.5]
+        stress['loc'] = [[0, 0, 0], [1, 2, 3], [4, 5, 6]]
+        displacement = np.zeros(2, dtype=simulation.NODE_FIELD_DTYPE)
+        displacement['value'] = [0.25, 0.125]
+        displacement['loc'] = [[7, 8, 9], [0, 0, 0]]
+
+        result = simulation._stress_result_from_fields(stress, displacement, 400.0).to_dict()
+
+        self.assertEqual(result["max_stress"], {"value": 200.0, "location": [1.0, 2.0, 3.0], "units": "MPa"})
+        self.assertEqual(result["min_stress"]["value"], 0.5)
+        self.assertEqual(result["max_displacement"]["location"], [7.0, 8.0, 9.0])
+        self.assertEqual(result["safety_factor"]["min_value"], 2.0)
+
+    def test_quantize_field(self):
+        """Test half-precision field encoding round trip"""
+        import base64
+        from tools.analysis import simulation
+
+        if not simulation.NUMPY_AVAILABLE:
+            self.skipTest("numpy not available")
+
+        import numpy as np
+
+        for values in ([25.0, 67.3, 125.8], [1.5e5, -2.0e5, 10.0]):
+            field = simulation._quantize_field(values)
+            quantization = field["quantization"]
+            decoded = np.frombuffer(base64.b64decode(field["data"]), "<f2").astype(float) * quantization["scale"]
+
+            self.assertEqual(field["count"], len(values))
+            self.assertEqual(quantization["dtype"], "float16")
+            np.testing.assert_allclose(decoded, values, rtol=1e-3)
+            self.assertLessEqual(np.abs(decoded - values).max(), quantization["max_abs_error"])
+
+    def test_generate_analysis_report_cache(self):
+        """Test generate_analysis_report reuses the on-disk report cache"""
+        import tempfile
+        from tools.analysis import reporting
+
+        analysis_results = [{"analysis_type": "static_stress", "success": True}]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(reporting, "REPORT_CACHE_DIR", Path(cache_dir)):
+                first = asyncio.run(reporting.generate_analysis_report(analysis_results))
+                second = asyncio.run(reporting.generate_analysis_report(analysis_results))
+
+                self.assertTrue(first.get("success"))
+                self.assertEqual(first, second)
+                self.assertEqual(len(list(Path(cache_dir).glob("*.json"))), 1)
+
+    def test_report_cache_purge_interval(self):
+        """Test the report cache is purged on the first store and then every interval stores"""
+        import tempfile
+        from tools.analysis import reporting
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.multiple(reporting, REPORT_CACHE_DIR=Path(cache_dir), REPORT_CACHE_MAX_ENTRIES=2,
+                                _REPORT_CACHE_PURGE_INTERVAL=3, _stores_since_purge=3):
+                # The first store purges; the next two only write
+                for i in range(3):
+                    reporting._store_cached_report(f"key{i}", {"report": i})
+                self.assertEqual(len(list(Path(cache_dir).glob("*.json"))), 3)
+                # The third store after a purge purges again
+                reporting._store_cached_report("key3", {"report": 3})
+                self.assertEqual(len(list(Path(cache_dir).glob("*.json"))), 2)
+
     async def test_generate_analysis_report_functionality(self):
         """Test generate_analysis_report functionality"""
         from tools.analysis import initialize_analysis_tools
@@ -137,6 +137,37 @@ class TestHistoryTracking(TestContextPersistence):
         history = manager.get_design_history(limit=5)
         self.assertEqual(len(history), 1)
         self.assertEqual(history[0]["action_type"], "create_sketch")
+    
+    def test_add_history_entries_in_bulk(self):
+        """Test adding several history records with one save"""
+        from context import ContextPersistenceManager
+        
+        manager = ContextPersistenceManager(self.temp_file_path)
+        
+        entries = manager.add_history_entries([
+            {
+                "action_type": "draw_line",
+                "action_description": "Execute tool: draw_line",
+                "parameters": {"start_x": 0, "end_x": 10},
+                "result": {"success": True}
+            },
+            {
+                "action_type": "draw_circle",
+                "action_description": "Execute tool: draw_circle",
+                "parameters": {"radius": 5},
+                "result": {"success": True},
+                "user_context": "MCP tool call"
+            }
+        ])
+        
+        self.assertEqual([entry.action_type for entry in entries], ["draw_line", "draw_circle"])
+        self.assertEqual(entries[1].user_context, "MCP tool call")
+        
+        # Both records are persisted
+        reloaded = ContextPersistenceManager(self.temp_file_path)
+        history = reloaded.get_design_history(action_type="draw_circle")
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]["parameters"]["radius"], 5)
 
 class TestComponentAndAssemblyManagement(TestContextPersistence):
     """Component and assembly management tests"""
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Fusion360 Add-in Unit Tests
+
+Test the add-in's request handling outside Fusion 360:
+- Request frame decoding (with and without msgspec)
+- Serialised request processing across client connections
+- Batch measurement parameter checks
+- Geometry cache invalidation from Fusion events
+- Read-only command list copies
+"""
+
+import ast
+import importlib.util
+import json
+import socket
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+SRC_PATH = Path(__file__).parent.parent.parent / "src"
+ADDIN_PATH = SRC_PATH / "fusion360" / "addin.py"
+
+
+def _import_addin():
+    """Load the add-in script, as Fusion 360 does, with its API mocked out"""
+    adsk = MagicMock()
+    modules = {
+        "adsk": adsk,
+        "adsk.core": adsk.core,
+        "adsk.fusion": adsk.fusion,
+        "adsk.cam": adsk.cam,
+    }
+    spec = importlib.util.spec_from_file_location("fusion360_addin", ADDIN_PATH)
+    addin = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, modules):
+        spec.loader.exec_module(addin)
+    return addin
+
+
+def _read_frame(addin, sock):
+    """Read one JSON response frame from sock"""
+    header = addin._recv_exact(sock, addin._FRAME_HEADER.size)
+    length, _ = addin._FRAME_HEADER.unpack(header)
+    return json.loads(bytes(addin._recv_exact(sock, length)))
+
+
+class TestRequestDecoding(unittest.TestCase):
+    """Request frame decoding test class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addin = _import_addin()
+
+    def decode(self, request):
+        return self.addin._decode_request(json.dumps(request).encode("utf-8"))
+
+    def test_params_request(self):
+        """Test a request with params round-trips"""
+        request = self.decode({"id": 7, "command": "get_design_info", "params": {"depth": 2}})
+
+        self.assertEqual(request["id"], 7)
+        self.assertEqual(request["command"], "get_design_info")
+        self.assertEqual(request["params"], {"depth": 2})
+
+    def test_empty_params_request(self):
+        """Test a request with empty or missing params"""
+        self.assertEqual(self.decode({"command": "ping", "params": {}})["params"], {})
+        self.assertEqual(self.decode({"command": "ping"}).get("params", {}), {})
+
+    def test_typed_params_request(self):
+        """Test params of a typed command are readable through get()"""
+        request = self.decode({"command": "measure_distance", "params": {"point1": [1, 2, 3]}})
+
+        self.assertEqual(list(request["params"].get("point1")), [1, 2, 3])
+        if self.addin.MSGSPEC_AVAILABLE:
+            # Missing fields take the struct defaults
+            self.assertEqual(list(request["params"].get("point2")), [0, 0, 0])
+
+    def test_batch_request(self):
+        """Test a batch request round-trips"""
+        batch = [
+            {"cmd_id": "a", "cmd": "ping", "params": {}},
+            {"command": "get_features", "params": {"limit": 5}}
+        ]
+        request = self.decode({"id": 3, "batch": batch})
+
+        self.assertEqual(request["id"], 3)
+        self.assertEqual(request["batch"], batch)
+
+    def test_cmd_alias(self):
+        """Test the top-level cmd alias is kept"""
+        request = self.decode({"cmd": "ping", "params": {}})
+
+        self.assertEqual(request.get("command") or request.get("cmd"), "ping")
+
+    def test_malformed_request(self):
+        """Test malformed frames raise a request decode error"""
+        with self.assertRaises(self.addin._REQUEST_DECODE_ERRORS):
+            self.addin._decode_request(b'{"command": "ping", "params": ')
+
+    def test_invalid_params_keep_connection(self):
+        """Test a frame failing typed validation is answered with its id and the connection stays open"""
+        if not self.addin.MSGSPEC_AVAILABLE:
+            self.skipTest("msgspec not installed")
+        server = self.addin.MCPCommunicationServer()
+        server._process_request = lambda request: {"success": True}
+        client, served = socket.socketpair()
+        thread = threading.Thread(target=server._handle_client, args=(served, None))
+        thread.start()
+
+        self.addin._send_frame(client, {"id": 5, "command": "measure_distance", "params": {"point1": "abc"}})
+        error = _read_frame(self.addin, client)
+        self.addin._send_frame(client, {"id": 6, "command": "ping", "params": {}})
+        response = _read_frame(self.addin, client)
+        client.close()
+        thread.join(timeout=5)
+
+        self.assertIn("error", error)
+        self.assertEqual(error["id"], 5)
+        self.assertEqual(response, {"success": True, "id": 6})
+
+
+class TestRequestSerialisation(unittest.TestCase):
+    """Request serialisation test class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addin = _import_addin()
+
+    def test_clients_do_not_overlap(self):
+        """Test requests from separate connections never run concurrently"""
+        server = self.addin.MCPCommunicationServer()
+        active = []
+        overlaps = []
+
+        def process_request(request):
+            active.append(request)
+            if len(active) > 1:
+                overlaps.append(request)
+            time.sleep(0.02)
+            active.remove(request)
+            return {"success": True}
+
+        server._process_request = process_request
+
+        clients = []
+        threads = []
+        for _ in range(4):
+            client, served = socket.socketpair()
+            clients.append(client)
+            thread = threading.Thread(target=server._handle_client, args=(served, None))
+            thread.start()
+            threads.append(thread)
+        for client in clients:
+            self.addin._send_frame(client, {"command": "ping", "params": {}})
+        for client in clients:
+            self.assertEqual(_read_frame(self.addin, client), {"success": True})
+            client.close()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(overlaps, [])
+
+
+class TestBatchMeasurementParams(unittest.TestCase):
+    """Batch measurement parameter test class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addin = _import_addin()
+        cls.server = cls.addin.MCPCommunicationServer()
+
+    def test_distance_batch_with_flat_point(self):
+        """Test a batch point1 with a single point2 gets the validation error"""
+        result = self.server._measure_distance({
+            "point1": [[0, 0, 0], [1, 1, 1], [2, 2, 2]],
+            "point2": [1, 2, 3]
+        })
+
+        self.assertIn("equal-length lists", result["error"])
+
+    def test_angle_batch_with_malformed_vertex(self):
+        """Test a batch angle with a malformed shared vertex gets the validation error"""
+        result = self.server._measure_angle({
+            "point1": [[1, 0, 0], [0, 1, 0]],
+            "vertex": 5,
+            "point2": [[0, 1, 0], [1, 0, 0]]
+        })
+
+        self.assertIn("equal-length lists", result["error"])
+
+    def test_distance_batch(self):
+        """Test a well-formed batch is measured"""
+        result = self.server._measure_distance({
+            "point1": [[0, 0, 0], [1, 1, 1]],
+            "point2": [[3, 4, 0], [1, 1, 2]]
+        })
+
+        self.assertEqual(result["distances"], [5.0, 1.0])
+
+
+class TestGeometryCache(unittest.TestCase):
+    """Geometry cache test class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.addin = _import_addin()
+
+    def test_volume_cached(self):
+        """Test a body's volume is read from Fusion once"""
+        server = self.addin.MCPCommunicationServer()
+        body = MagicMock(entityToken="body-1", volume=12.5)
+
+        self.assertEqual(server._body_volume(body), 12.5)
+        body.volume = 99.0
+        self.assertEqual(server._body_volume(body), 12.5)
+
+    def test_invalidation_during_read_is_not_overwritten(self):
+        """Test a value computed across an invalidation is not cached"""
+        server = self.addin.MCPCommunicationServer()
+
+        class Body:
+            entityToken = "body-1"
+
+            @property
+            def volume(self):
+                # A Fusion event handler invalidates while Fusion computes
+                server.invalidate_geometry_cache()
+                return 12.5
+
+        self.assertEqual(server._body_volume(Body()), 12.5)
+        self.assertNotIn("body-1", server._volume_cache)
+
+
+def _frozenset_constant(path, name):
+    """Value of a module-level NAME = frozenset({...}) literal, read without importing the module"""
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == name for target in node.targets
+        ):
+            return frozenset(ast.literal_eval(node.value.args[0]))
+    raise AssertionError(f"{name} not found in {path}")
+
+
+class TestReadOnlyCommands(unittest.TestCase):
+    """Read-only command list test class"""
+
+    def test_copies_match(self):
+        """Test the add-in's and server's copies equal fusion360.READ_ONLY_COMMANDS"""
+        commands = _frozenset_constant(SRC_PATH / "fusion360" / "__init__.py", "READ_ONLY_COMMANDS")
+
+        self.assertIn("ping", commands)
+        self.assertEqual(_frozenset_constant(ADDIN_PATH, "_READ_ONLY_COMMANDS"), commands)
+        self.assertEqual(_frozenset_constant(SRC_PATH / "mcp_server.py", "_READ_ONLY_COMMANDS"), commands)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)